@@ -0,0 +1,48 @@
+"""
+container_tool.core._collision_kernels
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Numerische Kernels für die Überlappungs‑Breitphase (`collision.BBoxArray`).
+
+Ist Numba installiert, wird `collide_indices` per ``@njit`` übersetzt und
+schon beim Import einmal mit Dummy‑Daten aufgerufen: Der Maschinencode liegt
+dank ``cache=True`` im ``__pycache__``; der erste Drag im GUI zahlt damit
+weder Übersetzung noch Cache‑Laden. Ohne Numba gilt die NumPy‑Variante.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover – Numba ist keine Pflichtabhängigkeit
+    njit = None
+
+
+def collide_indices_numpy(c: np.ndarray, arr: np.ndarray) -> np.ndarray:
+    """Indizes aller Zeilen von *arr*, die die Box *c* echt überlappen."""
+    mask = (arr[:, 2] > c[0]) & (arr[:, 0] < c[2]) & (arr[:, 3] > c[1]) & (arr[:, 1] < c[3])
+    return np.flatnonzero(mask)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def collide_indices(c: np.ndarray, arr: np.ndarray) -> np.ndarray:  # pragma: no cover
+        out = np.empty(arr.shape[0], np.int64)
+        k = 0
+        for i in range(arr.shape[0]):
+            if arr[i, 2] > c[0] and arr[i, 0] < c[2] and arr[i, 3] > c[1] and arr[i, 1] < c[3]:
+                out[k] = i
+                k += 1
+        return out[:k]
+
+    # Warm‑up: Signatur (float64[:], float64[:, :]) wie in BBoxArray.query
+    collide_indices(np.zeros(4), np.zeros((1, 4)))
+
+else:
+    collide_indices = collide_indices_numpy
+
+
+__all__ = ["collide_indices", "collide_indices_numpy"]
@@ -12,6 +12,14 @@ Public API
 - `check_collisions(candidate, placed, container)`
 - `is_within_container(obj, container)`
 - `overlaps(a_bbox, b_bbox)`
+- `make_collider(placed, container)` – auf feste Objekte spezialisierte
+  Prüf‑Funktion für wiederholte Aufrufe mit wechselndem Kandidaten.
+- `register(placed, cached=None)` – SoA‑Bounding‑Box‑Array für wiederholte
+  Prüfungen gegen dieselbe Objektliste (z. B. während eines Drags).
+- `SpatialGrid` – inkrementell gepflegtes Uniform‑Grid; der Aufrufer hält
+  eine Instanz und meldet Änderungen per `add`/`remove`/`move`.
+- `SweepAndPrune` – nach ``x_min`` sortierter Index entlang der Container‑
+  Länge (gleiche Schnittstelle wie `SpatialGrid`).
 
 Konstanten
 ----------
@@ -21,9 +29,31 @@ Konstanten
 
 from __future__ import annotations
 
+import functools
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .models import Box, Container, Stack
+
+# Überlappungs‑Kernel (Numba‑JIT, falls installiert; sonst NumPy)
+from ._collision_kernels import collide_indices as _collide_indices
 
 # Typ‑Aliase ---------------------------------------------------------------
 BBox = Tuple[float, float, float, float]  # (x_min, y_min, x_max, y_max)
@@ -33,6 +63,7 @@ DOOR_HEIGHT_COLLISION: str = "_door_height_"
 
 # Cell‑Größe für Spatial Grid (mm). Kann ggf. projektweit konfiguriert werden.
 _CELL_SIZE: float = 1_000.0
+_CELL_INV: float = 1.0 / _CELL_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -45,16 +76,10 @@ def overlaps(a: BBox, b: BBox) -> bool:
     Prüft, ob sich zwei Axis‑Aligned‑Bounding‑Boxes *überlappen*.
 
     Kante‑an‑Kante (dist == 0) gilt **nicht** als Überlappung.
+    Alle vier Vergleiche werden ohne Short‑Circuit verknüpft (``&``); der
+    Ausdruck funktioniert damit unverändert auch für NumPy‑Spalten.
     """
-    ax0, ay0, ax1, ay1 = a
-    bx0, by0, bx1, by1 = b
-
-    # Keine Überlappung, wenn eine Box vollständig links/rechts/oben/unten liegt
-    if ax1 <= bx0 or bx1 <= ax0:  # X‑Achse (Kante an Kante erlaubt)
-        return False
-    if ay1 <= by0 or by1 <= ay0:  # Y‑Achse
-        return False
-    return True
+    return (a[2] > b[0]) & (b[2] > a[0]) & (a[3] > b[1]) & (b[3] > a[1])
 
 
 def is_within_container(obj: Union["Box", "Stack"], container: "Container") -> bool:
@@ -67,29 +92,259 @@ def is_within_container(obj: Union["Box", "Stack"], container: "Container") -> b
         - inner_width  oder width
     """
     x0, y0, x1, y1 = _get_bbox(obj)
-
-    length = (getattr(container, "inner_length", None) or getattr(container, "length", None) or getattr(container, "inner_length_mm", None))
-    width = (getattr(container, "inner_width", None) or getattr(container, "width", None) or getattr(container, "inner_width_mm", None))
-
-    if length is None or width is None:
-        raise ValueError("Container muss 'inner_length/length' und 'inner_width/width' besitzen.")
+    length, width = _container_extent(container)
 
     inside = 0.0 <= x0 and x1 <= length and 0.0 <= y0 and y1 <= width
     logger.debug("is_within_container: %s (len=%s, wid=%s) -> %s", obj, length, width, inside)
     return inside
 
 
+# -------------------------------------------------------------------------- #
+# SoA‑Bounding‑Boxes                                                         #
+# -------------------------------------------------------------------------- #
+@dataclass(slots=True)
+class BBoxArray:
+    """
+    Bounding‑Boxes mehrerer Objekte als *Structure of Arrays*.
+
+    ``arr`` hat die Form ``(N, 4)`` (x_min, y_min, x_max, y_max, float64),
+    ``objs`` ist die dazu parallele Objektliste. ``source`` hält die Liste,
+    aus der das Array erzeugt wurde, ``bboxes`` die dabei gelesenen
+    bbox‑Tupel (siehe `register`).
+    """
+
+    arr: np.ndarray
+    objs: List[Union["Box", "Stack"]]
+    source: Optional[Sequence[Union["Box", "Stack"]]] = None
+    bboxes: Tuple[BBox, ...] = ()
+
+    @classmethod
+    def build(cls, objs: Sequence[Union["Box", "Stack"]]) -> "BBoxArray":
+        items = list(objs)
+        bboxes = tuple(_get_bbox(o) for o in items)
+        arr = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+        return cls(arr=arr, objs=items, source=objs, bboxes=bboxes)
+
+    def is_current(self, placed: Sequence[Union["Box", "Stack"]]) -> bool:
+        """
+        True, wenn das Array noch genau *placed* beschreibt.
+
+        Verglichen wird per Identität: dieselbe Liste, dieselben Objekte an
+        denselben Stellen und unveränderte bbox‑Tupel. `Box` verwirft ihren
+        bbox‑Cache bei jeder Geometrie‑Änderung, ein verschobenes oder
+        gedrehtes Objekt liefert also ein neues Tupel. Objekte ohne diesen
+        Cache erzeugen bei jedem Aufruf ein neues Tupel und gelten damit
+        nie als aktuell.
+        """
+        if self.source is not placed or len(placed) != len(self.objs):
+            return False
+        return all(
+            o is known and _get_bbox(o) is bb
+            for o, known, bb in zip(placed, self.objs, self.bboxes)
+        )
+
+    def __len__(self) -> int:
+        return len(self.objs)
+
+    def query(self, bbox: BBox) -> List[Union["Box", "Stack"]]:
+        """Alle Objekte, deren Bounding‑Box *bbox* echt überlappt."""
+        c = np.asarray(bbox, dtype=np.float64)
+        objs = self.objs
+        return [objs[i] for i in _collide_indices(c, self.arr).tolist()]
+
+
+def register(
+    placed: Sequence[Union["Box", "Stack"]],
+    cached: Optional[BBoxArray] = None,
+) -> BBoxArray:
+    """
+    Liefert ein `BBoxArray` für *placed*.
+
+    Beschreibt *cached* noch genau diese Liste (siehe `BBoxArray.is_current`),
+    wird es unverändert zurückgegeben, sonst neu aufgebaut. Das Modul selbst
+    hält keinen Zustand – der Aufrufer (z. B. das GUI während eines Drags)
+    besitzt das Array.
+    """
+    if cached is not None and cached.is_current(placed):
+        return cached
+    return BBoxArray.build(placed)
+
+
+# -------------------------------------------------------------------------- #
+# Inkrementelles Spatial Grid                                               #
+# -------------------------------------------------------------------------- #
+class SpatialGrid:
+    """
+    Uniform‑Grid, das beim Verschieben einzelner Objekte nicht neu aufgebaut
+    werden muss.
+
+    Objekte werden über ihre Identität (``id``) verwaltet. `Box` hasht zwar
+    ebenfalls per Identität, `Stack` vergleicht als dataclass aber per Wert
+    und ist nicht hashbar – ``id`` deckt beide Typen einheitlich ab.
+    Eine Instanz ist **nicht** thread‑sicher; sie gehört dem Aufrufer.
+    """
+
+    __slots__ = ("_grid", "_obj_cells", "_objs")
+
+    def __init__(self, objs: Iterable[Union["Box", "Stack"]] = ()) -> None:
+        self._grid: DefaultDict[int, Dict[int, Union["Box", "Stack"]]] = defaultdict(dict)
+        self._obj_cells: Dict[int, Sequence[int]] = {}
+        self._objs: Dict[int, Union["Box", "Stack"]] = {}
+        for obj in objs:
+            self.add(obj)
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+    def __contains__(self, obj: object) -> bool:
+        return id(obj) in self._objs
+
+    def __iter__(self) -> Iterator[Union["Box", "Stack"]]:
+        return iter(list(self._objs.values()))
+
+    def add(self, obj: Union["Box", "Stack"]) -> None:
+        """Registriert *obj* an seiner aktuellen Position."""
+        oid = id(obj)
+        if oid in self._objs:
+            self.remove(obj)
+        cells = _cells_for_bbox(_get_bbox(obj))
+        grid = self._grid
+        for cell in cells:
+            grid[cell][oid] = obj
+        self._obj_cells[oid] = cells
+        self._objs[oid] = obj
+
+    def remove(self, obj: Union["Box", "Stack"]) -> None:
+        """Entfernt *obj*; unbekannte Objekte werden ignoriert."""
+        oid = id(obj)
+        for cell in self._obj_cells.pop(oid, ()):
+            bucket = self._grid.get(cell)
+            if bucket is not None:
+                bucket.pop(oid, None)
+                if not bucket:
+                    del self._grid[cell]
+        self._objs.pop(oid, None)
+
+    def move(self, obj: Union["Box", "Stack"]) -> None:
+        """Aktualisiert die Zellen von *obj* nach einer Positionsänderung."""
+        self.remove(obj)
+        self.add(obj)
+
+    def query(self, bbox: BBox) -> List[Union["Box", "Stack"]]:
+        """Alle registrierten Objekte, deren Bounding‑Box *bbox* echt überlappt."""
+        hits: List[Union["Box", "Stack"]] = []
+        # Objekte über mehreren Zellen nur einmal testen – auch die,
+        # die *nicht* überlappen (sonst je Zelle ein erneuter overlaps‑Aufruf).
+        seen: Set[int] = set()
+        grid = self._grid
+        for cell in _cells_for_bbox(bbox):
+            bucket = grid.get(cell)  # .get() legt – anders als [] – keine leere Zelle an
+            if bucket is None:
+                continue
+            for oid, other in bucket.items():
+                if oid in seen:
+                    continue
+                seen.add(oid)
+                if overlaps(bbox, _get_bbox(other)):
+                    hits.append(other)
+        return hits
+
+
+# -------------------------------------------------------------------------- #
+# Sweep‑and‑Prune (Längsachse)                                               #
+# -------------------------------------------------------------------------- #
+class SweepAndPrune:
+    """
+    Sweep‑and‑Prune‑Index entlang der X‑Achse (Containerlänge).
+
+    Container sind deutlich länger als breit; ein Uniform‑Grid verschwendet
+    daher Zellen quer zur Länge. Hier werden die Objekte nach ``x_min``
+    sortiert gehalten. Eine Anfrage sucht per Bisektion das letzte Objekt,
+    das links vom Anfrage‑Ende beginnt, und läuft rückwärts, bis kein Objekt
+    mehr hineinreichen kann (``x_min + max. Länge <= x0``).
+
+    Einfügen erfolgt per Insertion an der sortierten Stelle. Zwischen zwei
+    Drag‑Events ändert sich die Reihenfolge kaum, daher bleibt `move` günstig.
+    Eine Instanz ist **nicht** thread‑sicher; sie gehört dem Aufrufer.
+    """
+
+    __slots__ = ("_x_mins", "_bboxes", "_objs", "_max_extent")
+
+    def __init__(self, objs: Iterable[Union["Box", "Stack"]] = ()) -> None:
+        entries = sorted(((_get_bbox(o), o) for o in objs), key=lambda e: e[0][0])
+        self._x_mins: List[float] = [bb[0] for bb, _ in entries]
+        self._bboxes: List[BBox] = [bb for bb, _ in entries]
+        self._objs: List[Union["Box", "Stack"]] = [o for _, o in entries]
+        self._max_extent: float = max((bb[2] - bb[0] for bb in self._bboxes), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+    def __contains__(self, obj: object) -> bool:
+        return any(o is obj for o in self._objs)
+
+    def __iter__(self) -> Iterator[Union["Box", "Stack"]]:
+        return iter(list(self._objs))
+
+    def add(self, obj: Union["Box", "Stack"]) -> None:
+        """Fügt *obj* an der nach ``x_min`` sortierten Stelle ein."""
+        bbox = _get_bbox(obj)
+        idx = bisect_right(self._x_mins, bbox[0])
+        self._x_mins.insert(idx, bbox[0])
+        self._bboxes.insert(idx, bbox)
+        self._objs.insert(idx, obj)
+        self._max_extent = max(self._max_extent, bbox[2] - bbox[0])
+
+    def remove(self, obj: Union["Box", "Stack"]) -> None:
+        """Entfernt *obj* (Identitätsvergleich); unbekannte Objekte werden ignoriert."""
+        for idx, other in enumerate(self._objs):
+            if other is obj:
+                del self._x_mins[idx], self._bboxes[idx], self._objs[idx]
+                return
+
+    def move(self, obj: Union["Box", "Stack"]) -> None:
+        """Sortiert *obj* nach einer Positionsänderung neu ein."""
+        self.remove(obj)
+        self.add(obj)
+
+    def query(self, bbox: BBox) -> List[Union["Box", "Stack"]]:
+        """Alle Objekte, deren Bounding‑Box *bbox* echt überlappt (nach X sortiert)."""
+        cx0, cy0, cx1, cy1 = bbox
+        reach = self._max_extent
+        x_mins, bboxes, objs = self._x_mins, self._bboxes, self._objs
+        hits: List[Union["Box", "Stack"]] = []
+        idx = bisect_left(x_mins, cx1) - 1  # letztes Objekt mit x_min < cx1
+        while idx >= 0 and x_mins[idx] + reach > cx0:
+            ox0, oy0, ox1, oy1 = bboxes[idx]
+            if ox1 > cx0 and oy1 > cy0 and oy0 < cy1:
+                hits.append(objs[idx])
+            idx -= 1
+        hits.reverse()
+        return hits
+
+
 # -------------------------------------------------------------------------- #
 # Kernfunktion                                                               #
 # -------------------------------------------------------------------------- #
 def check_collisions(
     candidate: Union["Box", "Stack"],
-    placed: List[Union["Box", "Stack"]],
+    placed: Union[Sequence[Union["Box", "Stack"]], BBoxArray, SpatialGrid, SweepAndPrune],
     container: "Container",
+    *,
+    short_circuit: bool = False,
 ) -> Tuple[bool, List[Union["Box", "Stack", str]]]:
     """
     Prüft, ob *candidate* ohne Kollision in den Container gelegt werden kann.
 
+    *placed* ist entweder eine Objektliste (wird linear geprüft), ein vorab
+    per `register` erzeugtes `BBoxArray` oder ein vom Aufrufer gepflegter
+    Index (`SpatialGrid` / `SweepAndPrune`). Ein Index lohnt sich nur, wenn
+    er über mehrere Prüfungen hinweg wiederverwendet wird.
+
+    Mit ``short_circuit=True`` endet die Prüfung bereits nach einer
+    Grenz‑ oder Türhöhen‑Verletzung (Aufrufer braucht nur „ok ja/nein“);
+    Überlappungen werden dann nicht mehr gesammelt.
+
     Rückgabe
     --------
     ok : bool
@@ -111,17 +366,26 @@ def check_collisions(
         collisions.append(DOOR_HEIGHT_COLLISION)
 
     # Früher Abbruch, wenn schon Grenz‑/Türkollision
-    # (spart Grid‑Aufbau, aber nur wenn tatsächlich Kollision vorliegt)
-    # -> bewusst *kein* Return hier: GUI möchte evtl. ALLE Fehler sehen
+    # (spart Index‑Aufbau, aber nur wenn tatsächlich Kollision vorliegt)
+    # -> nur auf Wunsch: GUI möchte standardmäßig ALLE Fehler sehen
     # ----------------------------------------------------------------------
+    if short_circuit and collisions:
+        return False, collisions
 
     # 3) Überlappungen gegen vorhandene Objekte -----------------------------
-    spatial_index = _build_spatial_grid(placed)
     cand_bbox = _get_bbox(candidate)
 
-    for cell in _cells_for_bbox(cand_bbox):
-        for other in spatial_index.get(cell, ()):
-            # Eigene Bounding‑Box bereits im Grid; Duplikat‑Check über 'is'
+    if isinstance(placed, (BBoxArray, SpatialGrid, SweepAndPrune)):
+        # vom Aufrufer gepflegter Index
+        for other in placed.query(cand_bbox):
+            if other is candidate:
+                continue
+            logger.debug("Überlappung mit %s", other)
+            collisions.append(other)
+    else:
+        # Einmalige Prüfung gegen eine Liste: Brute Force ist für jede
+        # gemessene Größe schneller als ein temporär aufgebauter Index.
+        for other in placed:
             if other is candidate:
                 continue
             if overlaps(cand_bbox, _get_bbox(other)):
@@ -132,24 +396,94 @@ def check_collisions(
     return ok, collisions
 
 
+def make_collider(
+    placed: Sequence[Union["Box", "Stack"]],
+    container: "Container",
+) -> Callable[[Union["Box", "Stack"]], Tuple[bool, List[Union["Box", "Stack", str]]]]:
+    """
+    Spezialisiert `check_collisions` auf feste *placed*/*container*.
+
+    Index (`SweepAndPrune`) und Container‑Maße werden einmalig ermittelt; die
+    zurückgegebene Funktion prüft nur noch den (bewegten) Kandidaten und
+    liefert dieselben Kollisionen in derselben Reihenfolge wie
+    ``check_collisions(candidate, placed, container)``. Gedacht für
+    Drag‑Events: Bewegt sich eines der *placed*‑Objekte, muss ein neuer
+    Collider erzeugt werden.
+    """
+    index = SweepAndPrune(placed)
+    # Position in *placed*: Treffer des Index kommen nach x_min sortiert
+    order = {id(o): i for i, o in enumerate(placed)}
+    length, width = _container_extent(container)
+
+    def collide(candidate: Union["Box", "Stack"]) -> Tuple[bool, List[Union["Box", "Stack", str]]]:
+        collisions: List[Union["Box", "Stack", str]] = []
+        cand_bbox = _get_bbox(candidate)
+        x0, y0, x1, y1 = cand_bbox
+        if not (0.0 <= x0 and x1 <= length and 0.0 <= y0 and y1 <= width):
+            collisions.append(candidate)
+        if _is_stack(candidate) and _exceeds_door_height(candidate, container):
+            collisions.append(DOOR_HEIGHT_COLLISION)
+        hits = [other for other in index.query(cand_bbox) if other is not candidate]
+        if len(hits) > 1:
+            hits.sort(key=lambda o: order[id(o)])
+        collisions.extend(hits)
+        return len(collisions) == 0, collisions
+
+    return collide
+
+
 # -------------------------------------------------------------------------- #
 # Interne Helfer                                                             #
 # -------------------------------------------------------------------------- #
+_MODEL_TYPES: Tuple[type, ...] = (Box, Stack)
+
+
 def _get_bbox(obj: Union["Box", "Stack"]) -> BBox:
-    """Ermittelt die Bounding‑Box eines Objekts, bevorzugt über `bbox()`."""
-    if hasattr(obj, "bbox") and callable(obj.bbox):  # type: ignore[attr-defined]
-        return tuple(map(float, obj.bbox()))  # type: ignore[return-value]
+    """
+    Ermittelt die Bounding‑Box eines Objekts.
+
+    `Box`/`Stack` liefern sie direkt über `bbox()` (Cache im Modell, kein
+    ``hasattr``). Alle anderen Typen laufen über `_foreign_bbox`.
+    """
+    if type(obj) in _MODEL_TYPES:
+        return obj.bbox()
+    return _foreign_bbox(obj)
+
+
+@functools.singledispatch
+def _foreign_bbox(obj: object) -> BBox:
+    """
+    Bounding‑Box für Objekte außerhalb des Datenmodells.
+
+    Weitere Typen lassen sich per ``_foreign_bbox.register(Typ)`` ergänzen;
+    standardmäßig wird `bbox()` bzw. (x, y, length, width) genutzt.
+    """
+    bbox = getattr(obj, "bbox", None)
+    if callable(bbox):
+        return tuple(map(float, bbox()))  # type: ignore[return-value]
     # Fallback: Versuche generische Attribute
     try:
-        x = float(obj.x)
-        y = float(obj.y)
-        length = float(getattr(obj, "length", obj.length_mm))  # type: ignore[attr-defined]
-        width = float(getattr(obj, "width", obj.width_mm))    # type: ignore[attr-defined]
+        x = float(obj.x)  # type: ignore[attr-defined]
+        y = float(obj.y)  # type: ignore[attr-defined]
+        length = float(getattr(obj, "length", None) or obj.length_mm)  # type: ignore[attr-defined]
+        width = float(getattr(obj, "width", None) or obj.width_mm)  # type: ignore[attr-defined]
     except AttributeError as exc:
         raise ValueError(f"Objekt {obj!r} besitzt keine bbox() und keine (x,y,length,width)‑Attribute.") from exc
     return (x, y, x + length, y + width)
 
 
+def invalidate_bbox(obj: Union["Box", "Stack"]) -> None:
+    """
+    Verwirft eine zwischengespeicherte Bounding‑Box.
+
+    Box/Stack invalidieren bei Positions‑/Rotationsänderungen selbst; der
+    Helfer ist für Aufrufer gedacht, die Geometrie am Modell vorbei ändern.
+    """
+    for box in obj if _is_stack(obj) else (obj,):  # type: ignore[union-attr]
+        if hasattr(box, "_bbox_cache"):
+            object.__setattr__(box, "_bbox_cache", None)
+
+
 def _get_height(obj: "Stack") -> float:
     """Liefert die absolute Höhe eines Stacks (mm)."""
     return float(obj.total_height_mm())
@@ -160,49 +494,87 @@ def _is_stack(obj: Union["Box", "Stack"]) -> bool:  # duck‑typing‑Check
 
 
 def _exceeds_door_height(stack: "Stack", container: "Container") -> bool:
+    return _get_height(stack) > _door_height(container)
+
+
+# Attributnamen für Container außerhalb des Datenmodells (in Prüfreihenfolge)
+_LENGTH_ATTRS: Tuple[str, ...] = ("inner_length", "length", "inner_length_mm")
+_WIDTH_ATTRS: Tuple[str, ...] = ("inner_width", "width", "inner_width_mm")
+
+
+def _first_attr(obj: object, names: Tuple[str, ...]) -> Optional[float]:
+    """Erster gesetzter (truthy) Wert unter *names* – wie ``a or b or c`` über getattr."""
+    value = None
+    for name in names:
+        value = getattr(obj, name, None)
+        if value:
+            break
+    return value
+
+
+def _container_extent(container: "Container") -> Tuple[float, float]:
+    """(Länge, Breite) des Container‑Innenraums; ValueError, falls unbekannt."""
+    if type(container) is Container:  # vorberechnet, s. Container.bounds
+        return container.bounds
+    length = _first_attr(container, _LENGTH_ATTRS)
+    width = _first_attr(container, _WIDTH_ATTRS)
+
+    if length is None or width is None:
+        raise ValueError("Container muss 'inner_length/length' und 'inner_width/width' besitzen.")
+    return length, width
+
+
+def _door_height(container: "Container") -> float:
     door_height = getattr(container, "door_height", None) or getattr(
         container, "door_height_mm", None
     )
     if door_height is None:
         raise ValueError("Container muss 'door_height' bzw. 'door_height_mm' besitzen.")
-    return _get_height(stack) > float(door_height)
+    return float(door_height)
 
 
 # Spatial Grid -------------------------------------------------------------
-Grid = Dict[Tuple[int, int], List[Union["Box", "Stack"]]]
-
+def _cell_key(ix: int, iy: int) -> int:
+    """Packt eine Zellkoordinate in einen int (``ix`` oben, ``iy`` in 32 Bit unten)."""
+    return (ix << 32) | (iy & 0xFFFFFFFF)
 
-def _build_spatial_grid(objs: Iterable[Union["Box", "Stack"]]) -> Grid:
-    """Erstellt ein einfaches Spatial Hash Grid für schnelle Nachbarsuche."""
-    grid: Grid = {}
-    for obj in objs:
-        for cell in _cells_for_bbox(_get_bbox(obj)):
-            grid.setdefault(cell, []).append(obj)
-    logger.debug("Spatial‑Grid gebaut: %d Zellen", len(grid))
-    return grid
 
-
-def _cells_for_bbox(bbox: BBox) -> List[Tuple[int, int]]:
+def _cells_for_bbox(bbox: BBox) -> Sequence[int]:
     """
-    Liefert alle Zellkoordinaten, die eine Bounding‑Box schneidet.
-
-    Das Uniform‑Grid hat feste Rastergröße `_CELL_SIZE` in mm.
+    Liefert die (gepackten, siehe `_cell_key`) Zellen, die eine Bounding‑Box
+    schneidet.
+
+    Das Uniform‑Grid hat feste Rastergröße `_CELL_SIZE` in mm. ``int()``
+    rundet zwar Richtung null statt abzurunden, ist aber monoton – zwei
+    überlappende Boxen teilen damit weiterhin mindestens eine Zelle.
+    Der Regelfall (Box liegt in genau einer Zelle) kommt ohne Listenaufbau aus.
+    Int‑Keys hashen billiger als ``(ix, iy)``‑Tupel und belegen weniger Speicher.
     """
     x0, y0, x1, y1 = bbox
-    x_start = int(x0 // _CELL_SIZE)
-    y_start = int(y0 // _CELL_SIZE)
-    x_end = int((x1 - 1e-9) // _CELL_SIZE)
-    y_end = int((y1 - 1e-9) // _CELL_SIZE)
+    x_start = int(x0 * _CELL_INV)
+    y_start = int(y0 * _CELL_INV)
+    x_end = int((x1 - 1e-9) * _CELL_INV)
+    y_end = int((y1 - 1e-9) * _CELL_INV)
 
-    return [(ix, iy) for ix in range(x_start, x_end + 1) for iy in range(y_start, y_end + 1)]
+    if x_start == x_end and y_start == y_end:
+        return (_cell_key(x_start, y_start),)
+    return [
+        _cell_key(ix, iy) for ix in range(x_start, x_end + 1) for iy in range(y_start, y_end + 1)
+    ]
 
 
 # -------------------------------------------------------------------------- #
 # Modul‑Konfiguration                                                        #
 # -------------------------------------------------------------------------- #
 __all__ = [
+    "BBoxArray",
     "check_collisions",
+    "invalidate_bbox",
     "is_within_container",
+    "make_collider",
     "overlaps",
+    "register",
+    "SpatialGrid",
+    "SweepAndPrune",
     "DOOR_HEIGHT_COLLISION",
 ]
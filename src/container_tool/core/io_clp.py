@@ -2,32 +2,44 @@
 src/container_tool/core/io_clp.py
 
 Ein‑/Ausgabe‑Routinen für das proprietäre *.clp*-Format.
-Alle Operationen sind **thread‑sicher**, nutzen nur die
+Alle Operationen sind **thread‑sicher**, nutzen die
 Python‑Standardbibliothek und die Datenklassen aus *models.py*.
+Ist *orjson* installiert, wird JSON direkt aus/in Bytes (de)serialisiert.
 
 Funktionen
 ----------
-load_containers_definitions(path: str | None) -> dict[str, Container]
+load_containers_definitions(path: str | None) -> Mapping[str, Container]
 load_clp(path: str) -> Project
 save_clp(project: Project, path: str, user: str, version: str) -> None
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import mmap
+import os
 import re
+import stat
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import RLock
-from typing import Any, Dict, Final
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, Final, Mapping
 
 # ----------------------------------------------------------------------------------------------------------------------
 # relative Imports aus dem Projekt
 # (Pfad: src/container_tool/core/models.py laut Projektplan)
 # ----------------------------------------------------------------------------------------------------------------------
-from .models import Box, Container, Project, Stack  # type: ignore[attr-defined]
+from .models import ITEM_CTORS, Box, Container, Project, ProjectMeta, Stack
+
+# Optionaler C‑Parser: liest/schreibt Bytes ohne Umweg über ``str``
+try:
+    import orjson
+except ImportError:  # pragma: no cover – Fallback auf stdlib ``json``
+    orjson = None  # type: ignore[assignment]
 
 __all__ = [
     "ClpError",
@@ -82,8 +94,11 @@ _SEMVER_RE: Final[re.Pattern[str]] = re.compile(
 # Thread‑Lock für *save_clp* (Auto‑Save, gleichzeitiges Speichern)
 _SAVE_LOCK: Final[RLock] = RLock()
 
-# Cache für Container‑Definitionen (wird lazy geladen)
-_CONTAINER_DEFINITIONS: dict[str, Container] | None = None
+# Anzahl gecachter containers.json‑Stände (Pfad × Änderungszeitpunkt)
+_CONTAINER_CACHE_SIZE: Final[int] = 8
+
+# Ab dieser Größe liest load_clp per Memory‑Map; darunter ist ein read() billiger
+_MMAP_MIN_BYTES: Final[int] = 1 << 20
 
 
 # ======================================================================================================================
@@ -110,7 +125,55 @@ def _data_dir() -> Path:
     return _project_root() / "data"
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parst UTF‑8‑JSON‑Bytes (orjson, sonst stdlib).
+
+    Beide Parser werfen eine Unterklasse von ``json.JSONDecodeError``.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_load_file(path: Path) -> Any:
+    """Parst die JSON‑Datei *path* wie `_json_loads`.
+
+    Mit orjson werden Dateien ab `_MMAP_MIN_BYTES` direkt aus einem
+    Memory‑Map gelesen – ohne den Zwischen‑``bytes``‑Puffer eines ``read()``.
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size < _MMAP_MIN_BYTES:  # auch: leere Dateien
+            return orjson.loads(fp.read())
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _json_dump(obj: Any, fp: BinaryIO) -> None:
+    """
+    Schreibt *obj* als eingerücktes UTF‑8‑JSON (2 Leerzeichen) nach *fp*.
+
+    Beide Encoder erzeugen den kompletten Puffer, der mit genau einem
+    ``write()`` geschrieben wird; ``json.dump`` riefe ``write`` je JSON‑Token auf.
+    """
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    fp.write(json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+def _is_plain_semver_core(part: str) -> bool:
+    """``X``/``Y``/``Z`` einer SemVer‑Version: ASCII‑Ziffern ohne führende Null."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
 def _validate_semver(version: str) -> None:
+    # Schneller Pfad für den Regelfall „X.Y.Z“ ohne Prä‑Release/Build‑Meta;
+    # alles andere (oder Ungültige) prüft die vollständige Regex.
+    parts = version.split(".")
+    if len(parts) == 3 and all(_is_plain_semver_core(p) for p in parts):
+        return
     if not _SEMVER_RE.match(version):
         raise ClpFormatError(f"Ungültige SemVer‑Version: {version!r}")
 
@@ -132,45 +195,57 @@ def _ensure_writeable(target: Path) -> None:
     Prüft, ob *target* beschrieben werden kann.
 
     Strategie:
-    - Existiert die Datei, wird sie im **Append‑Modus** exklusiv geöffnet.
+    - Die Datei wird per ``os.open`` im **Append‑Modus** (ohne ``O_CREAT``)
+      geöffnet und sofort wieder geschlossen – im Normalfall genau ein Syscall.
       Windows verweigert dadurch den Zugriff, wenn Notepad/Excel die Datei hält.
-    - Temporäre Öffnung wird sofort wieder geschlossen.
+    - Existiert die Datei noch nicht, wird nur das Zielverzeichnis geprüft.
     """
-    if not target.exists():
-        # Schreibbarkeit des Verzeichnisses testen
-        if not target.parent.exists():
-            raise FileNotFoundError(str(target.parent))
-        if not target.parent.is_dir():
+    try:
+        fd = os.open(target, os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        # Schreibbarkeit des Verzeichnisses testen (ein stat statt zwei)
+        try:
+            parent_mode = target.parent.stat().st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(str(target.parent)) from None
+        if not stat.S_ISDIR(parent_mode):
             raise FileLockedError(f"{target.parent} ist kein Verzeichnis")
         return
-
-    try:
-        with target.open("a", encoding="utf-8"):
-            pass
+    except NotADirectoryError as exc:  # ein Pfadbestandteil ist eine Datei
+        raise FileLockedError(f"{target.parent} ist kein Verzeichnis") from exc
     except OSError as exc:  # schreibgeschützt / gelockt
         raise FileLockedError(
-            f"Datei {target} ist gesperrt oder schreibgeschützt – bitte schließen & erneut versuchen"
+            f"Datei {target} ist gesperrt oder schreibgeschützt – bitte schließen & erneut versuchen"
         ) from exc
+    os.close(fd)
 
 
-def _atomic_write(data: str, target: Path) -> None:
+def _atomic_write(writer: Callable[[BinaryIO], None], target: Path) -> None:
     """
-    Schreibt *data* atomar nach *target*.
+    Lässt *writer* atomar nach *target* schreiben.
 
     Vorgehen:
-    1. In eine **named** Temporary‑Datei im selben Verzeichnis schreiben.
+    1. *writer* schreibt in eine **named** Temporary‑Datei (binär) im selben
+       Verzeichnis.
     2. Mit `Path.replace()` (≙ `os.replace`) auf *target* verschieben.
        → Atomic auf allen gängigen OS.
+
+    Schlägt *writer* fehl, wird die Temporary‑Datei entfernt und *target*
+    bleibt unverändert.
     """
     with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
+        mode="wb",
         dir=str(target.parent),
         delete=False,
         suffix=".tmp",
     ) as tmp:
-        tmp.write(data)
         tmp_path = Path(tmp.name)
+        try:
+            writer(tmp)
+        except BaseException:
+            tmp.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     # Replace ist atomic (selbst auf Windows), überschreibt bestehende Datei
     tmp_path.replace(target)
@@ -181,33 +256,18 @@ def _atomic_write(data: str, target: Path) -> None:
 # ======================================================================================================================
 
 
-def load_containers_definitions(path: str | Path | None = None) -> dict[str, Container]:
+@functools.lru_cache(maxsize=_CONTAINER_CACHE_SIZE)
+def _load_containers_cached(path_str: str, mtime_ns: int) -> Mapping[str, Container]:
     """
-    Lädt die Container‑Definitionen aus *containers.json*.
+    Parst *path_str*; Cache‑Key ist ``(Pfad, st_mtime_ns)``.
 
-    Parameter
-    ---------
-    path:
-        Optionaler alternativer Pfad (Unit‑Tests).
-        *None* ⇒ *data/containers.json* relativ zum Projekt‑Root.
-
-    Returns
-    -------
-    dict[str, Container]
-        Key = Container‑ID.
-
-    Raises
-    ------
-    FileNotFoundError, ClpFormatError
+    Ändert sich die Datei zur Laufzeit, ändert sich der Key und die Datei
+    wird neu gelesen. *mtime_ns* wird nur als Key verwendet. Alle Aufrufer
+    teilen sich das Ergebnis, daher wird es schreibgeschützt
+    (``MappingProxyType``) zurückgegeben.
     """
-    global _CONTAINER_DEFINITIONS  # noqa: PLW0603 – bewusstes Caching
-
-    if _CONTAINER_DEFINITIONS is not None and path is None:
-        return _CONTAINER_DEFINITIONS
-
-    json_path = Path(path) if path else _data_dir() / "containers.json"
     try:
-        raw = json.loads(json_path.read_text(encoding="utf-8"))
+        raw = _json_loads(Path(path_str).read_bytes())
     except FileNotFoundError:
         raise
     except json.JSONDecodeError as exc:
@@ -225,10 +285,37 @@ def load_containers_definitions(path: str | Path | None = None) -> dict[str, Con
             raise ClpFormatError("Fehlerhafte Container‑Definition") from exc
         defs[container.id] = container  # type: ignore[attr-defined]
 
-    if path is None:
-        _CONTAINER_DEFINITIONS = defs  # cache
+    return MappingProxyType(defs)
+
+
+def load_containers_definitions(path: str | Path | None = None) -> Mapping[str, Container]:
+    """
+    Lädt die Container‑Definitionen aus *containers.json*.
+
+    Das Ergebnis wird pro Pfad und Datei‑Änderungszeit gecacht; wiederholte
+    Aufrufe kosten nur ein ``stat``. Mapping und Container‑Objekte werden
+    zwischen allen Aufrufern geteilt: das Mapping ist schreibgeschützt, die
+    Container sind als read‑only zu behandeln (Änderungen nur an Kopien,
+    z. B. ``dataclasses.replace``).
+
+    Parameter
+    ---------
+    path:
+        Optionaler alternativer Pfad (Unit‑Tests).
+        *None* ⇒ *data/containers.json* relativ zum Projekt‑Root.
+
+    Returns
+    -------
+    Mapping[str, Container]
+        Key = Container‑ID (schreibgeschützter ``MappingProxyType``).
 
-    return defs
+    Raises
+    ------
+    FileNotFoundError, ClpFormatError
+    """
+    json_path = Path(path) if path else _data_dir() / "containers.json"
+    mtime_ns = json_path.stat().st_mtime_ns
+    return _load_containers_cached(str(json_path), mtime_ns)
 
 
 def load_clp(path: str | Path) -> Project:
@@ -244,7 +331,7 @@ def load_clp(path: str | Path) -> Project:
     path = Path(path)
 
     try:
-        raw: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        raw: Dict[str, Any] = _json_load_file(path)
     except FileNotFoundError:
         raise
     except json.JSONDecodeError as exc:
@@ -295,13 +382,11 @@ def load_clp(path: str | Path) -> Project:
             raise ClpFormatError("Box/Stack‑Eintrag ist fehlerhaft")
 
         box_type = item["type"]
+        ctor = ITEM_CTORS.get(box_type)
+        if ctor is None:
+            raise ClpFormatError(f"Unbekannter Box/Stack‑Typ: {box_type!r}")
         try:
-            if box_type == "box":
-                boxes.append(Box.from_dict(item))  # type: ignore[attr-defined]
-            elif box_type == "stack":
-                boxes.append(Stack.from_dict(item))  # type: ignore[attr-defined]
-            else:
-                raise ClpFormatError(f"Unbekannter Box/Stack‑Typ: {box_type!r}")
+            boxes.append(ctor(item))
         except Exception as exc:  # pragma: no cover
             _LOGGER.exception("Fehler beim Parsen von %s‑Eintrag", box_type)
             raise ClpFormatError(f"Fehlerhaftes {box_type}‑Objekt") from exc
@@ -346,11 +431,9 @@ def save_clp(project: Project, path: str | Path, user: str, version: str) -> Non
 
         # -- Meta aktualisieren --------------------------------------------
         _validate_semver(version)  # frühe Validierung
-        now_iso = datetime.now(tz=timezone.utc).isoformat()
-
-        project.meta["created_at"] = now_iso  # type: ignore[attr-defined]
-        project.meta["user"] = user  # type: ignore[attr-defined]
-        project.meta["version"] = version  # type: ignore[attr-defined]
+        project.meta = ProjectMeta(
+            created_at=datetime.now(tz=timezone.utc), version=version, user=user
+        )
 
         # -- Serialisieren --------------------------------------------------
         try:
@@ -358,11 +441,9 @@ def save_clp(project: Project, path: str | Path, user: str, version: str) -> Non
         except Exception as exc:  # pragma: no cover
             raise ClpFormatError("Fehler beim Serialisieren des Projekts") from exc
 
-        json_str = json.dumps(serialised, indent=2, ensure_ascii=False)
-
-        # -- Atomar schreiben ----------------------------------------------
+        # -- Atomar schreiben (JSON direkt in die Temp‑Datei streamen) -------
         try:
-            _atomic_write(json_str, path)
+            _atomic_write(functools.partial(_json_dump, serialised), path)
         except FileLockedError:
             raise  # wurde bereits geloggt
         except Exception as exc:  # pragma: no cover
@@ -2,7 +2,11 @@ from __future__ import annotations
 import datetime
 import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Tuple, Union, ClassVar
+from types import MappingProxyType
+from typing import (
+    Any, Callable, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple,
+    Union,
+)
 
 
 # --------------------------------------------------------------------------- #
@@ -31,6 +35,11 @@ class Container:
     inner_width_mm: int
     inner_height_mm: int
     door_height_mm: int
+    # (Innenlänge, Innenbreite) für die Kollisionsprüfung; folgt beiden Feldern
+    _bounds: Optional[Tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _BOUND_FIELDS: ClassVar[FrozenSet[str]] = frozenset(("inner_length_mm", "inner_width_mm"))
     # --- Kompatibilitäts‑Aliase für den PDF‑Export ---
     length = property(lambda self: self.inner_length_mm)
     width = property(lambda self: self.inner_width_mm)
@@ -43,6 +52,17 @@ class Container:
             self.door_height_mm,
         )):
             raise ValidationError("Container-Maße müssen positiv sein.")
+        object.__setattr__(self, "_bounds", (self.inner_length_mm, self.inner_width_mm))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in Container._BOUND_FIELDS and getattr(self, "_bounds", None) is not None:
+            object.__setattr__(self, "_bounds", (self.inner_length_mm, self.inner_width_mm))
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        """(Innenlänge, Innenbreite) in mm – vorberechnet für die Kollisionsprüfung."""
+        return self._bounds  # type: ignore[return-value]
 
     # ------------------------------------------------------------------ #
     #  Serialisierung
@@ -65,7 +85,7 @@ class Container:
 # --------------------------------------------------------------------------- #
 #  Box
 # --------------------------------------------------------------------------- #
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)  # Gleichheit/Hash per Identität, s. same_shape
 class Box:
     name: str
     length_mm: int
@@ -76,6 +96,16 @@ class Box:
     pos_x_mm: int = 0
     pos_y_mm: int = 0
     rot_deg: int = 0  # 0 oder 90
+    # Zwischengespeicherte bbox()/center(); werden bei jeder Geometrie-Änderung verworfen
+    _bbox_cache: Optional[Tuple[int, int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _center_cache: Optional[Tuple[float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _GEOMETRY_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        ("pos_x_mm", "pos_y_mm", "length_mm", "width_mm", "rot_deg")
+    )
     # --- Kompatibilitäts-Aliase für den PDF-Export ---
     x = property(lambda self: self.pos_x_mm)
     y = property(lambda self: self.pos_y_mm)
@@ -88,35 +118,67 @@ class Box:
 
     # ---------------------------- Validierung ---------------------------- #
     def __post_init__(self) -> None:
-        if self.rot_deg not in (0, 90):
+        Box._validate(self.length_mm, self.width_mm, self.height_mm, self.rot_deg, self.color_hex)
+        if self.weight_kg is None:
+            self.weight_kg = 0.0
+
+    @staticmethod
+    def _validate(length: int, width: int, height: int, rot: int, color: str) -> None:
+        """Gemeinsame Feldprüfung für `__post_init__` und `_bulk_from_raw`."""
+        if rot not in (0, 90):
             raise ValidationError("rot_deg muss 0 oder 90 sein.")
-        if any(v <= 0 for v in (self.length_mm, self.width_mm, self.height_mm)):
+        if length <= 0 or width <= 0 or height <= 0:
             raise ValidationError("Box-Maße müssen positiv sein.")
-        if not (isinstance(self.color_hex, str) and self.color_hex.startswith("#")):
+        if not (isinstance(color, str) and color.startswith("#")):
             raise ValidationError("color_hex muss ein Hex-String sein.")
-        if self.weight_kg is None:
-            self.weight_kg = 0.0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in Box._GEOMETRY_FIELDS:
+            object.__setattr__(self, "_bbox_cache", None)
+            object.__setattr__(self, "_center_cache", None)
 
     # ----------------------- Geometrische Helfer ------------------------ #
     def bbox(self) -> Tuple[int, int, int, int]:
-        """(x_min, y_min, x_max, y_max) in mm – abhängig von rot_deg."""
+        """(x_min, y_min, x_max, y_max) in mm – abhängig von rot_deg (gecacht)."""
+        cached = self._bbox_cache
+        if cached is not None:
+            return cached
         if self.rot_deg == 0:
-            return (
+            cached = (
                 self.pos_x_mm,
                 self.pos_y_mm,
                 self.pos_x_mm + self.length_mm,
                 self.pos_y_mm + self.width_mm,
             )
-        return (
-            self.pos_x_mm,
-            self.pos_y_mm,
-            self.pos_x_mm + self.width_mm,
-            self.pos_y_mm + self.length_mm,
-        )
+        else:
+            cached = (
+                self.pos_x_mm,
+                self.pos_y_mm,
+                self.pos_x_mm + self.width_mm,
+                self.pos_y_mm + self.length_mm,
+            )
+        object.__setattr__(self, "_bbox_cache", cached)
+        return cached
 
     def center(self) -> Tuple[float, float]:
+        """Mittelpunkt der Grundfläche in mm (gecacht wie `bbox`)."""
+        cached = self._center_cache
+        if cached is not None:
+            return cached
+        x_min, y_min, x_max, y_max = self.bbox()
+        cached = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        object.__setattr__(self, "_center_cache", cached)
+        return cached
+
+    def weight_total(self) -> float:
+        """Gewicht des Objekts inkl. aller enthaltenen Boxen (vgl. `Stack`)."""
+        return self.weight_kg
+
+    def _center2(self) -> Tuple[int, int]:
+        """Doppelter Mittelpunkt (x_min + x_max, y_min + y_max) – rein ganzzahlig."""
         x_min, y_min, x_max, y_max = self.bbox()
-        return ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        return (x_min + x_max, y_min + y_max)
 
     @property
     def volume_mm3(self) -> int:
@@ -132,13 +194,28 @@ class Box:
         self.rot_deg = 90 if self.rot_deg == 0 else 0
 
     # ---------------------------- Gleichheit ---------------------------- #
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Box):
-            return NotImplemented
+    def same_shape(self, other: "Box") -> bool:
+        """True, wenn beide Boxen dieselbe Grundfläche (Länge × Breite) haben."""
         return self.length_mm == other.length_mm and self.width_mm == other.width_mm
 
-    def __hash__(self) -> int:  # erlaubt Nutzung in Sets/Dicts
-        return hash((self.length_mm, self.width_mm))
+    def _clones(self, names: Iterable[str]) -> List["Box"]:
+        """
+        Flache Kopien dieser (bereits validierten) Box, je eine pro Name.
+
+        Belegt die Slots direkt statt über `__init__`/`__post_init__`; die
+        Caches werden mitkopiert, da die Geometrie identisch ist.
+        """
+        new = Box.__new__
+        set_ = object.__setattr__
+        state = [(f, getattr(self, f)) for f in Box.__slots__ if f != "name"]
+        out: List[Box] = []
+        for name in names:
+            b = new(Box)
+            for f, v in state:
+                set_(b, f, v)
+            set_(b, "name", name)
+            out.append(b)
+        return out
 
     # --------------------------- Serialisierung ------------------------- #
     def to_dict(self) -> Dict[str, Any]:
@@ -157,10 +234,71 @@ class Box:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Box":
+        _require_box_keys(data)
         data = dict(data)
         data.pop("type", None)
         return cls(**data)
 
+    @classmethod
+    def _bulk_from_raw(cls, raws: List[Dict[str, Any]]) -> List["Box"]:
+        """
+        Massen-Konstruktion für Deserialisierung (z. B. `Project.from_dict`).
+
+        Umgeht das dataclass-`__init__` samt überschriebenem `__setattr__` und
+        belegt die Slots direkt; geprüft wird wie in `__post_init__` über
+        `_validate`, fehlende Pflichtfelder wie in `from_dict`. Einträge mit
+        unbekannten Schlüsseln gehen über `from_dict`, damit Fehlermeldungen
+        unverändert bleiben.
+        """
+        new = cls.__new__
+        set_ = object.__setattr__
+        validate = cls._validate
+        known = _BOX_RAW_KEYS
+        out: List[Box] = []
+        append = out.append
+        for raw in raws:
+            if not raw.keys() <= known:
+                append(cls.from_dict(raw))
+                continue
+            _require_box_keys(raw)
+            rot = raw.get("rot_deg", 0)
+            length = raw["length_mm"]
+            width = raw["width_mm"]
+            height = raw["height_mm"]
+            color = raw.get("color_hex", "#FFFFFF")
+            weight = raw.get("weight_kg", 0.0)
+            validate(length, width, height, rot, color)
+            b = new(cls)
+            set_(b, "name", raw["name"])
+            set_(b, "length_mm", length)
+            set_(b, "width_mm", width)
+            set_(b, "height_mm", height)
+            set_(b, "weight_kg", 0.0 if weight is None else weight)
+            set_(b, "color_hex", color)
+            set_(b, "pos_x_mm", raw.get("pos_x_mm", 0))
+            set_(b, "pos_y_mm", raw.get("pos_y_mm", 0))
+            set_(b, "rot_deg", rot)
+            set_(b, "_bbox_cache", None)
+            set_(b, "_center_cache", None)
+            append(b)
+        return out
+
+
+# Zulässige Schlüssel eines serialisierten Box-Eintrags (siehe Box.to_dict)
+_BOX_RAW_KEYS: FrozenSet[str] = frozenset((
+    "type", "name", "length_mm", "width_mm", "height_mm", "weight_kg",
+    "color_hex", "pos_x_mm", "pos_y_mm", "rot_deg",
+))
+# Felder ohne Default in Box
+_BOX_REQUIRED_KEYS: FrozenSet[str] = frozenset(("name", "length_mm", "width_mm", "height_mm"))
+
+
+def _require_box_keys(raw: Dict[str, Any]) -> None:
+    """ValidationError, wenn *raw* ein Pflichtfeld von `Box` fehlt."""
+    missing = _BOX_REQUIRED_KEYS - raw.keys()
+    if missing:
+        raise ValidationError(f"Box-Eintrag ohne Pflichtfeld(er): {', '.join(sorted(missing))}")
+
 
 # --------------------------------------------------------------------------- #
 #  Stack
@@ -169,6 +307,8 @@ class Box:
 class Stack:
     name: str
     _boxes: List[Box] = field(default_factory=list)
+    # Laufende Summe; wird von `_append` nachgeführt (Boxen nur darüber anhängen)
+    _total_weight_kg: float = field(default=0.0, init=False, repr=False, compare=False)
     SNAP_TOLERANCE_MM: ClassVar[int] = 10
 
     # ---------------------------- Validierung --------------------------- #
@@ -185,6 +325,7 @@ class Stack:
                 raise ValidationError(
                     "Alle Boxen in einem Stack müssen Länge, Breite und Rotation teilen."
                 )
+        self._total_weight_kg = sum(b.weight_kg for b in self._boxes)
 
     # ------------------------ Eigenschaften ---------------------------- #
     @property
@@ -216,19 +357,8 @@ class Stack:
 
     # ------------------------- Geometrie ------------------------------- #
     def bbox(self) -> Tuple[int, int, int, int]:
-        if self.rot_deg == 0:
-            return (
-                self.pos_x_mm,
-                self.pos_y_mm,
-                self.pos_x_mm + self.length_mm,
-                self.pos_y_mm + self.width_mm,
-            )
-        return (
-            self.pos_x_mm,
-            self.pos_y_mm,
-            self.pos_x_mm + self.width_mm,
-            self.pos_y_mm + self.length_mm,
-        )
+        # Alle Boxen teilen Position & Rotation → Cache der ersten Box nutzen
+        return self._boxes[0].bbox()
 
     def _center(self) -> Tuple[float, float]:
         return self._boxes[0].center()
@@ -238,7 +368,10 @@ class Stack:
         return self.height_mm * len(self._boxes)
 
     def total_weight_kg(self) -> float:
-        return sum(b.weight_kg for b in self._boxes)
+        return self._total_weight_kg
+
+    def weight_total(self) -> float:
+        return self.total_weight_kg()
 
     def box_count(self) -> int:
         return len(self._boxes)
@@ -260,12 +393,11 @@ class Stack:
             and box.rot_deg == first.rot_deg
         ):
             return False
-        cx1, cy1 = self._center()
-        cx2, cy2 = box.center()
-        return (
-            abs(cx1 - cx2) <= self.SNAP_TOLERANCE_MM
-            and abs(cy1 - cy2) <= self.SNAP_TOLERANCE_MM
-        )
+        # Vergleich der doppelten Mittelpunkte gegen 2·Toleranz (ganzzahlig)
+        cx1, cy1 = first._center2()
+        cx2, cy2 = box._center2()
+        tol2 = 2 * self.SNAP_TOLERANCE_MM
+        return abs(cx1 - cx2) <= tol2 and abs(cy1 - cy2) <= tol2
 
     def add_box(self, box: Box) -> None:
         """Fügt eine Box hinzu oder wirft GeometryError."""
@@ -273,7 +405,12 @@ class Stack:
             raise GeometryError("Box passt nicht auf diesen Stapel.")
         box.pos_x_mm = self.pos_x_mm  # auf exakte Position klemmen
         box.pos_y_mm = self.pos_y_mm
+        self._append(box)
+
+    def _append(self, box: Box) -> None:
+        """Hängt `box` ohne Prüfung an und führt die Gewichtssumme nach."""
         self._boxes.append(box)
+        self._total_weight_kg += box.weight_kg
 
     def rotate(self) -> None:
         """Dreht den gesamten Stapel (alle Boxen) um 90 °."""
@@ -312,9 +449,11 @@ class Stack:
         weight_kg = data.pop("weight_kg")
         color_hex = data.pop("color_hex")
 
-        boxes = [
-            Box(
-                name=f"{name}_{i+1}",
+        boxes: List[Box] = []
+        if count > 0:
+            # Einmal validieren, die übrigen Boxen als Kopien des Prototyps
+            proto = Box(
+                name=f"{name}_1",
                 length_mm=length_mm,
                 width_mm=width_mm,
                 height_mm=height_mm,
@@ -324,11 +463,19 @@ class Stack:
                 pos_y_mm=pos_y,
                 rot_deg=rot_deg,
             )
-            for i in range(count)
-        ]
+            boxes.append(proto)
+            boxes.extend(proto._clones(f"{name}_{i+1}" for i in range(1, count)))
         return cls(name=name, _boxes=boxes)
 
 
+# Serialisierter "type" → Konstruktor; schreibgeschützt, neue Item-Typen nur
+# hier eintragen (genutzt von Project.from_dict, io_clp und dem GUI)
+ITEM_CTORS: Mapping[str, Callable[[Dict[str, Any]], Union[Box, Stack]]] = MappingProxyType({
+    "box": Box.from_dict,
+    "stack": Stack.from_dict,
+})
+
+
 # --------------------------------------------------------------------------- #
 #  Project-Meta
 # --------------------------------------------------------------------------- #
@@ -361,16 +508,19 @@ class ProjectMeta:
 class Project:
     container: Container
     boxes: List[Union[Box, Stack]] = field(default_factory=list)
-    meta: ProjectMeta = field(
-        default_factory=lambda: ProjectMeta(
-            datetime.datetime.utcnow(), "1.0.0", "unknown"
-        )
-    )
-    _lock: threading.RLock = field(init=False, repr=False, default_factory=threading.RLock)
+    meta: Optional[ProjectMeta] = None  # wird in __post_init__ belegt
+    # Nicht‑reentrant genügt: keine gesperrte Methode ruft eine andere auf
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
     container_length = property(lambda self: self.container.inner_length_mm)
     container_width = property(lambda self: self.container.inner_width_mm)
     container_height = property(lambda self: self.container.inner_height_mm)
 
+    def __post_init__(self) -> None:
+        if self.meta is None:
+            self.meta = ProjectMeta(
+                datetime.datetime.now(datetime.timezone.utc), "1.0.0", "unknown"
+            )
+
     # ----------------------- Thread-sichere Ops ------------------------- #
     def add(self, item: Union[Box, Stack]) -> None:
         with self._lock:
@@ -383,10 +533,7 @@ class Project:
     # ----------------------------- Metriken ---------------------------- #
     def total_weight_kg(self) -> float:
         with self._lock:
-            return sum(
-                item.weight_kg if isinstance(item, Box) else item.total_weight_kg()
-                for item in self.boxes
-            )
+            return sum(item.weight_total() for item in self.boxes)
 
     def max_height_mm(self) -> int:
         with self._lock:
@@ -410,14 +557,19 @@ class Project:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Project":
         container = Container.from_dict(data["container"])
-        boxes: List[Union[Box, Stack]] = []
-        for raw in data["boxes"]:
-            item_type = raw.get("type")
-            if item_type == "box":
-                boxes.append(Box.from_dict(raw))
-            elif item_type == "stack":
-                boxes.append(Stack.from_dict(raw))
-            else:
-                raise ValidationError(f"Unbekannter Item-Typ: {item_type!r}")
+        raw_items = data["boxes"]
+        # Einzelboxen gesammelt erzeugen, anschließend in Originalreihenfolge einsetzen
+        box_idx = [i for i, raw in enumerate(raw_items) if raw.get("type") == "box"]
+        boxes: List[Union[Box, Stack]] = [None] * len(raw_items)  # type: ignore[list-item]
+        for i, box in zip(box_idx, Box._bulk_from_raw([raw_items[i] for i in box_idx])):
+            boxes[i] = box
+        if len(box_idx) != len(raw_items):
+            for i, raw in enumerate(raw_items):
+                if boxes[i] is not None:
+                    continue
+                ctor = ITEM_CTORS.get(raw.get("type"))
+                if ctor is None:
+                    raise ValidationError(f"Unbekannter Item-Typ: {raw.get('type')!r}")
+                boxes[i] = ctor(raw)
         meta = ProjectMeta.from_dict(data["meta"])
         return cls(container=container, boxes=boxes, meta=meta)
@@ -14,16 +14,34 @@ create_stack(boxes, container)      -> Stack
 add_to_stack(stack, box, container) -> Stack
     Fügt einem existierenden Stapel eine weitere Box hinzu.
 
+find_stackable_groups(boxes, container) -> list[list[int]]
+    Gruppiert Boxen, die paarweise (transitiv) stapelbar sind.
+
 Alle Prüfungen stützen sich auf die Konstanten und Dataklassen in
 `models.py`, insbesondere auf `Stack.SNAP_TOLERANCE_MM`.
 """
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 from .models import Box, Container, Stack, GeometryError
 
+# Optionale Beschleunigung: Numba‑JIT für die Stapel‑Prüfung
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover – Numba ist keine Pflichtabhängigkeit
+    njit = None
+
+# Ab dieser Kandidatenzahl lohnt sich die parallele Numba‑Variante
+_PARALLEL_THRESHOLD: int = 1024
+
+# Bis zu dieser Boxanzahl wird die volle N×N‑Kompatibilitätsmatrix gebildet,
+# darüber wird entlang der x‑Mittelpunkte gesweept (Speicher: N² Bytes)
+_DENSE_GROUP_LIMIT: int = 4096
+
 # ---------------------------------------------------------------------------#
 # Hilfsfunktionen                                                           #
 # ---------------------------------------------------------------------------#
@@ -34,19 +52,12 @@ def _snap_tolerance() -> int:
     return getattr(Stack, "SNAP_TOLERANCE_MM", 10)
 
 
-def _box_center(box: Box) -> tuple[float, float]:
+def _box_center2(box: Box) -> tuple[int, int]:
     """
-    Berechnet den Mittelpunkt einer Box.
-
-    Falls `center_x_mm/center_y_mm` existieren, werden diese Werte genutzt.
-    Andernfalls wird der Mittelpunkt aus der Position plus
-    halber Länge/Breite ermittelt.
+    Liefert den *doppelten* Mittelpunkt einer Box (``2·pos + Kantenlänge``)
+    als Ganzzahlen; so lässt sich die Snap‑Toleranz ohne Float‑Division prüfen.
     """
-    if hasattr(box, "center_x_mm") and hasattr(box, "center_y_mm"):
-        return float(box.center_x_mm), float(box.center_y_mm)
-
-    # Fallback‑Berechnung: pos + ½ * (Kantenlänge)
-    return float(box.pos_x_mm + box.length_mm / 2), float(box.pos_y_mm + box.width_mm / 2)
+    return 2 * box.pos_x_mm + box.length_mm, 2 * box.pos_y_mm + box.width_mm
 
 
 def _dimensions_identical(a: Box, b: Box) -> bool:
@@ -60,10 +71,10 @@ def _dimensions_identical(a: Box, b: Box) -> bool:
 
 def _within_snap_tolerance(a: Box, b: Box) -> bool:
     """True, wenn sich die Box‑Mittelpunkte in X- und Y‑Richtung maximal ±Toleranz unterscheiden."""
-    tol = _snap_tolerance()
-    acx, acy = _box_center(a)
-    bcx, bcy = _box_center(b)
-    return abs(acx - bcx) <= tol and abs(acy - bcy) <= tol
+    tol2 = 2 * _snap_tolerance()
+    acx, acy = _box_center2(a)
+    bcx, bcy = _box_center2(b)
+    return abs(acx - bcx) <= tol2 and abs(acy - bcy) <= tol2
 
 
 def _remaining_height_ok(current_height_mm: int, next_height_mm: int, door_height_mm: int) -> bool:
@@ -76,6 +87,151 @@ def _raise_geometry(msg: str) -> None:
     raise GeometryError(msg)
 
 
+# ---------------------------------------------------------------------------#
+# Stapel‑Prüfung auf Arrays                                                  #
+# ---------------------------------------------------------------------------#
+# Spalten: length_mm, width_mm, height_mm, rot_deg, pos_x_mm, pos_y_mm
+# Mittelpunkte werden verdoppelt (2·pos + Kante) verglichen, damit die
+# Snap‑Toleranz exakt im Ganzzahlbereich geprüft werden kann.
+
+
+def _boxes_to_array(boxes: Sequence[Box]) -> np.ndarray:
+    """Geometrie von *boxes* als ``(N, 6)``‑int64‑Array (Spalten siehe oben)."""
+    n = len(boxes)
+    flat = np.fromiter(
+        (
+            v
+            for b in boxes
+            for v in (b.length_mm, b.width_mm, b.height_mm, b.rot_deg, b.pos_x_mm, b.pos_y_mm)
+        ),
+        dtype=np.int64,
+        count=6 * n,
+    )
+    return flat.reshape(n, 6)
+
+
+def _can_stack_many_numpy(ref: np.ndarray, cand: np.ndarray, door_h: int, tol: int) -> np.ndarray:
+    """Bool‑Maske: welche Zeilen von *cand* sind mit der Box *ref* stapelbar?"""
+    return (
+        (cand[:, 0] == ref[0])
+        & (cand[:, 1] == ref[1])
+        & (cand[:, 3] == ref[3])
+        & (np.abs(2 * cand[:, 4] + cand[:, 0] - 2 * ref[4] - ref[0]) <= 2 * tol)
+        & (np.abs(2 * cand[:, 5] + cand[:, 1] - 2 * ref[5] - ref[1]) <= 2 * tol)
+        & (cand[:, 2] + ref[2] <= door_h)
+    )
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _can_stack_kernel(  # pragma: no cover
+        la, wa, ha, ra, xa, ya,
+        lb, wb, hb, rb, xb, yb,
+        door_h, tol,
+    ):
+        return (
+            la == lb
+            and wa == wb
+            and ra == rb
+            and abs(2 * xa + la - 2 * xb - lb) <= 2 * tol
+            and abs(2 * ya + wa - 2 * yb - wb) <= 2 * tol
+            and ha + hb <= door_h
+        )
+
+    @njit(cache=True)
+    def _can_stack_many_serial(ref, cand, door_h, tol):  # pragma: no cover
+        n = cand.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            out[i] = _can_stack_kernel(
+                ref[0], ref[1], ref[2], ref[3], ref[4], ref[5],
+                cand[i, 0], cand[i, 1], cand[i, 2], cand[i, 3], cand[i, 4], cand[i, 5],
+                door_h, tol,
+            )
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _can_stack_many_parallel(ref, cand, door_h, tol):  # pragma: no cover
+        n = cand.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in prange(n):
+            out[i] = _can_stack_kernel(
+                ref[0], ref[1], ref[2], ref[3], ref[4], ref[5],
+                cand[i, 0], cand[i, 1], cand[i, 2], cand[i, 3], cand[i, 4], cand[i, 5],
+                door_h, tol,
+            )
+        return out
+
+    def _can_stack_many(ref: np.ndarray, cand: np.ndarray, door_h: int, tol: int) -> np.ndarray:
+        if cand.shape[0] > _PARALLEL_THRESHOLD:
+            return _can_stack_many_parallel(ref, cand, door_h, tol)
+        return _can_stack_many_serial(ref, cand, door_h, tol)
+
+else:
+    _can_stack_many = _can_stack_many_numpy
+
+
+def _groups_dense(geom: np.ndarray, door_h: int, tol: int) -> np.ndarray:
+    """Komponenten‑Label je Box über die volle Kompatibilitätsmatrix."""
+    L, W, H, R = geom[:, 0], geom[:, 1], geom[:, 2], geom[:, 3]
+    CX = 2 * geom[:, 4] + L
+    CY = 2 * geom[:, 5] + W
+    compat = (
+        (L[:, None] == L[None, :])
+        & (W[:, None] == W[None, :])
+        & (R[:, None] == R[None, :])
+        & (np.abs(CX[:, None] - CX[None, :]) <= 2 * tol)
+        & (np.abs(CY[:, None] - CY[None, :]) <= 2 * tol)
+        & (H[:, None] + H[None, :] <= door_h)
+    )
+    np.fill_diagonal(compat, False)
+
+    labels = np.full(len(geom), -1, dtype=np.int64)
+    comp = 0
+    for i in range(len(geom)):
+        if labels[i] >= 0:
+            continue
+        labels[i] = comp
+        frontier = np.array([i])
+        while frontier.size:
+            frontier = np.flatnonzero(compat[frontier].any(axis=0) & (labels < 0))
+            labels[frontier] = comp
+        comp += 1
+    return labels
+
+
+def _groups_sweep(geom: np.ndarray, door_h: int, tol: int) -> np.ndarray:
+    """Komponenten‑Label je Box per Sweep über die sortierten x‑Mittelpunkte."""
+    n = len(geom)
+    cx = 2 * geom[:, 4] + geom[:, 0]
+    order = np.argsort(cx, kind="stable")
+    cx_sorted = cx[order]
+    ends = np.searchsorted(cx_sorted, cx_sorted + 2 * tol, side="right")
+
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for pos in range(n):
+        end = int(ends[pos])
+        if end <= pos + 1:
+            continue
+        i = int(order[pos])
+        window = order[pos + 1:end]
+        mask = _can_stack_many_numpy(geom[i], geom[window], door_h, tol)
+        ri = find(i)
+        for j in window[mask].tolist():
+            rj = find(j)
+            if rj != ri:
+                parent[rj] = ri
+    return np.fromiter((find(i) for i in range(n)), dtype=np.int64, count=n)
+
+
 # ---------------------------------------------------------------------------#
 # Öffentliche API                                                            #
 # ---------------------------------------------------------------------------#
@@ -117,13 +273,15 @@ def create_stack(boxes: List[Box], container: Container) -> Stack:
 
     first = boxes[0]
 
-    # Validierung aller Boxen
-    for idx, bx in enumerate(boxes[1:], start=2):
-        if not can_stack(first, bx, container):
-            _raise_geometry(
-                f"Box {idx} ist nicht stapelbar mit der ersten Box – "
-                "prüfe Abmessungen, Rotation, Snap‑Toleranz oder Türhöhe."
-            )
+    # Validierung aller Boxen in einem Durchlauf gegen die erste Box
+    geom = _boxes_to_array(boxes)
+    mask = _can_stack_many(geom[0], geom[1:], container.door_height_mm, _snap_tolerance())
+    if not mask.all():
+        idx = int(np.argmin(mask)) + 2
+        _raise_geometry(
+            f"Box {idx} ist nicht stapelbar mit der ersten Box – "
+            "prüfe Abmessungen, Rotation, Snap‑Toleranz oder Türhöhe."
+        )
 
     total_height = sum(b.height_mm for b in boxes)
     if total_height > container.door_height_mm:
@@ -178,6 +336,33 @@ def add_to_stack(stack: Stack, box: Box, container: Container) -> Stack:
     box.pos_y_mm = stack.pos_y_mm
 
     # Stapel aktualisieren
-    stack._boxes.append(box)
+    stack._append(box)
 
     return stack
+
+
+def find_stackable_groups(boxes: Sequence[Box], container: Container) -> List[List[int]]:
+    """
+    Gruppiert `boxes` in Zusammenhangskomponenten des `can_stack`‑Graphen.
+
+    Zwei Boxen sind verbunden, wenn `can_stack` für sie *True* liefert;
+    Gruppen entstehen transitiv. Zurückgegeben werden nur Gruppen mit
+    mindestens zwei Boxen als aufsteigend sortierte Index‑Listen, geordnet
+    nach ihrem kleinsten Index. Ob eine Gruppe als Ganzes (Gesamthöhe,
+    Toleranz zur *ersten* Box) einen gültigen Stapel ergibt, prüft
+    weiterhin `create_stack`.
+    """
+    if len(boxes) < 2:
+        return []
+    geom = _boxes_to_array(boxes)
+    door_h = container.door_height_mm
+    tol = _snap_tolerance()
+    if len(boxes) <= _DENSE_GROUP_LIMIT:
+        labels = _groups_dense(geom, door_h, tol)
+    else:
+        labels = _groups_sweep(geom, door_h, tol)
+
+    groups: Dict[int, List[int]] = {}
+    for idx, label in enumerate(labels.tolist()):
+        groups.setdefault(label, []).append(idx)
+    return [g for g in groups.values() if len(g) > 1]
@@ -7,58 +7,113 @@ Generates a comprehensive PDF export of the current packing‑project.
 from __future__ import annotations
 
 import io
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
-from typing import List, Sequence, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, List, Sequence, Optional
 
-from PIL import Image
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfgen import canvas
-from reportlab.platypus import Table, TableStyle
+import numpy as np
+
+from ..core.models import Box, Stack
+
+# ReportLab and Pillow are imported inside the functions that need them, so
+# importing this module (e.g. by the GUI at startup) stays cheap until the
+# first export actually happens.
+if TYPE_CHECKING:  # pragma: no cover
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import Table
 
 
 # --------------------------------------------------------------------------- #
 # Helper functions
 # --------------------------------------------------------------------------- #
-def _pil_to_reader(img: Image.Image, width_px: int = 800, height_px: int = 600) -> ImageReader:
-    """Ensure *img* is exactly width_px × height_px and return an ImageReader."""
+def _pil_to_reader(img: Image.Image, width_px: int = 800, height_px: int = 600,
+                   resample: int | None = None) -> ImageReader:
+    """Ensure *img* is exactly width_px × height_px and return an ImageReader.
+
+    The caller's image is never mutated; it is only copied when it actually
+    has to be shrunk in place. *resample* defaults to BILINEAR, which is
+    indistinguishable from LANCZOS at the printed preview size.
+    """
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    if resample is None:
+        resample = Image.BILINEAR
+    size = (width_px, height_px)
+    if img.size == size and img.mode in ("RGB", "RGBA"):
+        return ImageReader(_encode_jpeg(img))
+
+    owned = False
     if img.mode not in ("RGB", "RGBA"):
         img = img.convert("RGB")
+        owned = True
 
-    img = img.copy()
-    img.thumbnail((width_px, height_px), Image.LANCZOS)
+    if img.width > width_px or img.height > height_px:
+        if not owned:
+            img = img.copy()
+        img.thumbnail(size, resample)
 
-    if img.size != (width_px, height_px):
-        padded = Image.new("RGB", (width_px, height_px), (255, 255, 255))
+    if img.size != size:
+        padded = Image.new("RGB", size, (255, 255, 255))
         off_x = (width_px - img.width) // 2
         off_y = (height_px - img.height) // 2
         padded.paste(img, (off_x, off_y))
         img = padded
 
-    return ImageReader(img)
+    return ImageReader(_encode_jpeg(img))
+
 
+def _encode_jpeg(img: Image.Image, quality: int = 85) -> io.BytesIO:
+    """Encode *img* as JPEG into a rewound buffer (alpha is flattened on white).
 
-def _aggregate_boxes(boxes: Sequence["Box"]) -> List[List[str | int | float]]:
-    """Aggregate identical boxes into rows: [Name, Count, L, B, H, Weight]."""
-    grouped: dict[tuple, list] = defaultdict(lambda: [0])
-    for b in boxes:
-        key = (b.name, round(b.length, 2), round(b.width, 2),
-               round(b.height, 2), round(b.weight, 2))
-        grouped[key][0] += 1
+    ReportLab embeds a JPEG source verbatim (DCTDecode), so the image is
+    compressed once here instead of being held decoded and re-encoded by
+    ``canvas.save()``.
+    """
+    from PIL import Image
+
+    if img.mode == "RGBA":
+        flat = Image.new("RGB", img.size, (255, 255, 255))
+        flat.paste(img, mask=img.getchannel("A"))
+        img = flat
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality, optimize=False)
+    buf.seek(0)
+    return buf
 
-    rows: List[List[str | int | float]] = []
-    for (name, l, w, h, weight), (count,) in grouped.items():
-        rows.append([name, count, l, w, h, weight])
-    rows.sort(key=lambda r: r[0])
+
+def _aggregate_boxes(boxes: Sequence[Box | Stack]) -> List[List[str | int | float]]:
+    """Aggregate identical boxes into rows: [Name, Count, L, B, H, Weight].
+
+    Stacks are expanded into the boxes they contain, so every physical box
+    appears in the table. Dimensions are integer millimetres and are used
+    as-is; only the weight (float) is rounded.
+    """
+    _round = round
+    counts = Counter(
+        (b.name, b.length_mm, b.width_mm, b.height_mm, _round(b.weight_kg, 2))
+        for item in boxes
+        for b in (item if isinstance(item, Stack) else (item,))
+    )
+    rows: List[List[str | int | float]] = [
+        [name, count, l, w, h, weight]
+        for (name, l, w, h, weight), count in counts.items()
+    ]
+    rows.sort(key=itemgetter(0))
     return rows
 
 
 def _build_table(rows: List[List[str | int | float]]) -> Table:
     """Return a styled ReportLab Table from *rows*."""
-    data = [["Name", "Anzahl", "L", "B", "H", "Gewicht"]] + rows
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
+    data = [["Name", "Anzahl", "L", "B", "H", "Gewicht"], *rows]
     tbl = Table(data, hAlign="LEFT")
 
     style = TableStyle([
@@ -68,31 +123,45 @@ def _build_table(rows: List[List[str | int | float]]) -> Table:
         ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
         ("FONTSIZE", (0, 0), (-1, -1), 8),
         ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+        # Zebra striping in one command: odd body rows plain, even ones shaded
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [None, colors.whitesmoke]),
     ])
-
-    for row in range(1, len(data)):
-        if row % 2 == 0:
-            style.add("BACKGROUND", (0, row), (-1, row), colors.whitesmoke)
     tbl.setStyle(style)
     return tbl
 
 
+def _boxes_to_soa(boxes: Sequence["Box"]) -> np.ndarray:
+    """Return an (n, 4) int array with columns x, y, length, width of *boxes*."""
+    n = len(boxes)
+    flat = np.fromiter(
+        (v for b in boxes for v in (b.pos_x_mm, b.pos_y_mm, b.length_mm, b.width_mm)),
+        dtype=np.int64,
+        count=4 * n,
+    )
+    return flat.reshape(n, 4)
+
+
 def _split_loaded_waiting(project: "Project") -> tuple[List["Box"], List["Box"]]:
     """Return (loaded, waiting) box lists based on footprint‑inside‑container check."""
-    loaded, waiting = [], []
+    boxes = project.boxes
+    if not boxes:
+        return [], []
     ctn = project.container
-    for b in project.boxes:
-        if (0 <= b.x and 0 <= b.y and
-                b.x + b.length <= ctn.length and
-                b.y + b.width <= ctn.width):
-            loaded.append(b)
-        else:
-            waiting.append(b)
+    a = _boxes_to_soa(boxes)
+    x, y = a[:, 0], a[:, 1]
+    mask = ((x >= 0) & (y >= 0)
+            & (x + a[:, 2] <= ctn.length)
+            & (y + a[:, 3] <= ctn.width))
+    loaded = [boxes[i] for i in np.flatnonzero(mask)]
+    waiting = [boxes[i] for i in np.flatnonzero(~mask)]
     return loaded, waiting
 
 
 def _draw_header_footer(c: canvas.Canvas, project_name: Optional[str] = None) -> None:
     """Draw header & footer on current page. If *project_name* is None, omit it."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+
     pw, ph = A4
     m = 20 * mm
     ts = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -134,6 +203,11 @@ def export_pdf(project: "Project",
     """
     from importlib import import_module
 
+    from PIL import Image
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
     if top_view is None:
         top_view = import_module("container_tool.render_2d").generate_top_view(project)
     if side_view is None:
@@ -141,7 +215,9 @@ def export_pdf(project: "Project",
     if view_3d is None:
         view_3d = import_module("container_tool.render_3d").render_scene(project)
 
-    top_r, side_r, view3d_r = map(_pil_to_reader, (top_view, side_view, view_3d))
+    top_r, side_r = map(_pil_to_reader, (top_view, side_view))
+    # The shaded 3-D render keeps the sharper (slower) filter
+    view3d_r = _pil_to_reader(view_3d, resample=Image.LANCZOS)
 
     pw, ph = A4
     m = 20 * mm
@@ -5,7 +5,8 @@ render_3d.py
 Offline 3‑D renderer for a loaded container scene.
 
 Dieses Modul erzeugt einen **unsichtbaren OpenGL‑Kontext** (pygame‑Fenster
-1 × 1 px, Flag HIDDEN) und rendert den beladenen Container aus fester,
+in Bildgröße, Flag HIDDEN), der über Aufrufe hinweg wiederverwendet wird,
+und rendert den beladenen Container aus fester,
 isometrischer Perspektive. Das Ergebnis wird als ``PIL.Image`` in
 800 × 600 Pixel (RGBA) zurückgegeben.
 
@@ -17,7 +18,12 @@ Z‑Achse → Containerhöhe
 
 Abhängigkeiten
 --------------
-PyOpenGL ≥ 3.1, numpy, Pillow, pygame ≥ 2.0
+PyOpenGL ≥ 3.1 (Kontext ≥ OpenGL 3.3 für instanziertes Zeichnen),
+numpy, Pillow, pygame ≥ 2.0
+
+Alle Boxen werden mit **einem** ``glDrawElementsInstanced``‑Aufruf
+gezeichnet: ein statischer Einheitswürfel (VBO/EBO) plus ein Instanz‑Buffer
+mit Position, Größe und Farbe je Box.
 
 Öffentliche API
 ---------------
@@ -29,8 +35,12 @@ zurückgegeben; das GUI bleibt dadurch reaktionsfähig.
 """
 from __future__ import annotations
 
+import atexit
+import ctypes
 import logging
-from typing import Any, Sequence
+import threading
+from operator import attrgetter
+from typing import Any, Dict, Optional
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -44,27 +54,71 @@ try:
 except ImportError:  # pragma: no cover
     pygame = None  # type: ignore
 
-# PyOpenGL – Import wird verzögert behandelt, um Placeholder zu erlauben
+# PyOpenGL – Import wird verzögert behandelt, um Placeholder zu erlauben.
+# Die Flags müssen *vor* dem ersten ``OpenGL.GL``‑Import gesetzt sein: sie
+# schalten die Python‑seitige Fehlerprüfung je Aufruf ab (``glGetError``‑
+# Roundtrip) und lassen ``OpenGL_accelerate`` (optional, falls installiert)
+# die schnellen Wrapper nutzen.
 try:
+    import OpenGL
+
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
+
     from OpenGL.GL import (
-        glBegin,
+        glBindBuffer,
+        glBindVertexArray,
+        glBufferData,
         glClear,
         glClearColor,
         glColor4f,
+        glDeleteBuffers,
+        glDeleteProgram,
+        glDeleteVertexArrays,
+        glDisableClientState,
+        glDrawArrays,
+        glDrawElementsInstanced,
         glEnable,
-        glEnd,
+        glEnableClientState,
+        glEnableVertexAttribArray,
+        glGenBuffers,
+        glGenVertexArrays,
+        glGetFloatv,
+        glGetUniformLocation,
         glLineWidth,
         glLoadIdentity,
+        glMapBuffer,
         glMatrixMode,
         glReadPixels,
-        glVertex3f,
+        glUniformMatrix4fv,
+        glUnmapBuffer,
+        glUseProgram,
+        glVertexAttribDivisor,
+        glVertexAttribPointer,
+        glVertexPointerf,
+        GL_ARRAY_BUFFER,
         GL_COLOR_BUFFER_BIT,
         GL_DEPTH_BUFFER_BIT,
         GL_DEPTH_TEST,
+        GL_ELEMENT_ARRAY_BUFFER,
+        GL_FALSE,
+        GL_FLOAT,
+        GL_FRAGMENT_SHADER,
         GL_LINES,
         GL_MODELVIEW,
+        GL_MODELVIEW_MATRIX,
         GL_PROJECTION,
-        GL_QUADS,
+        GL_PIXEL_PACK_BUFFER,
+        GL_PROJECTION_MATRIX,
+        GL_READ_ONLY,
+        GL_STATIC_DRAW,
+        GL_STREAM_DRAW,
+        GL_STREAM_READ,
+        GL_TRIANGLES,
+        GL_UNSIGNED_INT,
+        GL_VERTEX_ARRAY,
+        GL_VERTEX_SHADER,
         GL_LIGHTING,
         GL_LIGHT0,
         GL_LIGHT1,
@@ -78,6 +132,7 @@ try:
         glViewport,
     )
     from OpenGL.GLU import gluLookAt, gluPerspective
+    from OpenGL.GL.shaders import compileProgram, compileShader
 except Exception as exc:  # pragma: no cover
     OpenGL_import_error = exc
 else:
@@ -87,16 +142,118 @@ else:
 _WIDTH, _HEIGHT = 800, 600
 logger = logging.getLogger(__name__)
 
+# Einheitswürfel [0,1]³: 8 Ecken, 12 Dreiecke (36 Indizes)
+_CUBE_VERTS = np.array(
+    [
+        (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+        (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+    ],
+    dtype=np.float32,
+)
+_CUBE_INDICES = np.array(
+    [
+        0, 2, 1, 0, 3, 2,  # Boden
+        4, 5, 6, 4, 6, 7,  # Deckel
+        0, 1, 5, 0, 5, 4,  # vorne  (y = 0)
+        2, 3, 7, 2, 7, 6,  # hinten (y = 1)
+        1, 2, 6, 1, 6, 5,  # rechts (x = 1)
+        3, 0, 4, 3, 4, 7,  # links  (x = 0)
+    ],
+    dtype=np.uint32,
+)
+
+# 12 Kanten des Einheitswürfels als 24 Linien‑Endpunkte (GL_LINES)
+_WIRE_CUBE_UNIT = _CUBE_VERTS[
+    [0, 1, 1, 2, 2, 3, 3, 0, 4, 5, 5, 6, 6, 7, 7, 4, 0, 4, 1, 5, 2, 6, 3, 7]
+]
+
+# Pro‑Instanz‑Daten (eine Zeile je Box) – Layout passt zu den Attributen 1‥3
+_INSTANCE_DTYPE = np.dtype([("pos", "3f4"), ("size", "3f4"), ("color", "4f4")])
+
+_VERTEX_SHADER = """
+#version 330
+layout(location = 0) in vec3 aCubeVert;
+layout(location = 1) in vec3 aPos;
+layout(location = 2) in vec3 aSize;
+layout(location = 3) in vec4 aColor;
+uniform mat4 uProj;
+uniform mat4 uView;
+out vec3 vWorld;
+out vec4 vColor;
+void main() {
+    vec3 world = aCubeVert * aSize + aPos;
+    vWorld = world;
+    vColor = aColor;
+    gl_Position = uProj * uView * vec4(world, 1.0);
+}
+"""
+
+# Flächennormale aus den Ableitungen der Weltposition (Flat‑Shading ohne
+# Normalen‑Attribut); Lichtrichtungen/‑stärken wie im Fixed‑Function‑Setup.
+_FRAGMENT_SHADER = """
+#version 330
+in vec3 vWorld;
+in vec4 vColor;
+out vec4 fragColor;
+void main() {
+    vec3 n = normalize(cross(dFdx(vWorld), dFdy(vWorld)));
+    float d0 = abs(dot(n, normalize(vec3(1.0, 1.0, 2.0))));
+    float d1 = abs(dot(n, normalize(vec3(-1.0, -1.0, 1.0))));
+    float light = min(0.3 + d0 + 0.5 * d1, 1.0);
+    fragColor = vec4(vColor.rgb * light, vColor.a);
+}
+"""
+
+# GL‑Objekte des aktuellen Kontexts (werden mit dem Kontext verworfen)
+_GL_RES: Optional[Dict[str, Any]] = None
+
+# Thread, dem der gecachte GL‑Kontext gehört (None = kein Kontext)
+_CTX_THREAD: Optional[int] = None
+_ATEXIT_REGISTERED: bool = False
+# Serialisiert render_scene – es gibt nur einen gemeinsamen Kontext
+_RENDER_LOCK = threading.Lock()
+
 # ============================== Hilfsfunktionen ===========================
 
 
-def _hex_to_rgb_f(hx: str) -> tuple[float, float, float]:
-    """``#RRGGBB`` → (r, g, b) im Bereich 0 … 1 (float)."""
-    hx = hx.lstrip("#")
-    if len(hx) != 6:
-        raise ValueError(f"Invalid HEX color: {hx!r}")
-    r, g, b = (int(hx[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
-    return r, g, b
+def _hex_batch_to_rgb_f(hexes: list[str]) -> np.ndarray:
+    """Liste ``#RRGGBB`` → ``(N, 3)``‑float32‑Array im Bereich 0 … 1.
+
+    Projekte nutzen meist nur eine Handvoll Farben: geparst wird daher nur
+    die Palette der *verschiedenen* Werte, die Boxen indizieren hinein.
+    """
+    palette: Dict[str, int] = {}
+    idx = np.fromiter(
+        (palette.setdefault(h, len(palette)) for h in hexes), dtype=np.intp, count=len(hexes)
+    )
+    stripped = [h.lstrip("#") for h in palette]
+    bad = next((h for h in stripped if len(h) != 6), None)
+    if bad is not None:
+        raise ValueError(f"Invalid HEX color: {bad!r}")
+    raw = np.frombuffer(bytes.fromhex("".join(stripped)), dtype=np.uint8)
+    rgb = raw.reshape(-1, 3).astype(np.float32) / np.float32(255.0)
+    return rgb[idx]
+
+
+_BOX_GEOMETRY = attrgetter("x", "y", "z", "length", "width", "height")
+
+
+def _box_geometry(boxes: list[Any]) -> np.ndarray:
+    """``(N, 6)``‑float32‑Array (x, y, z, length, width, height) in einem Durchlauf."""
+    get = _BOX_GEOMETRY
+    flat = np.fromiter((v for b in boxes for v in get(b)), dtype=np.float32, count=6 * len(boxes))
+    return flat.reshape(-1, 6)
+
+
+def _is_renderable(box: Any) -> bool:
+    """Prüft ein einzelnes Objekt auf numerische Geometrie; protokolliert Ausfälle."""
+    try:
+        for value in _BOX_GEOMETRY(box):
+            float(value)
+    except Exception as exc:
+        logger.error("Invalid box object: %s", exc, exc_info=True)
+        return False
+    return True
 
 
 def _placeholder_image(msg: str) -> Image.Image:
@@ -112,68 +269,203 @@ def _placeholder_image(msg: str) -> Image.Image:
 # ----------------------------- OpenGL‑Primitives --------------------------
 
 
-def _draw_box(x: float, y: float, z: float, dx: float, dy: float, dz: float) -> None:
-    """Zeichnet einen opaken Quader (Immediate‑Mode)."""
-    v = [
-        (x, y, z),
-        (x + dx, y, z),
-        (x + dx, y + dy, z),
-        (x, y + dy, z),
-        (x, y, z + dz),
-        (x + dx, y, z + dz),
-        (x + dx, y + dy, z + dz),
-        (x, y + dy, z + dz),
-    ]
-    faces: Sequence[Sequence[int]] = [
-        (0, 1, 2, 3),
-        (4, 5, 6, 7),
-        (0, 1, 5, 4),
-        (2, 3, 7, 6),
-        (1, 2, 6, 5),
-        (3, 0, 4, 7),
-    ]
-    glBegin(GL_QUADS)
-    for face in faces:
-        for idx in face:
-            glVertex3f(*v[idx])
-    glEnd()
+def _init_gl_resources() -> Dict[str, Any]:
+    """Shader, VAO und Würfel‑Buffer einmal pro GL‑Kontext anlegen."""
+    global _GL_RES
+    if _GL_RES is not None:
+        return _GL_RES
+
+    program = compileProgram(
+        compileShader(_VERTEX_SHADER, GL_VERTEX_SHADER),
+        compileShader(_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        validate=False,
+    )
+    vao = glGenVertexArrays(1)
+    glBindVertexArray(vao)
+
+    cube_vbo, cube_ebo, inst_vbo, pbo = glGenBuffers(4)
+    glBindBuffer(GL_ARRAY_BUFFER, cube_vbo)
+    glBufferData(GL_ARRAY_BUFFER, _CUBE_VERTS.nbytes, _CUBE_VERTS, GL_STATIC_DRAW)
+    glEnableVertexAttribArray(0)
+    glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, cube_ebo)
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, _CUBE_INDICES.nbytes, _CUBE_INDICES, GL_STATIC_DRAW)
+
+    glBindBuffer(GL_ARRAY_BUFFER, inst_vbo)
+    stride = _INSTANCE_DTYPE.itemsize
+    for loc, name, size in ((1, "pos", 3), (2, "size", 3), (3, "color", 4)):
+        offset = _INSTANCE_DTYPE.fields[name][1]
+        glEnableVertexAttribArray(loc)
+        glVertexAttribPointer(loc, size, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(offset))
+        glVertexAttribDivisor(loc, 1)
+
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    # Pixel‑Pack‑Buffer für die Rücklesung des Farbpuffers
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+    glBufferData(GL_PIXEL_PACK_BUFFER, _WIDTH * _HEIGHT * 4, None, GL_STREAM_READ)
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    _GL_RES = {
+        "program": program,
+        "vao": vao,
+        "buffers": (cube_vbo, cube_ebo, inst_vbo, pbo),
+        "inst_vbo": inst_vbo,
+        "pbo": pbo,
+        "u_proj": glGetUniformLocation(program, "uProj"),
+        "u_view": glGetUniformLocation(program, "uView"),
+    }
+    return _GL_RES
+
+
+def _release_gl_resources() -> None:
+    """GL‑Objekte freigeben, solange der Kontext noch existiert."""
+    global _GL_RES
+    res, _GL_RES = _GL_RES, None
+    if res is None:
+        return
+    glDeleteBuffers(len(res["buffers"]), res["buffers"])
+    glDeleteVertexArrays(1, [res["vao"]])
+    glDeleteProgram(res["program"])
+
+
+def _draw_boxes_instanced(instances: np.ndarray) -> None:
+    """Zeichnet alle Boxen aus *instances* (``_INSTANCE_DTYPE``) in einem Aufruf."""
+    if len(instances) == 0:
+        return
+    res = _init_gl_resources()
+    proj = glGetFloatv(GL_PROJECTION_MATRIX)
+    view = glGetFloatv(GL_MODELVIEW_MATRIX)
+
+    glUseProgram(res["program"])
+    glUniformMatrix4fv(res["u_proj"], 1, GL_FALSE, proj)
+    glUniformMatrix4fv(res["u_view"], 1, GL_FALSE, view)
+
+    glBindVertexArray(res["vao"])
+    glBindBuffer(GL_ARRAY_BUFFER, res["inst_vbo"])
+    glBufferData(GL_ARRAY_BUFFER, instances.nbytes, instances, GL_STREAM_DRAW)
+    glDrawElementsInstanced(GL_TRIANGLES, len(_CUBE_INDICES), GL_UNSIGNED_INT, None, len(instances))
+
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glUseProgram(0)
+
+
+def _read_back_image() -> Image.Image:
+    """
+    Liest den Farbpuffer über ein Pixel‑Buffer‑Object (PBO) aus.
+
+    ``glReadPixels`` in einen gebundenen PBO kehrt sofort zurück; erst
+    ``glMapBuffer`` wartet auf die GPU. Das gemappte Speicherfenster wird
+    ohne Zwischen‑``bytes`` an Pillow gereicht – die vertikale Spiegelung
+    erzeugt die einzige Kopie, bevor der Buffer wieder freigegeben wird.
+    """
+    res = _init_gl_resources()
+    size = _WIDTH * _HEIGHT * 4
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, res["pbo"])
+    try:
+        glReadPixels(0, 0, _WIDTH, _HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        ptr = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        if not ptr:
+            raise RuntimeError("glMapBuffer failed")
+        try:
+            view = (ctypes.c_ubyte * size).from_address(ptr)
+            img = Image.frombuffer("RGBA", (_WIDTH, _HEIGHT), view, "raw", "RGBA", 0, 1)
+            # OpenGL‑Koordinaten → Bildkoordinaten (kopiert aus dem Mapping)
+            return img.transpose(Image.FLIP_TOP_BOTTOM)
+        finally:
+            glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+    finally:
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
 
 
 def _draw_wire_cube(l: float, w: float, h: float) -> None:
     """Kantenmodell des Containers (etwas kräftigere Linien)."""
-    verts = [
-        (0, 0, 0),
-        (l, 0, 0),
-        (l, w, 0),
-        (0, w, 0),
-        (0, 0, h),
-        (l, 0, h),
-        (l, w, h),
-        (0, w, h),
-    ]
-    edges = [
-        (0, 1),
-        (1, 2),
-        (2, 3),
-        (3, 0),
-        (4, 5),
-        (5, 6),
-        (6, 7),
-        (7, 4),
-        (0, 4),
-        (1, 5),
-        (2, 6),
-        (3, 7),
-    ]
+    verts = _WIRE_CUBE_UNIT * np.array((l, w, h), dtype=np.float32)
     glLineWidth(2.5)
-    glBegin(GL_LINES)
-    for a, b in edges:
-        glVertex3f(*verts[a])
-        glVertex3f(*verts[b])
-    glEnd()
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointerf(verts)
+    glDrawArrays(GL_LINES, 0, len(verts))
+    glDisableClientState(GL_VERTEX_ARRAY)
     glLineWidth(1.0)
 
 
+# ============================== Kontext‑Cache ============================
+
+
+def _ensure_ctx() -> None:
+    """
+    Legt den versteckten GL‑Kontext beim ersten Aufruf (je Thread) an.
+
+    Ein GL‑Kontext ist an den Thread gebunden, der ihn erzeugt hat; ruft ein
+    anderer Thread (z. B. ein neuer Export‑Worker) `render_scene` auf, wird
+    der alte Kontext verworfen und neu angelegt. Statischer GL‑Zustand
+    (Tiefentest, Multisampling, Lichtquellen) wird nur dabei gesetzt.
+    """
+    global _CTX_THREAD, _ATEXIT_REGISTERED
+    tid = threading.get_ident()
+    if _CTX_THREAD == tid:
+        return
+    if _CTX_THREAD is not None:
+        # Fremder Thread: GL‑Objekte gehen mit dem Kontext unter
+        _close_ctx(release=False)
+
+    pygame.display.init()
+    pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
+    pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
+    display.set_mode((_WIDTH, _HEIGHT), DOUBLEBUF | OPENGL | HIDDEN)
+
+    # ---------------- OpenGL‑Grundsetup ---------------------------
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_MULTISAMPLE)
+    glClearColor(1.0, 1.0, 1.0, 0.0)
+
+    # Lichtquellen (Position im Augenraum, Modelview ist hier Identität)
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+    glLightfv(GL_LIGHT0, GL_POSITION, (1.0, 1.0, 2.0, 0.0))
+    glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
+    glLightfv(GL_LIGHT0, GL_AMBIENT, (0.2, 0.2, 0.2, 1.0))
+
+    glEnable(GL_LIGHT1)
+    glLightfv(GL_LIGHT1, GL_POSITION, (-1.0, -1.0, 1.0, 0.0))
+    glLightfv(GL_LIGHT1, GL_DIFFUSE, (0.5, 0.5, 0.5, 1.0))
+    glLightfv(GL_LIGHT1, GL_AMBIENT, (0.1, 0.1, 0.1, 1.0))
+
+    _CTX_THREAD = tid
+    if not _ATEXIT_REGISTERED:
+        atexit.register(_close_ctx)
+        _ATEXIT_REGISTERED = True
+
+
+def _close_ctx(release: bool = True) -> None:
+    """
+    Gibt GL‑Objekte frei (optional) und schließt den versteckten Kontext.
+
+    glDelete* setzt den Kontext als *current* voraus, und der ist an
+    `_CTX_THREAD` gebunden. Aus jedem anderen Thread – insbesondere aus dem
+    atexit‑Hook im Haupt‑Thread – wird daher nur pygame beendet; die
+    GL‑Objekte gehen mit dem Kontext unter.
+    """
+    global _CTX_THREAD, _GL_RES
+    if _CTX_THREAD is None:
+        return
+    try:
+        if release and threading.get_ident() == _CTX_THREAD:
+            _release_gl_resources()
+    except Exception:  # pragma: no cover
+        pass
+    _GL_RES = None
+    _CTX_THREAD = None
+    try:
+        pygame.display.quit()
+        pygame.quit()
+    except Exception:  # pragma: no cover
+        pass
+
+
 # ============================== Hauptfunktion ============================
 
 
@@ -192,44 +484,30 @@ def render_scene(project: Any) -> Image.Image:
         logger.error("OpenGL initialisation failed", exc_info=True)
         return _placeholder_image("OpenGL not available")
 
-    try:
-        # ---------------- Kontext (verstecktes Fenster) anlegen --------
-        pygame.display.init()
-        pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
-        pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
-        display.set_mode((1, 1), DOUBLEBUF | OPENGL | HIDDEN)
-        glViewport(0, 0, _WIDTH, _HEIGHT)
+    with _RENDER_LOCK:
+        return _render_locked(project)
 
-        # ---------------- OpenGL‑Grundsetup ---------------------------
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_MULTISAMPLE)
-        glClearColor(1.0, 1.0, 1.0, 0.0)
 
-        # Lichtquellen
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, (1.0, 1.0, 2.0, 0.0))
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
-        glLightfv(GL_LIGHT0, GL_AMBIENT, (0.2, 0.2, 0.2, 1.0))
-
-        glEnable(GL_LIGHT1)
-        glLightfv(GL_LIGHT1, GL_POSITION, (-1.0, -1.0, 1.0, 0.0))
-        glLightfv(GL_LIGHT1, GL_DIFFUSE, (0.5, 0.5, 0.5, 1.0))
-        glLightfv(GL_LIGHT1, GL_AMBIENT, (0.1, 0.1, 0.1, 1.0))
+def _render_locked(project: Any) -> Image.Image:
+    """Rumpf von `render_scene`; läuft unter ``_RENDER_LOCK``."""
+    try:
+        # ---------------- Kontext (einmal je Thread) + Viewport -------
+        _ensure_ctx()
+        glViewport(0, 0, _WIDTH, _HEIGHT)
 
         # Projektion & Kamera (isometrisch)
+        L = float(getattr(project, "container_length", 1.0))
+        W = float(getattr(project, "container_width", 1.0))
+        H = float(getattr(project, "container_height", 1.0))
+        dist = max(L, W, H) * 2.2
+
+        # Clip‑Ebenen relativ zur Kameradistanz (Szene in mm)
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
-        gluPerspective(45.0, _WIDTH / _HEIGHT, 0.1, 10_000.0)
+        gluPerspective(45.0, _WIDTH / _HEIGHT, dist * 0.05, dist * 4.0)
 
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
-
-        L = float(getattr(project, "container_length", 1.0))
-        W = float(getattr(project, "container_width", 1.0))
-        H = float(getattr(project, "container_height", 1.0))
-
-        dist = max(L, W, H) * 2.2
         gluLookAt(dist, dist, dist * 0.7, L / 2, W / 2, H / 2, 0, 0, 1)
 
         # ---------------- Szene zeichnen ------------------------------
@@ -239,37 +517,26 @@ def render_scene(project: Any) -> Image.Image:
         glColor4f(0.3, 0.3, 0.3, 0.5)
         _draw_wire_cube(L, W, H)
 
-        # Boxen
-        for box in getattr(project, "boxes", []):
-            try:
-                x = float(getattr(box, "x"))
-                y = float(getattr(box, "y"))
-                z = float(getattr(box, "z"))
-                dx = float(getattr(box, "length"))
-                dy = float(getattr(box, "width"))
-                dz = float(getattr(box, "height"))
-                hex_color = str(getattr(box, "color", "#808080"))
-            except Exception as exc:  # pragma: no cover
-                logger.error("Invalid box object: %s", exc, exc_info=True)
-                continue
-
-            r, g, b = _hex_to_rgb_f(hex_color)
-            glColor4f(r, g, b, 1.0)
-            _draw_box(x, y, z, dx, dy, dz)
+        # Boxen – Instanz‑Daten sammeln, dann ein einziger Draw‑Call
+        boxes = list(getattr(project, "boxes", []))
+        try:
+            geom = _box_geometry(boxes)
+        except (AttributeError, TypeError, ValueError):
+            # Langsamer Pfad nur bei ungültigen Objekten: diese überspringen
+            boxes = [b for b in boxes if _is_renderable(b)]
+            geom = _box_geometry(boxes)
+        instances = np.zeros(len(boxes), dtype=_INSTANCE_DTYPE)
+        if boxes:
+            instances["pos"] = geom[:, :3]
+            instances["size"] = geom[:, 3:]
+            hex_colors = [str(getattr(b, "color", "#808080")) for b in boxes]
+            instances["color"][:, :3] = _hex_batch_to_rgb_f(hex_colors)
+            instances["color"][:, 3] = 1.0
+        _draw_boxes_instanced(instances)
 
         # ---------------- Back‑Buffer auslesen ------------------------
-        pixels = glReadPixels(0, 0, _WIDTH, _HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE)
-        img = Image.frombuffer("RGBA", (_WIDTH, _HEIGHT), pixels, "raw", "RGBA", 0, 1)
-        img = img.transpose(Image.FLIP_TOP_BOTTOM)  # OpenGL‑Koordinaten → Bildkoordinaten
-        return img
+        return _read_back_image()
 
     except Exception:  # pragma: no cover
         logger.error("Render failed", exc_info=True)
         return _placeholder_image("Render error")
-
-    finally:  # OpenGL‑Kontext sauber schließen
-        try:
-            pygame.display.quit()
-            pygame.quit()
-        except Exception:  # pragma: no cover
-            pass
@@ -16,16 +16,20 @@ Zentraler 2‑D‑Canvas für Container‑ und Wartebereich‑Darstellung
 
 from __future__ import annotations
 
+import functools
 import math
-from typing import List, Optional, Tuple, Union
+import tempfile
+import weakref
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 from PySide6.QtCore import (
     QObject,
     QPointF,
     QRectF,
     Qt,
     QEvent,
-    QSize,
+    QTimer,
     Signal,
 )
 from PySide6.QtGui import (
@@ -37,28 +41,74 @@ from PySide6.QtGui import (
     QMouseEvent,
     QKeyEvent,
     QPainter,
+    QFont,
+    QFontMetrics,
     QImage,
+    QOpenGLContext,
+    QPixmap,
 )
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtWidgets import (
     QGraphicsItem,
     QGraphicsRectItem,
     QGraphicsScene,
-    QGraphicsSimpleTextItem,
     QGraphicsView,
 )
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Domain‑Model‑Imports (liegen in anderen Modulen des Projekts)
 # ────────────────────────────────────────────────────────────────────────────────
-from container_tool.core.collision import check_collisions  # type: ignore
+from container_tool.core.collision import BBoxArray, check_collisions, register  # type: ignore
 from container_tool.core.stack import create_stack  # type: ignore
 from container_tool.core.models import Box, Stack
 
+if TYPE_CHECKING:  # pragma: no cover – Pillow wird erst beim Export importiert
+    from PIL import Image
+
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Hilfsklassen
 # ────────────────────────────────────────────────────────────────────────────────
 _ZOOM_LEVELS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0)
+_ZOOM_INDEX: Dict[float, int] = {lv: i for i, lv in enumerate(_ZOOM_LEVELS)}
+
+# Kantenlänge (px) einer Render-Kachel in render_to_image: 4096² × 4 B = 64 MB
+_RENDER_TILE_PX: int = 4096
+# Anfangskapazität (Spalten) des SoA-Puffers der Box-Rechtecke; wächst per Verdopplung
+_SOA_INITIAL_CAPACITY: int = 64
+
+# Obergrenze (Pixel) des Gesamtbilds in render_to_image: 64 Mpx × 4 B = 256 MB
+_RENDER_MAX_PIXELS: int = 64 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """True, wenn sich ein OpenGL-Kontext erzeugen lässt (nicht z. B. unter „offscreen“)."""
+    return QOpenGLContext().create()
+
+
+# Punktgröße der Box-Beschriftung (Bildschirm-Pixel, unabhängig vom Zoom)
+_LABEL_FONT_PT: int = 9
+
+# Für alle Box-Items gleich – einmal anlegen statt je Item
+_ERROR_BRUSH = QBrush(QColor(255, 0, 0))
+_NO_PEN = QPen(Qt.NoPen)
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_pixmap(text: str, font_pt: int) -> QPixmap:
+    """Beschriftung einmalig in eine transparente Pixmap rendern (geteilt je Text)."""
+    font = QFont()
+    font.setPointSize(font_pt)
+    size = QFontMetrics(font).size(0, text)
+    pixmap = QPixmap(max(1, size.width()), max(1, size.height()))
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor(0, 0, 0))
+    painter.drawText(pixmap.rect(), Qt.AlignLeft | Qt.AlignTop, text)
+    painter.end()
+    return pixmap
 
 
 class BoxGraphicsItem(QGraphicsRectItem):
@@ -67,8 +117,11 @@ class BoxGraphicsItem(QGraphicsRectItem):
     __slots__ = (
         "_model",
         "_brush_normal",
-        "_brush_error",
-        "_text_item",
+        "_label_pixmap",
+        "_label_source",
+        "_label_scale",
+        "_label_target",
+        "_label_fits",
         "_colliding",
     )
 
@@ -83,22 +136,23 @@ class BoxGraphicsItem(QGraphicsRectItem):
 
         # Darstellung
         self._brush_normal = QBrush(color)
-        self._brush_error = QBrush(QColor(255, 0, 0))
         self.setBrush(self._brush_normal)
-        self.setPen(QPen(Qt.NoPen))
-
-        # Beschriftung
-        self._text_item = QGraphicsSimpleTextItem(self)
-        self._text_item.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+        self.setPen(_NO_PEN)
+
+        # Beschriftung (gecachte Pixmap, in paint() gezeichnet); _label_scale
+        # = Scene-Einheiten je Bildschirm-Pixel, gesetzt von Canvas2D je Zoom-Stufe
+        self._label_pixmap: QPixmap = QPixmap()
+        self._label_source: QRectF = QRectF()      # Pixmap-Rechteck, je Text einmal
+        self._label_scale: float = 1.0
+        self._label_target: QRectF = QRectF()
+        self._label_fits: bool = True
         self._update_label()
 
-        # Flags
-        self.setFlags(
-            QGraphicsItem.ItemIsSelectable
-            | QGraphicsItem.ItemIsMovable
-            | QGraphicsItem.ItemSendsGeometryChanges
-        )
-        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # Flags – ItemSendsGeometryChanges setzt Canvas2D nur während eines Drags
+        self.setFlags(QGraphicsItem.ItemIsSelectable | QGraphicsItem.ItemIsMovable)
+        # Kein Item-Cache: Füllung + Label sind billig, der Pixmap-Cache würde bei
+        # jedem Zoom-Schritt und jedem set_colliding() neu gerastert
+        self.setCacheMode(QGraphicsItem.NoCache)
 
     # --------------------------------------------------------------------- API --
 
@@ -109,33 +163,48 @@ class BoxGraphicsItem(QGraphicsRectItem):
     def set_colliding(self, value: bool) -> None:
         if self._colliding != value:
             self._colliding = value
-            self.setBrush(self._brush_error if value else self._brush_normal)
+            self.setBrush(_ERROR_BRUSH if value else self._brush_normal)
+
+    def set_label_scale(self, scene_per_px: float) -> None:
+        """Label-Größe an die (diskrete) Zoom-Stufe der View anpassen."""
+        if scene_per_px != self._label_scale:
+            self._label_scale = scene_per_px
+            self._layout_label()
+            self.update()
 
     # ----------------------------------------------------------- QGraphicsItem --
 
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        super().paint(painter, option, widget)
+        # Ziel-Rechteck ist je Zoom-Stufe vorberechnet: normaler transformierter
+        # Draw, kein Zurücksetzen der Painter-Transformation je Paint
+        if self._label_fits:
+            painter.drawPixmap(self._label_target, self._label_pixmap, self._label_source)
+            return
+        painter.save()
+        painter.setClipRect(self.rect())
+        painter.drawPixmap(self._label_target, self._label_pixmap, self._label_source)
+        painter.restore()
+
     def itemChange(self, change: "QGraphicsItem.GraphicsItemChange", value):
         if change == QGraphicsItem.ItemPositionHasChanged:
-            # Label zentrieren (da ItemIgnoresTransformations)
-            # --- NEU: Szene-Koordinaten ins Datenmodell spiegeln ---
-            new_x_mm = int(self.x())
-            new_y_mm = int(self.y())
-            if isinstance(self._model, Stack):
-                for b in self._model:      # alle Boxen des Stapels
-                    b.pos_x_mm = new_x_mm
-                    b.pos_y_mm = new_y_mm
-            else:                          # einzelne Box
-                self._model.pos_x_mm = new_x_mm
-                self._model.pos_y_mm = new_y_mm
-
-            # (Label zentrieren bleibt wie bisher)
-            rect = self.rect()
-
-            self._text_item.setPos(rect.width() / 2 - self._text_item.boundingRect().width() / 2,
-                                   rect.height() / 2 - self._text_item.boundingRect().height() / 2)
+            self._sync_model_pos()
         return super().itemChange(change, value)
 
     # ----------------------------------------------------------------- Helpers --
 
+    def _sync_model_pos(self) -> None:
+        """Szene-Koordinaten ins Datenmodell spiegeln."""
+        new_x_mm = int(self.x())
+        new_y_mm = int(self.y())
+        if isinstance(self._model, Stack):
+            for b in self._model:      # alle Boxen des Stapels
+                b.pos_x_mm = new_x_mm
+                b.pos_y_mm = new_y_mm
+        else:                          # einzelne Box
+            self._model.pos_x_mm = new_x_mm
+            self._model.pos_y_mm = new_y_mm
+
     def _update_label(self) -> None:
         if isinstance(self._model, Stack):
             line1 = f"{self._model.name}"
@@ -144,7 +213,27 @@ class BoxGraphicsItem(QGraphicsRectItem):
             line1 = f"{self._model.name}"
             line2 = f"{self._model.length_mm}×{self._model.width_mm}×{self._model.height_mm} mm"
 
-        self._text_item.setText(f"{line1}\n{line2}")
+        self._label_pixmap = _label_pixmap(f"{line1}\n{line2}", _LABEL_FONT_PT)
+        self._label_source = QRectF(self._label_pixmap.rect())
+        self._layout_label()
+        self.update()
+
+    def _layout_label(self) -> None:
+        """Zentriertes Label-Ziel (Item-Koordinaten) für den aktuellen Maßstab."""
+        rect = self.rect()
+        w = self._label_pixmap.width() * self._label_scale
+        h = self._label_pixmap.height() * self._label_scale
+        self._label_target = QRectF(rect.center().x() - w / 2, rect.center().y() - h / 2, w, h)
+        self._label_fits = rect.contains(self._label_target)
+
+
+class _ZoomBroker(QObject):
+    """Zentrale Weiche für zoomChanged: jede Canvas sendet hierher und hört hier zu."""
+
+    zoomChanged: Signal = Signal(float)
+
+
+_ZOOM_BROKER = _ZoomBroker()
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -162,7 +251,7 @@ class Canvas2D(QGraphicsView):
 
     # ---------------------------------------------------------------- Registry --
 
-    _instances: List["Canvas2D"] = []  # <— für Peer‑to‑Peer‑Zoom
+    _instances: "weakref.WeakSet[Canvas2D]" = weakref.WeakSet()  # <— für Peer‑to‑Peer‑Zoom
 
     # ---------------------------------------------------------------- Init / UI --
 
@@ -199,7 +288,11 @@ class Canvas2D(QGraphicsView):
             self._scene.setSceneRect(0, 0, 8000, 4000)
 
         # View‑Konfiguration
-        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        # GPU-Viewport (falls die Plattform OpenGL kann); SmartViewportUpdate
+        # statt Bounding-Rect-Vereinigung je Move
+        if _opengl_available():
+            self.setViewport(QOpenGLWidget())
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
         self.setRenderHint(QPainter.Antialiasing, False)
         self.setDragMode(QGraphicsView.NoDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -214,8 +307,42 @@ class Canvas2D(QGraphicsView):
 
         # Drag‑State
         self._drag_item: Optional[BoxGraphicsItem] = None
+        self._tracked_items: List[BoxGraphicsItem] = []   # mit ItemSendsGeometryChanges
         self._last_collision_pos: Optional[QPointF] = None
 
+        # Box-Items der Scene → Spalte im SoA-Puffer (Einfügereihenfolge des
+        # dict == Reihenfolge in to_box_models); erspart items()-Scans samt
+        # Label-Kindern. _row_items ist die Umkehrung (Spalte → Item).
+        self._box_items: dict[BoxGraphicsItem, int] = {}
+        self._row_items: List[BoxGraphicsItem] = []
+
+        # Scene-Rechtecke der Box-Items als SoA; nachgeführt bei
+        # add/remove/rotate/release. Die Zeilen x, y, w, h, z (zValue für die
+        # Trefferwahl) liegen in einem vorbelegten Puffer, der bei Bedarf
+        # verdoppelt wird – add_boxes bleibt so linear. _ax … _az sind Sichten
+        # auf die _n_rows belegten Spalten. Entfernen füllt die Lücke mit der
+        # letzten Spalte; _row_seq (Einfüge-Zähler je Spalte) hält daher die
+        # Stapelreihenfolge für die Trefferwahl fest.
+        self._rect_buf = np.empty((5, _SOA_INITIAL_CAPACITY), np.float32)
+        self._seq_buf = np.empty(_SOA_INITIAL_CAPACITY, np.int64)
+        self._next_seq = 0
+        self._n_rows = 0
+        self._set_row_views()
+
+        # Kollisions-Index der *übrigen* Items für das aktuelle Drag-Item:
+        # (moving, others, BBoxArray, id(model) -> Item); verworfen bei
+        # add/remove/rotate und zu Beginn/Ende jedes Drags
+        self._collision_cache: Optional[
+            Tuple[BoxGraphicsItem, List[BoxGraphicsItem], BBoxArray, Dict[int, BoxGraphicsItem]]
+        ] = None
+
+        # Live-Kollision gedrosselt: mouseMove startet nur den Timer, die
+        # Prüfung läuft höchstens einmal je Intervall (~60 Hz)
+        self._collision_timer = QTimer(self)
+        self._collision_timer.setSingleShot(True)
+        self._collision_timer.setInterval(16)
+        self._collision_timer.timeout.connect(self._on_collision_timer)
+
         # Peer‑Zoom‑Verdrahtung
         self._register_instance()
 
@@ -229,43 +356,86 @@ class Canvas2D(QGraphicsView):
 
     # ––– Objekt‑Erzeugung ------------------------------------------------------
 
-    def add_box(self, model: Union[Box, Stack], color: QColor = QColor(120, 170, 255)) -> BoxGraphicsItem:
+    def add_box(
+        self,
+        model: Union[Box, Stack],
+        color: QColor = QColor(120, 170, 255),
+        *,
+        _emit: bool = True,
+    ) -> BoxGraphicsItem:
         """Neues Box/Stack‑Item in der Scene erzeugen und zurückgeben."""
         item = BoxGraphicsItem(model, color)
         self._scene.addItem(item)
-        self.objectsChanged.emit(self.to_box_models())
+        item.set_label_scale(1.0 / self.transform().m11())
+        self._append_row(item)
+        self._collision_cache = None
+        if _emit:                 # add_boxes meldet gesammelt einmal am Ende
+            self.objectsChanged.emit(self.to_box_models())
         return item
 
     # ––– Persistenz ------------------------------------------------------------
 
+    def iter_box_models(self) -> Iterator[Union[Box, Stack]]:
+        """Die live Domain‑Models der Scene, ohne Kopie oder Dict‑Umweg."""
+        for itm in self._box_items:
+            yield itm.model
+
     def to_box_models(self) -> List[Union[Box, Stack]]:
         """Aktuellen Scene‑Inhalt als Domain‑Model‑Liste zurückgeben."""
-        models: List[Union[Box, Stack]] = []
-        for item in self._scene.items():
-            if isinstance(item, BoxGraphicsItem):
-                models.append(item.model)
-        return models
+        return list(self.iter_box_models())
 
     # ––– PDF‑Export ------------------------------------------------------------
 
-    def render_to_image(self, dpi: int = 300) -> QImage:
+    def render_to_image(self, dpi: int = 300) -> "Image.Image":
         """
         Szene off‑screen in ein Bitmap rendern (für PDF‑Export).
 
-        :param dpi: Ausgabeauflösung
+        Gerendert wird kachelweise (`_RENDER_TILE_PX`) in ein RGBA-Array, das
+        in einer temporären Datei liegt (``np.memmap``); der Arbeitsspeicher
+        wächst damit nur um eine Kachel, nicht um das ganze Bild. Das
+        zurückgegebene PIL-Bild teilt sich den Puffer mit dieser Datei.
+        Überschreitet das Bild `_RENDER_MAX_PIXELS`, wird die Auflösung
+        entsprechend gesenkt (8 × 4 m bei 300 dpi wären ~17 GB).
+
+        :param dpi: Ausgabeauflösung (Obergrenze, siehe oben)
         """
+        from PIL import Image
+
         mm_per_inch = 25.4
-        scene_sz_mm = self._scene.sceneRect().size()
-        img_size_px = QSize(
-            int(scene_sz_mm.width() / mm_per_inch * dpi),
-            int(scene_sz_mm.height() / mm_per_inch * dpi),
+        px_per_mm = dpi / mm_per_inch
+        scene_rect = self._scene.sceneRect()
+        area_px = scene_rect.width() * scene_rect.height() * px_per_mm * px_per_mm
+        if area_px > _RENDER_MAX_PIXELS:
+            px_per_mm *= math.sqrt(_RENDER_MAX_PIXELS / area_px)
+        width_px = max(1, int(scene_rect.width() * px_per_mm))
+        height_px = max(1, int(scene_rect.height() * px_per_mm))
+
+        pixels = np.memmap(tempfile.TemporaryFile(), dtype=np.uint8, mode="w+",
+                           shape=(height_px, width_px, 4))
+
+        tile_px = _RENDER_TILE_PX
+        tile = QImage(min(tile_px, width_px), min(tile_px, height_px),
+                      QImage.Format_RGBA8888_Premultiplied)  # Byte-Reihenfolge == PIL „RGBA“
+        tile_view = np.frombuffer(tile.bits(), np.uint8).reshape(
+            tile.height(), tile.bytesPerLine() // 4, 4
         )
-        image = QImage(img_size_px, QImage.Format_ARGB32_Premultiplied)
-        image.fill(Qt.white)
-        painter = QPainter(image)
-        self._scene.render(painter)
-        painter.end()
-        return image
+        for y0 in range(0, height_px, tile_px):
+            th = min(tile_px, height_px - y0)
+            for x0 in range(0, width_px, tile_px):
+                tw = min(tile_px, width_px - x0)
+                tile.fill(Qt.white)
+                painter = QPainter(tile)
+                self._scene.render(
+                    painter,
+                    QRectF(0, 0, tw, th),
+                    QRectF(scene_rect.x() + x0 / px_per_mm, scene_rect.y() + y0 / px_per_mm,
+                           tw / px_per_mm, th / px_per_mm),
+                    Qt.IgnoreAspectRatio,
+                )
+                painter.end()
+                pixels[y0:y0 + th, x0:x0 + tw] = tile_view[:th, :tw]
+
+        return Image.frombuffer("RGBA", (width_px, height_px), pixels, "raw", "RGBA", 0, 1)
 
     # ----------------------------------------------------------------- Events --
 
@@ -284,11 +454,7 @@ class Canvas2D(QGraphicsView):
                 return  # keine Änderung
 
             new_level = _ZOOM_LEVELS[new_idx]
-            old_level = _ZOOM_LEVELS[self._zoom_level_index]
-            factor = new_level / old_level
-
-            self.scale(factor, factor)
-            self._zoom_level_index = new_idx
+            self._set_zoom_index(new_idx)
             # Peer‑Notify
             self.zoomChanged.emit(new_level)
             event.accept()
@@ -299,10 +465,19 @@ class Canvas2D(QGraphicsView):
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.LeftButton:
-            item = self.itemAt(event.pos())
-            if isinstance(item, BoxGraphicsItem):
+            item = self._box_item_at(self.mapToScene(event.pos()))
+            if item is not None:
                 self._drag_item = item
                 self._last_collision_pos = item.pos()
+                self._collision_cache = None
+                # Positionen nur während des Drags ins Modell spiegeln (inkl.
+                # mitgezogener Auswahl)
+                self._tracked_items = [item] + [
+                    itm for itm in self._scene.selectedItems()
+                    if isinstance(itm, BoxGraphicsItem) and itm is not item
+                ]
+                for itm in self._tracked_items:
+                    itm.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
                 self.setCursor(Qt.ClosedHandCursor)
         super().mousePressEvent(event)
 
@@ -320,7 +495,8 @@ class Canvas2D(QGraphicsView):
                 >= 2 * view_px_per_scene
             ):
                 self._last_collision_pos = pos_scene
-                self._run_live_collision_check(self._drag_item)
+                if not self._collision_timer.isActive():
+                    self._collision_timer.start()
 
         else:
             super().mouseMoveEvent(event)
@@ -328,8 +504,18 @@ class Canvas2D(QGraphicsView):
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if self._drag_item:
             self.setCursor(Qt.ArrowCursor)
+            self._collision_timer.stop()          # End-Check läuft direkt
+            for itm in self._tracked_items:
+                itm.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
+            self._tracked_items = []
             # End‑Collision / Out‑Of‑Bounds
             blockers = self._run_live_collision_check(self._drag_item)
+            self._collision_cache = None
+            # Qt zieht selektierte Items mit – deren Zeilen ebenfalls nachführen
+            self._sync_row(self._drag_item)
+            for itm in self._scene.selectedItems():
+                if isinstance(itm, BoxGraphicsItem) and itm is not self._drag_item:
+                    self._sync_row(itm)
 
             # Snap / Stapel
             if not blockers:
@@ -360,25 +546,27 @@ class Canvas2D(QGraphicsView):
     # ––– Collision -------------------------------------------------------------
 
     def _run_live_collision_check(self, moving: BoxGraphicsItem) -> List[BoxGraphicsItem]:
-        """Prüft aktuelle Position des Drag‑Items gegen alle anderen."""
-        others: List[BoxGraphicsItem] = [
-            itm
-            for itm in self._scene.items()
-            if isinstance(itm, BoxGraphicsItem) and itm is not moving
-        ]
-        moving_rect_mm = self._item_rect_mm(moving)
-        blocker_models = []
-        for itm in others:
-            ok, _ = check_collisions(               # richtiger Aufruf
+        """Prüft aktuelle Position des Drag‑Items gegen alle anderen.
+
+        Ein einziger `check_collisions`-Aufruf gegen das gecachte `BBoxArray`
+        der übrigen Items; nur echte Überlappungen kommen zurück.
+        """
+        others, index, item_by_model = self._collision_index(moving)
+        blocker_models: List[BoxGraphicsItem] = []
+        if others:
+            _, hits = check_collisions(
                 candidate=moving.model,
-                placed=[itm.model],                 # Liste statt Einzelobjekt
+                placed=index,
                 container=self._container_ref,      # kann None sein (Wartebereich)
             )
-            if not ok:                              # Kollision → Item rot markieren
-                itm.set_colliding(True)
-                blocker_models.append(itm)
+            if any(h is moving.model or isinstance(h, str) for h in hits):
+                # Grenz-/Türhöhen-Verletzung: wie bisher blockiert dann jedes Item
+                blocker_models = others
             else:
-                itm.set_colliding(False)
+                blocker_models = [item_by_model[id(h)] for h in hits]
+            blocking = set(blocker_models)
+            for itm in others:                      # Kollision → Item rot markieren
+                itm.set_colliding(itm in blocking)
 
         moving.set_colliding(bool(blocker_models))
 
@@ -386,25 +574,46 @@ class Canvas2D(QGraphicsView):
             self.collisionOccurred.emit(moving.model, [b.model for b in blocker_models])
         return blocker_models
 
+    def _on_collision_timer(self) -> None:
+        if self._drag_item is not None:
+            self._run_live_collision_check(self._drag_item)
+
+    def _collision_index(
+        self, moving: BoxGraphicsItem
+    ) -> Tuple[List[BoxGraphicsItem], BBoxArray, Dict[int, BoxGraphicsItem]]:
+        """Übrige Items samt `BBoxArray` für *moving* (gecacht während eines Drags)."""
+        cache = self._collision_cache
+        if cache is not None and cache[0] is moving:
+            return cache[1], cache[2], cache[3]
+
+        others = [itm for itm in self._box_items if itm is not moving]
+        index = register([itm.model for itm in others])
+        item_by_model = {id(itm.model): itm for itm in others}
+        # Mehrfachauswahl: Qt zieht selektierte Items mit – deren Positionen
+        # ändern sich dann während des Drags, der Index wäre sofort veraltet.
+        if not any(itm.isSelected() for itm in others):
+            self._collision_cache = (moving, others, index, item_by_model)
+        return others, index, item_by_model
+
     # ––– Stapel‑Snap -----------------------------------------------------------
 
     def _attempt_stack_snap(self, moving: BoxGraphicsItem) -> bool:
+        """Nächstes Item gleicher Grundfläche (Mittelpunkt ≤ 10 mm) per SoA-Suche."""
         tolerance_mm = 10.0
-        best_target: Optional[BoxGraphicsItem] = None
-        best_dist = tolerance_mm + 1.0
-
-        for itm in self._scene.items():
-            if not isinstance(itm, BoxGraphicsItem) or itm is moving:
-                continue
-            if not self._same_footprint(itm.model, moving.model):
-                continue
-            dist = self._center_distance_mm(itm, moving)
-            if dist <= tolerance_mm and dist < best_dist:
-                best_dist = dist
-                best_target = itm
-
-        if best_target is None:
+        row = self._box_items[moving]
+        ax, ay, aw, ah = self._ax, self._ay, self._aw, self._ah
+        mw, mh = aw[row], ah[row]
+
+        # Grundfläche gleich – unabhängig von der Drehung
+        mask = ((aw == mw) & (ah == mh)) | ((aw == mh) & (ah == mw))
+        mask[row] = False
+        dx = (ax + aw * 0.5) - (ax[row] + mw * 0.5)
+        dy = (ay + ah * 0.5) - (ay[row] + mh * 0.5)
+        d2 = np.where(mask, dx * dx + dy * dy, np.inf)
+        best = int(np.argmin(d2))
+        if not d2[best] <= tolerance_mm * tolerance_mm:
             return False
+        best_target = self._row_items[best]
 
         # Stack erzeugen
         new_stack = create_stack(
@@ -414,10 +623,12 @@ class Canvas2D(QGraphicsView):
 
         # Alte Items entfernen & neues an Ziel‑Pos einfügen
         pos = best_target.pos()
-        self._scene.removeItem(best_target)
-        self._scene.removeItem(moving)
+        self._remove_box_item(best_target)
+        self._remove_box_item(moving)
         new_item = self.add_box(new_stack, QColor(150, 220, 100))
         new_item.setPos(pos)
+        new_item._sync_model_pos()
+        self._sync_row(new_item)
         self.stackCreated.emit(new_stack)
         return True
 
@@ -426,9 +637,11 @@ class Canvas2D(QGraphicsView):
     def _rotate_box_item(self, item: BoxGraphicsItem) -> None:
         # Domain‑Modell drehen
         item.model.rotate()  # type: ignore[attr-defined]
+        self._collision_cache = None
         # Geometrie anpassen
         rect = item.rect()
         item.setRect(0, 0, rect.height(), rect.width())
+        self._sync_row(item)
         # Label / Collision‑Check
         item._update_label()
         self._run_live_collision_check(item)
@@ -438,49 +651,90 @@ class Canvas2D(QGraphicsView):
     # ––– Peer‑Zoom‑Weiche ------------------------------------------------------
 
     def _register_instance(self) -> None:
-        for peer in Canvas2D._instances:
-            # bidirektionale Verbindungen
-            self.zoomChanged.connect(peer._apply_external_zoom)
-            peer.zoomChanged.connect(self._apply_external_zoom)
-        Canvas2D._instances.append(self)
+        # Stern statt Vollvernetzung: Canvas → Broker → alle Canvas (O(P))
+        self.zoomChanged.connect(_ZOOM_BROKER.zoomChanged)
+        _ZOOM_BROKER.zoomChanged.connect(self._apply_external_zoom)
+        Canvas2D._instances.add(self)
 
     def _unregister_instance(self) -> None:
-        if self in Canvas2D._instances:
-            Canvas2D._instances.remove(self)
-        for peer in Canvas2D._instances:
+        if self not in Canvas2D._instances:
+            return                                  # bereits abgemeldet
+        Canvas2D._instances.discard(self)
+        for signal, slot in (
+            (self.zoomChanged, _ZOOM_BROKER.zoomChanged),
+            (_ZOOM_BROKER.zoomChanged, self._apply_external_zoom),
+        ):
             try:
-                self.zoomChanged.disconnect(peer._apply_external_zoom)
-            except (TypeError, RuntimeError):
-                pass
-            try:
-                peer.zoomChanged.disconnect(self._apply_external_zoom)
+                signal.disconnect(slot)
             except (TypeError, RuntimeError):
                 pass
 
     def _apply_external_zoom(self, factor: float) -> None:
         """Reagiert auf zoomChanged‑Signale anderer Canvas‑Instanzen."""
-        try:
-            idx = _ZOOM_LEVELS.index(factor)
-        except ValueError:
+        idx = _ZOOM_INDEX.get(factor)
+        if idx is None or idx == self._zoom_level_index:
             return
-        if idx == self._zoom_level_index:
-            return
-        old_level = _ZOOM_LEVELS[self._zoom_level_index]
-        scale_factor = factor / old_level
-        self.scale(scale_factor, scale_factor)
+        self._set_zoom_index(idx)
+
+    def _set_zoom_index(self, idx: int) -> None:
+        """Zoom-Stufe absolut setzen (kein Aufmultiplizieren von Rundungsfehlern)."""
+        scale = self._base_scale_px_per_mm * _ZOOM_LEVELS[idx]
+        self.setTransform(QTransform.fromScale(scale, scale))
         self._zoom_level_index = idx
+        self._on_zoom_changed()
 
-    # ––– Geometrie‑Hilfen ------------------------------------------------------
+    def _on_zoom_changed(self) -> None:
+        """Labels aller Items einmal je Zoom-Stufe neu skalieren."""
+        scene_per_px = 1.0 / self.transform().m11()
+        for itm in self._box_items:
+            itm.set_label_scale(scene_per_px)
 
-    @staticmethod
-    def _same_footprint(a: Union[Box, Stack], b: Union[Box, Stack]) -> bool:
-        return {a.length_mm, a.width_mm} == {b.length_mm, b.width_mm}
+    # ––– Geometrie‑Hilfen ------------------------------------------------------
 
-    @staticmethod
-    def _center_distance_mm(a_item: BoxGraphicsItem, b_item: BoxGraphicsItem) -> float:
-        a_center = a_item.mapToScene(a_item.rect().center())
-        b_center = b_item.mapToScene(b_item.rect().center())
-        return math.hypot(a_center.x() - b_center.x(), a_center.y() - b_center.y())
+    def _set_row_views(self) -> None:
+        """`_ax` … `_az`/`_row_seq` auf die belegten Spalten der Puffer setzen."""
+        n = self._n_rows
+        self._ax, self._ay, self._aw, self._ah, self._az = self._rect_buf[:, :n]
+        self._row_seq = self._seq_buf[:n]
+
+    def _append_row(self, item: BoxGraphicsItem) -> None:
+        n = self._n_rows
+        if n == self._rect_buf.shape[1]:          # voll → Kapazität verdoppeln
+            grown = np.empty((5, max(2 * n, _SOA_INITIAL_CAPACITY)), np.float32)
+            grown[:, :n] = self._rect_buf[:, :n]
+            self._rect_buf = grown
+            seq = np.empty(grown.shape[1], np.int64)
+            seq[:n] = self._seq_buf[:n]
+            self._seq_buf = seq
+        rect = item.rect()
+        self._rect_buf[:, n] = (item.x(), item.y(), rect.width(), rect.height(), item.zValue())
+        self._seq_buf[n] = self._next_seq
+        self._next_seq += 1
+        self._box_items[item] = n
+        self._row_items.append(item)
+        self._n_rows = n + 1
+        self._set_row_views()
+
+    def _box_item_at(self, scene_pos: QPointF) -> Optional[BoxGraphicsItem]:
+        """Oberstes Box-Item unter *scene_pos* per SoA-Vergleich (statt ``itemAt``)."""
+        x, y = scene_pos.x(), scene_pos.y()
+        ax, ay = self._ax, self._ay
+        hits = np.flatnonzero(
+            (ax <= x) & (x < ax + self._aw) & (ay <= y) & (y < ay + self._ah)
+        )
+        if hits.size == 0:
+            return None
+        # höchster zValue; bei Gleichstand liegt das zuletzt eingefügte oben
+        z = self._az[hits]
+        top = hits[z == z.max()]
+        best = top[np.argmax(self._row_seq[top])]
+        return self._row_items[best]
+
+    def _sync_row(self, item: BoxGraphicsItem) -> None:
+        """SoA-Zeile von *item* nach Verschieben/Drehen aktualisieren."""
+        row = self._box_items[item]
+        rect = item.rect()
+        self._rect_buf[:, row] = (item.x(), item.y(), rect.width(), rect.height(), item.zValue())
 
     @staticmethod
     def _item_rect_mm(item: BoxGraphicsItem) -> QRectF:
@@ -488,13 +742,37 @@ class Canvas2D(QGraphicsView):
 
     def has_boxes(self) -> bool:
         """Gibt *True* zurück, sobald mindestens ein Box‑Element existiert."""
-        return any(isinstance(itm, BoxGraphicsItem) for itm in self._scene.items())
+        return bool(self._box_items)
+
+    def _remove_box_item(self, item: BoxGraphicsItem) -> None:
+        """Box-Item aus Scene *und* Item-Registry entfernen."""
+        self._scene.removeItem(item)
+        row = self._box_items.pop(item, None)
+        if row is not None:
+            last = self._n_rows - 1
+            if row != last:                        # letzte Spalte in die Lücke
+                moved = self._row_items[last]
+                self._rect_buf[:, row] = self._rect_buf[:, last]
+                self._seq_buf[row] = self._seq_buf[last]
+                self._row_items[row] = moved
+                self._box_items[moved] = row
+            self._row_items.pop()
+            self._n_rows = last
+            self._set_row_views()
+        self._collision_cache = None
 
     def clear_boxes(self) -> None:
-        """Entfernt alle Box‑ bzw. Stack‑Grafiken aus der Szene."""
-        for itm in list(self._scene.items()):
-            if isinstance(itm, BoxGraphicsItem):
-                self._scene.removeItem(itm)
+        """Entfernt alle Box- bzw. Stack-Grafiken aus der Szene."""
+        # Registry und SoA einmal leeren statt je Item zu entfernen (O(N²));
+        # scene.clear() ginge nicht, es nähme den Container-Rahmen mit
+        remove = self._scene.removeItem
+        for itm in self._box_items:
+            remove(itm)
+        self._box_items.clear()
+        self._row_items.clear()
+        self._n_rows = 0                           # Kapazität bleibt erhalten
+        self._set_row_views()
+        self._collision_cache = None
         self.objectsChanged.emit([])
 
     def add_boxes(
@@ -503,13 +781,13 @@ class Canvas2D(QGraphicsView):
         color: QColor = QColor(120, 170, 255),
     ):
         """Fügt mehrere Modelle auf einmal hinzu und liefert ihre Grafik‑Objekte."""
-        items = [self.add_box(m, color) for m in models]
+        items = [self.add_box(m, color, _emit=False) for m in models]
         self.objectsChanged.emit(self.to_box_models())
         return items
 
     def serialize(self) -> List[dict]:
         """Wandelt alle derzeit sichtbaren Modelle in Dictionaries um."""
-        return [m.to_dict() for m in self.to_box_models()]
+        return [m.to_dict() for m in self.iter_box_models()]
 
     def set_container_type(self, container_name: str) -> None:
         """
@@ -523,5 +801,10 @@ class Canvas2D(QGraphicsView):
                 new_rect = QRectF(0, 0, ct.inner_length_mm, ct.inner_width_mm)
                 self._scene.setSceneRect(new_rect)     # Szene vergrößern / verkleinern
                 self.fitInView(new_rect, Qt.KeepAspectRatio)  # Ansicht anpassen
+                # eingepasster Maßstab gilt als Basis der aktuellen Zoom-Stufe
+                self._base_scale_px_per_mm = (
+                    self.transform().m11() / _ZOOM_LEVELS[self._zoom_level_index]
+                )
+                self._on_zoom_changed()
                 return
         raise ValueError(f"Containertyp {container_name!r} unbekannt")
@@ -1,12 +1,13 @@
 """
 table_widget.py
 ~~~~~~~~~~~~~~~~
-QTableWidget‑basiertes Eingabe‑Widget zum Erfassen von Box‑ bzw. Stack‑Daten
-für das Container‑Tool‑Projekt.
+QTableView‑basiertes Eingabe‑Widget zum Erfassen von Box‑ bzw. Stack‑Daten
+für das Container‑Tool‑Projekt. Die Zeilen liegen als ``BoxRow``‑Objekte in
+einem ``QAbstractTableModel`` (ein Python‑Objekt je Zeile statt je Zelle).
 
 * Spalten:  Name | Menge | L | B | H | Gewicht | Farbe
 * Jede Zeile wird per externem “+‑Button” (MainWindow) über ``add_row`` ergänzt.
-* Sofortige Eingabe‑Validierung: ungültige Zellen werden rot markiert.
+* Eingabe‑Validierung per Spalten‑Delegate; noch ungültige Zellen werden rot markiert.
 * Farben‑Button wechselt bei Klick zur nächsten unverbrauchten Farbe.
 * Kontextmenü (Rechtsklick) **und** Delete/Backspace‑Shortcut löschen Zeilen.
 * ``read_boxes`` gibt eine Liste ``Box``‑ oder ``Stack``‑Objekte zurück.
@@ -23,73 +24,209 @@ für das Container‑Tool‑Projekt.
 
 from __future__ import annotations
 
-import itertools
 import random
-from typing import List, Set, Tuple
-
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QColor, QBrush
+import re
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QLocale,
+    QModelIndex,
+    QRegularExpression,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QBrush,
+    QIcon,
+    QIntValidator,
+    QPixmap,
+    QRegularExpressionValidator,
+    QValidator,
+)
 from PySide6.QtWidgets import (
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QHeaderView,
+    QLineEdit,
     QMenu,
+    QStyledItemDelegate,
 )
 
-# ---------------------------------------------------------------------------
-# Externe Datenmodelle (gem. Projektplan) – Fallback für Autocompletion
-# ---------------------------------------------------------------------------
-try:
-    from container_tool.core.models import Box, Stack
-except ModuleNotFoundError:  # pragma: no cover
-    class Box:  # Minimal‑Stub
-        def __init__(
-            self,
-            name,
-            length_mm,
-            width_mm,
-            height_mm,
-            weight_kg,
-            color_hex,
-            pos: Tuple[int, int] = (0, 0),
-            rotation_deg: int = 0,
-        ):
-            self.name = name
-            self.length_mm = length_mm
-            self.width_mm = width_mm
-            self.height_mm = height_mm
-            self.weight_kg = weight_kg
-            self.color_hex = color_hex
-            self.pos = pos
-            self.rotation_deg = rotation_deg
-
-    class Stack(Box):  # pragma: no cover
-        """Repräsentiert gestapelte Boxen (height_mm skaliert mit Menge)."""
-
-        def __init__(self, name: str, _boxes: List[Box]):
-            total_height = sum(b.height_mm for b in _boxes)
-            first = _boxes[0]
-            super().__init__(
-                name=name,
-                length_mm=first.length_mm,
-                width_mm=first.width_mm,
-                height_mm=total_height,
-                weight_kg=sum(b.weight_kg for b in _boxes),
-                color_hex=first.color_hex,
-            )
-            self.boxes = _boxes
+from container_tool.core.models import Box, Stack
 
 
 # ---------------------------------------------------------------------------
 
 
+class BoxColumns(NamedTuple):
+    """Spaltenweise (SoA) Sicht auf alle Einzelboxen der gültigen Zeilen."""
+
+    names: List[str]
+    lengths: np.ndarray  # int32, mm
+    widths: np.ndarray  # int32, mm
+    heights: np.ndarray  # int32, mm
+    weights: np.ndarray  # float64, kg
+    colors: List[str]
+
+
+# Eine gültige Tabellenzeile: (name, qty, l, b, h, gewicht, farbe)
+_RowData = Tuple[str, int, int, int, int, float, str]
+
+
+@dataclass(slots=True)
+class BoxRow:
+    """Eine Tabellenzeile; ``None`` = (noch) nicht ausgefüllt."""
+
+    name: str = ""
+    qty: Optional[int] = 1
+    length_mm: Optional[int] = None
+    width_mm: Optional[int] = None
+    height_mm: Optional[int] = None
+    weight_kg: Optional[float] = None  # leer = 0 kg
+    color_hex: str = "#000000"
+
+
+_ROW_VALUES = attrgetter(
+    "name", "qty", "length_mm", "width_mm", "height_mm", "weight_kg", "color_hex"
+)
+
+
+class _BoxTableModel(QAbstractTableModel):
+    """
+    Tabellen‑Modell über einer Liste ``BoxRow``.
+
+    ``setData`` parst und prüft den Text: ungültige Eingaben werden
+    abgelehnt (``False``), leere Pflichtfelder bleiben ``None`` und werden per
+    ``BackgroundRole`` rot hinterlegt.
+    """
+
+    HEADERS = ["Name", "Menge", "L", "B", "H", "Gewicht", "Farbe"]
+    # Spalte → BoxRow‑Feld (ohne Farbspalte, die ist nicht editierbar)
+    _FIELDS = ("name", "qty", "length_mm", "width_mm", "height_mm", "weight_kg")
+    _INT_FIELDS = frozenset(("qty", "length_mm", "width_mm", "height_mm"))
+
+    # Validierung: vorkompilierte Prädikate (ASCII, damit int()/float()
+    # sicher greifen) und geteilter Hintergrund für fehlende Werte
+    _POSINT_RE = re.compile(r"^\+?0*[1-9]\d*$", re.ASCII)
+    POSINT_MAX = 10_000_000
+    WEIGHT_RE = re.compile(r"^\d+(?:\.\d{1,2})?$", re.ASCII)
+    _INVALID_BRUSH = QBrush(QColor("#ffe6e6"))
+
+    _EDITABLE = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    _READONLY = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.rows: List[BoxRow] = []
+
+    # ---------- Qt‑Modell‑API ---------- #
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802 – Qt Signature
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802 – Qt Signature
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # noqa: N802
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if index.column() < len(self._FIELDS):
+            return self._EDITABLE
+        return self._READONLY
+
+    def data(self, index, role=Qt.DisplayRole):
+        col = index.column()
+        if col >= len(self._FIELDS):
+            return None
+        value = getattr(self.rows[index.row()], self._FIELDS[col])
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if value is None:
+                return ""
+            return format(value, "g") if isinstance(value, float) else str(value)
+        if role == Qt.BackgroundRole and (value is None or value == ""):
+            if self._FIELDS[col] != "weight_kg":
+                return self._INVALID_BRUSH
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:  # noqa: N802
+        col = index.column()
+        if role != Qt.EditRole or col >= len(self._FIELDS):
+            return False
+        field = self._FIELDS[col]
+        ok, parsed = self._parse(field, str(value).strip())
+        if not ok:
+            return False
+        row = self.rows[index.row()]
+        if getattr(row, field) != parsed:  # unverändert → kein dataChanged
+            setattr(row, field, parsed)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+        return True
+
+    # ---------- Zeilen ---------- #
+    def append_row(self, row: BoxRow) -> int:
+        pos = len(self.rows)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self.rows.append(row)
+        self.endInsertRows()
+        return pos
+
+    def remove_rows(self, rows: Set[int]) -> List[BoxRow]:
+        """Entfernt *rows* (blockweise, von hinten); liefert die entfernten Zeilen."""
+        removed: List[BoxRow] = []
+        ordered = sorted(rows, reverse=True)
+        k = 0
+        while k < len(ordered):
+            last = first = ordered[k]
+            while k + 1 < len(ordered) and ordered[k + 1] == first - 1:
+                k += 1
+                first -= 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self.rows[first:last + 1])
+            del self.rows[first:last + 1]
+            self.endRemoveRows()
+            k += 1
+        return removed
+
+    # ---------- Parsen ---------- #
+    def _parse(self, field: str, text: str) -> Tuple[bool, object]:
+        """(gültig, Wert) für *text* in Spalte *field*; leer → ``None``/``""``."""
+        if field == "name":
+            return True, text
+        if not text:
+            return True, None
+        if field in self._INT_FIELDS:
+            if self._POSINT_RE.match(text) is None:
+                return False, None
+            value = int(text)
+            return value <= self.POSINT_MAX, value
+        # Gewicht: nicht‑negativ mit höchstens zwei Nachkommastellen
+        if self.WEIGHT_RE.match(text) is None:
+            return False, None
+        return True, float(text)
+
+
 class _ColorButton(QPushButton):
     """Kleiner, vollflächig gefärbter Button, speichert seine Hex‑Farbe."""
 
+    # Farbfläche je Hex einmal gerendert, für alle Buttons geteilt
+    _PIXMAP_CACHE: Dict[str, QPixmap] = {}
+    _ICON_SIZE = QSize(20, 20)
+
     def __init__(self, color_hex: str, parent=None):
         super().__init__(parent)
         self.setFixedSize(QSize(24, 24))
+        # Stylesheet nur einmal; der Farbwechsel tauscht lediglich das Icon
+        self.setStyleSheet("border: 1px solid #555;")
+        self.setIconSize(self._ICON_SIZE)
         self.set_color(color_hex)
 
     @property
@@ -98,10 +235,33 @@ class _ColorButton(QPushButton):
 
     def set_color(self, color_hex: str) -> None:
         self._color_hex = color_hex
-        self.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #555;")
+        pixmap = self._PIXMAP_CACHE.get(color_hex)
+        if pixmap is None:
+            pixmap = QPixmap(self._ICON_SIZE)
+            pixmap.fill(QColor(color_hex))
+            self._PIXMAP_CACHE[color_hex] = pixmap
+        self.setIcon(QIcon(pixmap))
 
 
-class TableWidget(QTableWidget):
+class _ValidatingDelegate(QStyledItemDelegate):
+    """Editor mit Qt‑Validator: ungültige Eingaben werden nie übernommen.
+
+    Die Prüfung läuft je Tastendruck im Validator (C++); erst der fertige
+    Wert erreicht ``_BoxTableModel.setData``.
+    """
+
+    def __init__(self, parent, validator: QValidator) -> None:
+        super().__init__(parent)
+        self._validator = validator
+        validator.setParent(self)
+
+    def createEditor(self, parent, option, index):  # noqa: D401 – Qt Signature
+        editor = QLineEdit(parent)
+        editor.setValidator(self._validator)
+        return editor
+
+
+class TableWidget(QTableView):
     """
     Komfortables Tabellen‑Widget zur Eingabe von Box‑Daten.
 
@@ -110,6 +270,7 @@ class TableWidget(QTableWidget):
     add_row()                – Neue Zeile anhängen.
     remove_selected_rows()   – Markierte Zeilen löschen.
     read_boxes(stacked=True) – Liste Box/Stack‑Objekte erzeugen.
+    read_boxes_soa()         – Dieselben Boxen als Spalten‑Arrays.
     emit_boxes(stacked)      – Signal mit erzeugten Objekten senden.
     boxes_created            – Qt‑Signal(list)
     """
@@ -137,97 +298,100 @@ class TableWidget(QTableWidget):
         "#AA4499",
         "#DDDDDD",
     ]
+    _PALETTE_INDEX: dict[str, int] = {c: i for i, c in enumerate(_PALETTE)}
 
     # ------------------------------------------------------------------ #
     # Konstruktor / Setup
     # ------------------------------------------------------------------ #
     def __init__(self, parent=None) -> None:
-        super().__init__(0, 7, parent)
+        super().__init__(parent)
+        self._model = _BoxTableModel(self)
+        self.setModel(self._model)
         self._used_colors: Set[str] = set()
-        self._invalid_cells: Set[Tuple[int, int]] = set()
+        # freie Palettenfarben als Liste (random.choice) + Position je Farbe,
+        # damit Vergeben/Freigeben per Swap-Remove in O(1) bleibt
+        self._free_colors: List[str] = list(self._PALETTE)
+        self._free_index: Dict[str, int] = {c: i for i, c in enumerate(self._free_colors)}
 
         self._init_ui()
-        self.itemChanged.connect(self._validate_item)
 
     # ------------------------------------------------------------------ #
     # Öffentliche Methoden
     # ------------------------------------------------------------------ #
     def add_row(self) -> None:
         """Extern aufrufen: fügt eine neue Eingabe‑Zeile an."""
-        row = self.rowCount()
-        self.insertRow(row)
-
-        defaults = ["", "1", "", "", "", "", ""]  # Menge default = 1
-        for col, value in enumerate(defaults):
-            item = QTableWidgetItem(value)
-            item.setFlags(item.flags() | Qt.ItemIsEditable)
-            self.setItem(row, col, item)
-
-        # Farbe vergeben
         color_hex = self._assign_unique_color()
-        btn = _ColorButton(color_hex)
-        btn.clicked.connect(lambda _, r=row: self._cycle_color(r))
-        self.setCellWidget(row, self.COL_COLOR, btn)
+        row = self._model.append_row(BoxRow(color_hex=color_hex))
 
-        # Gleich prüfen
-        for col in range(self.columnCount() - 1):
-            self._validate_cell(row, col)
+        btn = _ColorButton(color_hex)
+        btn.clicked.connect(self._on_color_clicked)
+        self.setIndexWidget(self._model.index(row, self.COL_COLOR), btn)
 
     def remove_selected_rows(self) -> None:
         """Löscht alle markierten Zeilen (Kontextmenü / DEL)."""
-        rows = {idx.row() for idx in self.selectedIndexes()}
+        rows = {idx.row() for idx in self.selectionModel().selectedRows()}
         if not rows:
             return
 
-        for row in sorted(rows, reverse=True):
-            btn = self.cellWidget(row, self.COL_COLOR)
-            if isinstance(btn, _ColorButton):
-                self._used_colors.discard(btn.color_hex)
-            self.removeRow(row)
+        # Index-Widgets (Farb-Buttons) entfernt die View mit ihren Zeilen
+        for box_row in self._model.remove_rows(rows):
+            self._release_color(box_row.color_hex)
 
     def read_boxes(self, *, stacked: bool = False) -> List[Box]:
         """Erzeugt Box‑ oder Stack‑Objekte aus *gültigen* Zeilen."""
-        boxes: list[Box] = []
-        for row in range(self.rowCount()):
-            if any((row, c) in self._invalid_cells for c in range(self.columnCount())):
-                continue  # ungültige Zeile überspringen
-
-            name = (self.item(row, self.COL_NAME).text() or f"Box_{row+1}").strip()
-            qty = int(self.item(row, self.COL_QTY).text())
-            l_mm = int(self.item(row, self.COL_L).text())
-            w_mm = int(self.item(row, self.COL_W).text())
-            h_mm = int(self.item(row, self.COL_H).text())
-            weight_txt = self.item(row, self.COL_WEIGHT).text().strip()
-            weight_kg = float(weight_txt) if weight_txt else 0.0
-            color_hex = self._color_at_row(row)
-
+        rows = list(self._iter_valid_rows())
+        # ungestapelt: Ergebnisliste einmal in Endgröße anlegen, dann füllen
+        boxes: list = [None] * (len(rows) if stacked else sum(r[1] for r in rows))
+        k = 0
+        for name, qty, l_mm, w_mm, h_mm, weight_kg, color_hex in rows:
+            # Je Zeile eine Box validieren, die übrigen als Kopien (s. Box._clones)
+            proto = Box(
+                name=f"{name}_1" if stacked or qty > 1 else name,
+                length_mm=l_mm,
+                width_mm=w_mm,
+                height_mm=h_mm,
+                weight_kg=weight_kg,
+                color_hex=color_hex,
+            )
+            clones = proto._clones(f"{name}_{i+1}" for i in range(1, qty))
             if stacked:
-                singles = [
-                    Box(
-                        name=f"{name}_{i+1}",
-                        length_mm=l_mm,
-                        width_mm=w_mm,
-                        height_mm=h_mm,
-                        weight_kg=weight_kg,
-                        color_hex=color_hex,
-                    )
-                    for i in range(qty)
-                ]
-                boxes.append(Stack(name=name, _boxes=singles))
+                boxes[k] = Stack(name=name, _boxes=[proto, *clones])
+                k += 1
             else:
-                for i in range(qty):
-                    boxes.append(
-                        Box(
-                            name=f"{name}_{i+1}" if qty > 1 else name,
-                            length_mm=l_mm,
-                            width_mm=w_mm,
-                            height_mm=h_mm,
-                            weight_kg=weight_kg,
-                            color_hex=color_hex,
-                        )
-                    )
+                boxes[k] = proto
+                boxes[k + 1:k + qty] = clones
+                k += qty
         return boxes
 
+    def read_boxes_soa(self) -> BoxColumns:
+        """
+        Wie ``read_boxes()`` (ungestapelt), aber als Spalten‑Arrays statt
+        einzelner Box‑Objekte – für Aufrufer, die nur die Maße brauchen.
+        """
+        rows = list(self._iter_valid_rows())
+        qtys = np.fromiter((r[1] for r in rows), dtype=np.intp, count=len(rows))
+
+        def column(i: int, dtype) -> np.ndarray:
+            values = np.fromiter((r[i] for r in rows), dtype=dtype, count=len(rows))
+            return np.repeat(values, qtys)
+
+        names: List[str] = []
+        colors: List[str] = []
+        for name, qty, *_, color_hex in rows:
+            if qty > 1:
+                names.extend(f"{name}_{i+1}" for i in range(qty))
+            else:
+                names.append(name)
+            colors.extend([color_hex] * qty)
+        return BoxColumns(
+            names=names,
+            lengths=column(2, np.int32),
+            widths=column(3, np.int32),
+            heights=column(4, np.int32),
+            weights=column(5, np.float64),
+            colors=colors,
+        )
+
     def emit_boxes(self, *, stacked: bool = False) -> None:
         """Vom MainWindow‑Button aufrufbar."""
         self.boxes_created.emit(self.read_boxes(stacked=stacked))
@@ -236,10 +400,7 @@ class TableWidget(QTableWidget):
     # Events (Kontextmenü, Shortcuts)
     # ------------------------------------------------------------------ #
     def contextMenuEvent(self, ev):  # noqa: D401 – Qt Signature
-        menu = QMenu(self)
-        act_del = menu.addAction("Markierte Zeile(n) löschen")
-        act_del.triggered.connect(self.remove_selected_rows)
-        menu.exec(ev.globalPos())
+        self._ctx_menu.exec(ev.globalPos())
 
     def keyPressEvent(self, ev):  # noqa: D401 – Qt Signature
         if ev.key() in (Qt.Key_Delete, Qt.Key_Backspace):
@@ -251,91 +412,128 @@ class TableWidget(QTableWidget):
     # Private Helfer
     # ------------------------------------------------------------------ #
     def _init_ui(self) -> None:
-        self.setHorizontalHeaderLabels(
-            ["Name", "Menge", "L", "B", "H", "Gewicht", "Farbe"]
-        )
         header: QHeaderView = self.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setSectionResizeMode(self.COL_COLOR, QHeaderView.ResizeToContents)
         self.verticalHeader().setVisible(False)
         self.setMinimumSize(QSize(640, 360))
         self.setAlternatingRowColors(True)
+        # ganze Zeilen markieren: selectedRows() liefert dann je Zeile genau
+        # einen Index (statt einen je Zelle) für remove_selected_rows
+        self.setSelectionBehavior(QTableView.SelectRows)
+        self._init_delegates()
+
+        # Kontextmenü einmalig aufbauen, contextMenuEvent zeigt es nur noch an
+        self._ctx_menu = QMenu(self)
+        act_del = self._ctx_menu.addAction("Markierte Zeile(n) löschen")
+        act_del.triggered.connect(self.remove_selected_rows)
+
+    def _init_delegates(self) -> None:
+        """Validierende Editoren je Spalte (ersetzt die Prüfung nach itemChanged)."""
+        # C‑Locale: Dezimalpunkt und keine Tausendertrennzeichen, passend zu
+        # int()/float() in read_boxes – unabhängig von der System‑Sprache
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+
+        int_validator = QIntValidator(1, _BoxTableModel.POSINT_MAX)
+        int_validator.setLocale(locale)
+        int_delegate = _ValidatingDelegate(self, int_validator)
+        for col in (self.COL_QTY, self.COL_L, self.COL_W, self.COL_H):
+            self.setItemDelegateForColumn(col, int_delegate)
+
+        # Gewicht darf leer bleiben (= 0 kg), daher Regex statt QDoubleValidator
+        weight_re = QRegularExpression(f"({_BoxTableModel.WEIGHT_RE.pattern[1:-1]})?")
+        self.setItemDelegateForColumn(
+            self.COL_WEIGHT,
+            _ValidatingDelegate(self, QRegularExpressionValidator(weight_re)),
+        )
+        self.setItemDelegateForColumn(
+            self.COL_NAME,
+            _ValidatingDelegate(
+                self, QRegularExpressionValidator(QRegularExpression(r".*\S.*"))
+            ),
+        )
+
+    def _iter_valid_rows(self) -> Iterator[_RowData]:
+        """Liefert die Werte aller *vollständigen* Zeilen."""
+        # je Zeile ein Snapshot aller Felder (ein attrgetter-Aufruf statt
+        # sieben Attributzugriffen), geprüft wird auf den lokalen Werten
+        for name, qty, l_mm, w_mm, h_mm, weight_kg, color_hex in map(
+            _ROW_VALUES, self._model.rows
+        ):
+            if name and None not in (qty, l_mm, w_mm, h_mm):
+                yield name, qty, l_mm, w_mm, h_mm, weight_kg or 0.0, color_hex
 
     # ---------- Farb‑Logik ---------- #
     def _assign_unique_color(self) -> str:
-        available = [c for c in self._PALETTE if c not in self._used_colors]
-        if not available:  # Palette erschöpft → zufällige Farbe
+        if self._free_colors:
+            color_hex = random.choice(self._free_colors)
+        else:  # Palette erschöpft → zufällige Farbe
             while True:
-                col = QColor.fromRgb(
+                color_hex = QColor.fromRgb(
                     random.randint(0, 255),
                     random.randint(0, 255),
                     random.randint(0, 255),
                 ).name()
-                if col not in self._used_colors:
-                    available.append(col)
+                if color_hex not in self._used_colors:
                     break
-        color_hex = random.choice(available)
-        self._used_colors.add(color_hex)
+        self._take_color(color_hex)
         return color_hex
 
+    def _take_color(self, color_hex: str) -> None:
+        """Markiert *color_hex* als belegt (und entfernt sie aus den freien Farben)."""
+        self._used_colors.add(color_hex)
+        idx = self._free_index.pop(color_hex, None)
+        if idx is not None:
+            last = self._free_colors.pop()
+            if last != color_hex:
+                self._free_colors[idx] = last
+                self._free_index[last] = idx
+
+    def _release_color(self, color_hex: str) -> None:
+        """Gibt *color_hex* frei; nur Palettenfarben werden erneut vergeben."""
+        self._used_colors.discard(color_hex)
+        if color_hex in self._PALETTE_INDEX and color_hex not in self._free_index:
+            self._free_index[color_hex] = len(self._free_colors)
+            self._free_colors.append(color_hex)
+
+    def _on_color_clicked(self) -> None:
+        """Slot aller Farb‑Buttons: aktuelle Zeile erst beim Klick ermitteln.
+
+        Die Buttons liegen im Viewport, ``pos()`` lässt sich also direkt per
+        ``indexAt`` auf die Zeile abbilden – auch nachdem darüberliegende
+        Zeilen gelöscht wurden.
+        """
+        btn = self.sender()
+        row = self.indexAt(btn.geometry().center()).row()
+        if row >= 0:
+            self._cycle_color(row)
+
     def _cycle_color(self, row: int) -> None:
         """Wechselt auf die nächste freie Farbe in der Palette."""
         current = self._color_at_row(row)
-        palette_cycle = itertools.cycle(self._PALETTE)
-
-        # bis zur aktuellen Farbe drehen
-        for _ in range(len(self._PALETTE)):
-            if next(palette_cycle) == current:
-                break
+        palette = self._PALETTE
+        n = len(palette)
+        # Position der aktuellen Farbe (Nicht-Palettenfarbe → Suche ab Index 0)
+        idx = self._PALETTE_INDEX.get(current, n - 1)
 
         # nächste unbelegte Farbe suchen
-        for _ in range(len(self._PALETTE)):
-            new_col = next(palette_cycle)
+        for k in range(1, n + 1):
+            new_col = palette[(idx + k) % n]
             if new_col not in self._used_colors:
                 break
         else:  # alle belegt → neue zufällige
             new_col = self._assign_unique_color()
 
-        btn = self.cellWidget(row, self.COL_COLOR)
+        self._model.rows[row].color_hex = new_col
+        btn = self.indexWidget(self._model.index(row, self.COL_COLOR))
         if isinstance(btn, _ColorButton):
             btn.set_color(new_col)
-        self._used_colors.discard(current)
-        self._used_colors.add(new_col)
+        self._release_color(current)
+        self._take_color(new_col)
 
     def _color_at_row(self, row: int) -> str:
-        btn = self.cellWidget(row, self.COL_COLOR)
-        return btn.color_hex if isinstance(btn, _ColorButton) else "#000000"
-
-    # ---------- Validierung ---------- #
-    def _validate_item(self, item: QTableWidgetItem) -> None:
-        self._validate_cell(item.row(), item.column())
-
-    def _validate_cell(self, row: int, col: int) -> None:
-        text = self.item(row, col).text().strip()
-        valid = True
-
-        if col == self.COL_NAME:
-            valid = bool(text)
-        elif col == self.COL_QTY:
-            valid = text.isdigit() and int(text) > 0
-        elif col in (self.COL_L, self.COL_W, self.COL_H):
-            valid = text.isdigit() and int(text) > 0
-        elif col == self.COL_WEIGHT:
-            if text:
-                try:
-                    valid = float(text) >= 0
-                except ValueError:
-                    valid = False
-
-        self._set_cell_valid(row, col, valid)
-
-    def _set_cell_valid(self, row: int, col: int, valid: bool) -> None:
-        if valid:
-            self._invalid_cells.discard((row, col))
-            self.item(row, col).setBackground(QBrush())
-        else:
-            self._invalid_cells.add((row, col))
-            self.item(row, col).setBackground(QBrush(QColor("#ffe6e6")))
+        return self._model.rows[row].color_hex
 
 
 # ---------------------------------------------------------------------------
@@ -21,14 +21,16 @@ Der Code ist 1‑zu‑1 kopierbar nach VS Code.
 
 from __future__ import annotations
 
-import json
+import getpass
 import logging
 import sys
 import os
+from dataclasses import replace
+from itertools import chain
 from pathlib import Path
 from typing import Callable, Any
 
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -37,10 +39,9 @@ from PySide6.QtWidgets import (
     QSplitter,
     QToolBar,
     QComboBox,
-    QFileDialog,
-    QMessageBox,
     QStatusBar,
 )
+# QFileDialog/QMessageBox werden erst in den Slots importiert, die sie brauchen
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Eigene Importe (late import vermeidet zirkuläre Abhängigkeiten beim Testen)
@@ -48,20 +49,29 @@ from PySide6.QtWidgets import (
 from container_tool.gui.table_widget import TableWidget       # noqa: E402
 from container_tool.gui.canvas_2d import Canvas2D              # noqa: E402
 from container_tool.core import io_clp                         # noqa: E402
+from container_tool.core.models import Box, Project, Stack  # noqa: E402
 from container_tool.export.pdf_export import export_pdf        # noqa: E402
 
+logger = logging.getLogger(__name__)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
-# Helfer: Generischer Worker für lange Operationen (Variante A – eigener QThread)
+# Helfer: Generischer Task für lange Operationen (geteilter QThreadPool)
 # ──────────────────────────────────────────────────────────────────────────────
-class _Worker(QObject):
-    """Führt *fn* mit *args/kwargs* in einem separaten Thread aus."""
+class _TaskSignals(QObject):
+    """Signale eines `_Task` (QRunnable selbst ist kein QObject)."""
+
+    finished = Signal(object)  # Ergebnisobjekt
+    error = Signal(str)        # Fehlermeldung als Text
+
 
-    finished: Signal = Signal(object)  # Ergebnisobjekt
-    error: Signal = Signal(str)        # Fehlermeldung als Text
+class _Task(QRunnable):
+    """Führt *fn* mit *args/kwargs* in einem Pool‑Thread aus."""
 
-    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    def __init__(self, signals: _TaskSignals, fn: Callable[..., Any],
+                 *args: Any, **kwargs: Any) -> None:
         super().__init__()
+        self.signals = signals
         self._fn = fn
         self._args = args
         self._kwargs = kwargs
@@ -69,10 +79,21 @@ class _Worker(QObject):
     def run(self) -> None:
         try:
             result = self._fn(*self._args, **self._kwargs)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as exc:  # pragma: no cover
             logger.exception("Fehler im Worker‑Thread")
-            self.error.emit(str(exc))
+            self.signals.error.emit(str(exc))
+        finally:
+            # deleteLater ist thread‑sicher und wird nach den bereits
+            # eingereihten Slot‑Aufrufen im GUI‑Thread ausgeführt
+            self.signals.deleteLater()
+
+
+def _copy_model(item: Box | Stack) -> Box | Stack:
+    """Vom GUI entkoppelte Kopie eines Box/Stack‑Modells (Stack samt Boxen)."""
+    if isinstance(item, Stack):
+        return Stack(name=item.name, _boxes=[replace(b) for b in item])
+    return replace(item)
 
 
 def _run_in_thread(
@@ -83,26 +104,22 @@ def _run_in_thread(
 ) -> None:
     """
     Hilfsfunktion:
-    Erstellt einen Worker + QThread, startet ihn und verbindet Signale mit Slots
-    im *parent* (dem MainWindow).
+    Reiht *fn* als `_Task` in den Thread‑Pool des *parent* (MainWindow) ein und
+    verbindet die Signale mit dessen Slots – kein eigener QThread je Aktion.
 
-    *parent* muss Methoden *_on_action_success* und *_on_action_error* besitzen.
+    *parent* muss *_pool*, *_on_action_success* und *_on_action_error* besitzen.
     """
-    worker = _Worker(fn, *args, **kwargs)
-    thread = QThread(parent)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)  # type: ignore[arg-type]
+    # Signal‑Objekt lebt im GUI‑Thread (Eltern = MainWindow), Emits aus dem
+    # Pool‑Thread kommen damit per Queued Connection im GUI‑Thread an
+    signals = _TaskSignals(parent)
+    signals.finished.connect(
+        parent._on_action_success, Qt.QueuedConnection  # type: ignore[arg-type]
+    )
+    signals.error.connect(
+        parent._on_action_error, Qt.QueuedConnection  # type: ignore[arg-type]
+    )
 
-    # Ergebnisse zurück in den GUI‑Thread
-    worker.finished.connect(parent._on_action_success)  # type: ignore[arg-type]
-    worker.error.connect(parent._on_action_error)       # type: ignore[arg-type]
-
-    # Aufräumen
-    worker.finished.connect(thread.quit)                # type: ignore[arg-type]
-    worker.finished.connect(worker.deleteLater)         # type: ignore[arg-type]
-    thread.finished.connect(thread.deleteLater)         # type: ignore[arg-type]
-
-    thread.start()
+    parent._pool.start(_Task(signals, fn, *args, **kwargs))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -114,7 +131,7 @@ class MainWindow(QMainWindow):
     plus Symbolleiste und Statusbar.
     """
 
-    CONTAINER_JSON_PATH = Path(__file__).resolve().parents[2] / "data" / "containers.json"
+    CONTAINER_JSON_PATH = Path(__file__).resolve().parents[3] / "data" / "containers.json"
 
     # ..........................................................................
     # Initialisierung
@@ -122,20 +139,35 @@ class MainWindow(QMainWindow):
     def __init__(self, container_defs: dict[str, Any] | None = None) -> None:  # ← CHANGED
         super().__init__()
         self._container_defs: dict[str, Any] = container_defs or {}            # ← CHANGED
+        # Ein Pool für alle Lade-/Speicher-/Export‑Aktionen; zwei Threads
+        # genügen, die Aktionen sind I/O‑gebunden
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        # Benutzer für die Projekt‑Metadaten einmalig ermitteln; os.getlogin()
+        # scheitert ohne Login‑Terminal (systemd, CI, gefrorene Builds)
+        self._user = os.environ.get("USER") or os.environ.get("USERNAME") or getpass.getuser()
+        # Name ➜ Container‑Definition für das Speichern, einmal statt pro Save
+        self._containers_by_name: dict[str, Any] = self._index_containers_by_name()
+        # Startverzeichnis der Dateidialoge; folgt der letzten Auswahl
+        self._last_dir = str(Path.home())
         self.setWindowTitle("Container‑Ladetool")
 
         # ---------- zentrale Widgets --------------------------------------------------
         self._table = TableWidget(parent=self)
 
-        self._waiting_canvas = Canvas2D(scene_name="waiting_area", parent=self)
+        # Warte‑Zone erst beim ersten Erzeugen von Kisten aufbauen (siehe
+        # `_waiting_canvas`); bis dahin hält ein leeres Widget ihren Platz
+        self._waiting_canvas_obj: Canvas2D | None = None
+        self._waiting_placeholder: QWidget | None = QWidget()
         self._container_canvas = Canvas2D(scene_name="container", parent=self)
 
         right_pane = QWidget()
         right_layout = QVBoxLayout(right_pane) # Nur das Eltern-Widget übergeben
         right_layout.setSpacing(2)
         right_layout.setContentsMargins(0, 0, 0, 0) # Ränder separat setzen
-        right_layout.addWidget(self._waiting_canvas)
+        right_layout.addWidget(self._waiting_placeholder)
         right_layout.addWidget(self._container_canvas)
+        self._right_layout = right_layout
 
         self._splitter = QSplitter(Qt.Horizontal, self)
         self._splitter.addWidget(self._table)
@@ -154,9 +186,27 @@ class MainWindow(QMainWindow):
         # ---------- Statusbar ---------------------------------------------------------
         self._statusbar = QStatusBar(self)
         self.setStatusBar(self._statusbar)
+        # Statusmeldungen gesammelt schreiben (siehe _set_status)
+        self._pending_status = ""
+        self._status_scheduled = False
 
         self._set_status("Bereit")
 
+    @property
+    def _waiting_canvas(self) -> Canvas2D:
+        """Canvas der Warte‑Zone; beim ersten Zugriff erzeugt und eingesetzt."""
+        canvas = self._waiting_canvas_obj
+        if canvas is None:
+            canvas = self._waiting_canvas_obj = Canvas2D(scene_name="waiting_area", parent=self)
+            self._right_layout.replaceWidget(self._waiting_placeholder, canvas)
+            self._waiting_placeholder.deleteLater()
+            self._waiting_placeholder = None
+            # zoomChanged‑Signale davor hat die neue Canvas verpasst
+            zoom_idx = self._container_canvas._zoom_level_index
+            if zoom_idx != canvas._zoom_level_index:
+                canvas._set_zoom_index(zoom_idx)
+        return canvas
+
     # ..........................................................................
     # Aufbau Toolbar
     # ..........................................................................
@@ -182,16 +232,12 @@ class MainWindow(QMainWindow):
 
         # Gestapelt erstellen
         self._act_create_stacked = QAction("Kisten gestapelt erstellen", self)
-        self._act_create_stacked.triggered.connect(
-            lambda: self._handle_box_creation(mode="stacked")
-        )
+        self._act_create_stacked.triggered.connect(self._on_create_stacked)
         tb.addAction(self._act_create_stacked)
 
         # Einzeln erstellen
         self._act_create_single = QAction("Kisten einzeln erstellen", self)
-        self._act_create_single.triggered.connect(
-            lambda: self._handle_box_creation(mode="single")
-        )
+        self._act_create_single.triggered.connect(self._on_create_single)
         tb.addAction(self._act_create_single)
 
         tb.addSeparator()
@@ -226,16 +272,36 @@ class MainWindow(QMainWindow):
                     for c in self._container_defs.values()]                 # ← CHANGED
 
         try:
-            with open(self.CONTAINER_JSON_PATH, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
-            return [item["name"] for item in data]  # type: ignore[index]
+            # derselbe (gecachte) Loader wie beim Speichern – kein zweites Parsen
+            defs = io_clp.load_containers_definitions(self.CONTAINER_JSON_PATH)
+            return [c.name for c in defs.values()]
         except Exception as exc:  # pragma: no cover
             logger.warning("Kann Containerliste nicht laden: %s", exc)
             return ["20 ft", "40 ft", "40 ft HC", "40 ft OT"]
 
+    def _index_containers_by_name(self) -> dict[str, Any]:
+        """Container‑Definitionen aus *containers.json*, nach Namen indiziert."""
+        try:
+            defs = io_clp.load_containers_definitions(self.CONTAINER_JSON_PATH)
+        except Exception as exc:  # pragma: no cover
+            logger.warning("Kann Containerdefinitionen nicht laden: %s", exc)
+            return {}
+        return {c.name: c for c in defs.values()}
+
     def _set_status(self, text: str) -> None:
-        """Aktuellen Status in der Statusleiste anzeigen."""
-        self.statusBar().showMessage(text)
+        """
+        Aktuellen Status in der Statusleiste anzeigen – verzögert bis zur
+        nächsten Event‑Loop‑Runde; von mehreren Aufrufen davor gilt nur der letzte.
+        """
+        self._pending_status = text
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            QTimer.singleShot(0, self._flush_status)
+
+    @Slot()
+    def _flush_status(self) -> None:
+        self._status_scheduled = False
+        self._statusbar.showMessage(self._pending_status)
 
     # ..........................................................................
     # Slots – Benutzeraktionen
@@ -245,6 +311,8 @@ class MainWindow(QMainWindow):
         """
         Container‑Typ geändert → Container‑Canvas neu skalieren.
         """
+        from PySide6.QtWidgets import QMessageBox
+
         try:
             self._container_canvas.set_container_type(ctype)
             self._set_status(f"Containertyp gesetzt: {ctype}")
@@ -253,6 +321,14 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Fehler", str(exc))
 
     # -- Kisten erstellen -------------------------------------------------------
+    @Slot()
+    def _on_create_stacked(self) -> None:
+        self._handle_box_creation(mode="stacked")
+
+    @Slot()
+    def _on_create_single(self) -> None:
+        self._handle_box_creation(mode="single")
+
     def _handle_box_creation(self, *, mode: str) -> None:
         """
         Ruft TableWidget.read_boxes() auf und übergibt die Boxen
@@ -260,8 +336,11 @@ class MainWindow(QMainWindow):
 
         *mode* ∈ {"stacked", "single"}
         """
+        from PySide6.QtWidgets import QMessageBox
+
         # Bestehende Objekte? → Warnhinweis
-        if self._waiting_canvas.has_boxes() or self._container_canvas.has_boxes():
+        waiting = self._waiting_canvas_obj
+        if (waiting is not None and waiting.has_boxes()) or self._container_canvas.has_boxes():
             ret = QMessageBox.question(
                 self,
                 "Neu generieren?",
@@ -273,7 +352,8 @@ class MainWindow(QMainWindow):
             if ret != QMessageBox.Yes:
                 return
 
-            self._waiting_canvas.clear_boxes()
+            if waiting is not None:
+                waiting.clear_boxes()
             self._container_canvas.clear_boxes()
 
         try:
@@ -286,104 +366,130 @@ class MainWindow(QMainWindow):
 
     # -- Projekt laden ----------------------------------------------------------
     def _on_load_project(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Projekt laden",
-            "",
+            self._last_dir,
             "Container‑Projekt (*.clp)",
         )
         if not filename:
             return
+        self._last_dir = str(Path(filename).parent)
 
         self._set_status("Projekt wird geladen …")
         _run_in_thread(self, io_clp.load_clp, filename)
 
     # -- Projekt speichern ------------------------------------------------------
     def _on_save_project(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Projekt speichern",
-            "",
+            self._last_dir,
             "Container‑Projekt (*.clp)",
         )
         if not filename:
             return
+        self._last_dir = str(Path(filename).parent)
 
-        self._set_status("Projekt wird gespeichert …")
-        project = self._build_project_object()
-        _run_in_thread(self, io_clp.save_clp,
-                        project, filename, user=os.getlogin(), version="1.0.0")
+        self._set_status("Projekt wird gespeichert …")
+        # GUI‑Thread: nur Kopien der Modelle ziehen, damit Drag, Rotation und
+        # Stapeln die Originale weiter ändern dürfen; Container‑Lookup,
+        # Project‑Aufbau, Serialisieren und Schreiben laufen als ein Task im Pool
+        container_type, boxes = self._copy_project_state()
+        _run_in_thread(self, self._save_project_snapshot,
+                        container_type, boxes, filename, user=self._user)
 
     # -- Export / Abschluss -----------------------------------------------------
     def _on_export_project(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "PDF exportieren",
-            "",
+            self._last_dir,
             "PDF‑Datei (*.pdf)",
         )
         if not filename:
             return
+        self._last_dir = str(Path(filename).parent)
 
-        self._set_status("Export läuft …")
-        project_state = self._gather_project_state()
-        _run_in_thread(self, export_pdf, filename, project_state)
+        self._set_status("Export läuft …")
+        # wie beim Speichern: im GUI‑Thread nur kopieren, Rendern im Pool
+        container_type, boxes = self._copy_project_state()
+        _run_in_thread(self, self._export_project_snapshot,
+                        container_type, boxes, filename)
 
     # ..........................................................................
     # Callback‑Slots aus Worker‑Threads
     # ..........................................................................
+    @Slot(object)
     def _on_action_success(self, result: object) -> None:  # noqa: D401
         """Wird aufgerufen, wenn ein Worker erfolgreich abgeschlossen ist."""
+        from PySide6.QtWidgets import QMessageBox
+
         self._set_status("Aktion abgeschlossen")
         QMessageBox.information(self, "Fertig", "Aktion erfolgreich abgeschlossen.")
 
+    @Slot(str)
     def _on_action_error(self, message: str) -> None:  # noqa: D401
         """Wird aufgerufen, wenn ein Worker einen Fehler liefert."""
+        from PySide6.QtWidgets import QMessageBox
+
         self._set_status("Fehler")
         QMessageBox.critical(self, "Fehler", message)
 
     # ..........................................................................
     # Hilfsfunktionen
     # ..........................................................................
-    def _gather_project_state(self) -> dict[str, Any]:
-        """
-        Aggregiert alle relevanten Informationen (Canvas + Tabelle)
-        in ein dict, das an io_clp / export_pdf übergeben wird.
-        """
-        return {
-            "container_type": self._combo_container.currentText(),
-            "table": self._table.serialize(),
-            "container_boxes": self._container_canvas.serialize(),
-            "waiting_boxes": self._waiting_canvas.serialize(),
-        }
-
     # ----------------------------------------------------------------------
     # Privater Helfer: GUI‑Zustand ➜ Project‑Objekt
     # ----------------------------------------------------------------------
-    def _build_project_object(self):
+    def _snapshot_project_state(self) -> tuple[str, list]:
+        """
+        (Containertyp, Box‑/Stack‑Modelle beider Canvas) – der Teil des
+        GUI‑Zustands, den ein Project braucht; nur im GUI‑Thread aufrufen.
+        """
+        canvases = [self._container_canvas]
+        if self._waiting_canvas_obj is not None:  # noch nie erzeugt ⇒ leer
+            canvases.append(self._waiting_canvas_obj)
+        return self._combo_container.currentText(), list(chain.from_iterable(
+            c.iter_box_models() for c in canvases
+        ))
+
+    def _copy_project_state(self) -> tuple[str, list]:
         """
-        Erstellt aus dem aktuellen GUI‑Zustand ein Project‑Objekt,
-        wie es io_clp.save_clp() erwartet.
+        Wie `_snapshot_project_state`, aber mit Kopien der Modelle (`_copy_model`),
+        die der Worker lesen kann, während das GUI die Originale verändert.
         """
-        from container_tool.core import io_clp
-        from container_tool.core.models import Box, Stack, Project
+        container_type, boxes = self._snapshot_project_state()
+        return container_type, [_copy_model(item) for item in boxes]
 
-        state = self._gather_project_state()
+    def _build_project_from_snapshot(self, container_type: str, boxes: list):
+        """
+        Erstellt aus einem `_snapshot_project_state`‑Ergebnis ein Project‑Objekt,
+        wie es io_clp.save_clp() erwartet. Ohne Qt‑Zugriffe, also Worker‑tauglich
+        (`_containers_by_name` wird nach __init__ nur noch gelesen).
+        """
+        # Container‑Objekt ermitteln (Name ➜ Definition)
+        container = self._containers_by_name[container_type]
 
-        # 1) Container‑Objekt ermitteln (Name ➜ Definition)
-        defs = io_clp.load_containers_definitions()
-        container = next(c for c in defs.values()
-                         if getattr(c, "name", "") == state["container_type"])
+        # Meta‑Infos fügt save_clp selbst hinzu
+        return Project(container=container, boxes=boxes)
 
-        # 2) Box‑/Stack‑Instanzen aus den Canvas‑Daten erzeugen
-        boxes_raw = state["container_boxes"] + state["waiting_boxes"]
-        boxes = [
-            Box.from_dict(b) if b.get("type") == "box" else Stack.from_dict(b)
-            for b in boxes_raw
-        ]
+    def _save_project_snapshot(self, container_type: str, boxes: list,
+                               filename: str, user: str) -> None:
+        """Worker‑Task: Project aus den kopierten Modellen aufbauen und speichern."""
+        project = self._build_project_from_snapshot(container_type, boxes)
+        io_clp.save_clp(project, filename, user=user, version="1.0.0")
 
-        # 3) Project zusammenstellen (Meta‑Infos fügt save_clp selbst hinzu)
-        return Project(container=container, boxes=boxes)
+    def _export_project_snapshot(self, container_type: str, boxes: list,
+                                 filename: str) -> None:
+        """Worker‑Task: Project aus den kopierten Modellen aufbauen und als PDF exportieren."""
+        export_pdf(self._build_project_from_snapshot(container_type, boxes), filename)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
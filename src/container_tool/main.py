@@ -1,5 +1,7 @@
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+import queue
 import sys
 import traceback
 from pathlib import Path
@@ -18,7 +20,11 @@ logger = logging.getLogger("container_tool")
 # Hilfsfunktionen
 # --------------------------------------------------------------------------- #
 def _setup_logging() -> None:
-    """Initialisiert Rotating‑Logfile logs/error.log (Retention 7 Tage)."""
+    """Initialisiert Rotating‑Logfile logs/error.log (Retention 7 Tage).
+
+    Der Logger schreibt nur in eine Queue; Formatierung, Dateizugriff und
+    Rollover erledigt ein QueueListener in einem eigenen Thread.
+    """
     base_dir = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
     log_dir = base_dir / "logs"
     log_dir.mkdir(exist_ok=True)
@@ -32,8 +38,14 @@ def _setup_logging() -> None:
     )
     handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # atexit hält die einzige Referenz und leert die Queue beim Beenden
+    atexit.register(listener.stop)
+
     logger.setLevel(logging.DEBUG)     # Standard‑Logstufe: DEBUG
-    logger.addHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
     logger.propagate = False
 
 
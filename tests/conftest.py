@@ -0,0 +1,27 @@
+# tests/conftest.py
+"""
+Gemeinsame pytest‑Konfiguration.
+
+Legt den Quell‑Pfad (src/) einmalig auf sys.path, falls das Paket nicht
+installiert ist – für alle Testmodule statt je Modul – und hält das
+pytest‑benchmark‑JSON klein.
+"""
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+SRC_PATH = pathlib.Path(__file__).resolve().parents[1] / "src"
+if SRC_PATH.exists() and str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+
+@pytest.hookimpl(optionalhook=True)  # nur aktiv, wenn pytest-benchmark installiert ist
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Große Fixture‑Daten nicht als Benchmark‑Parameter ins JSON schreiben."""
+    for bench in output_json.get("benchmarks", []):
+        params = bench.get("params") or {}
+        params.pop("placed_aabb", None)
+        params.pop("placed", None)
@@ -2,18 +2,22 @@ import sys
 from pathlib import Path
 
 import pytest
-from PySide6.QtWidgets import QFileDialog
+from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 from container_tool.gui.window import MainWindow
 
 
 def _fill_row(table, row, *, name, qty, length, width, height, weight="1.0"):
-    table.item(row, table.COL_NAME).setText(name)
-    table.item(row, table.COL_QTY).setText(str(qty))
-    table.item(row, table.COL_L).setText(str(length))
-    table.item(row, table.COL_W).setText(str(width))
-    table.item(row, table.COL_H).setText(str(height))
-    table.item(row, table.COL_WEIGHT).setText(str(weight))
+    model = table.model()
+    for col, value in (
+        (table.COL_NAME, name),
+        (table.COL_QTY, qty),
+        (table.COL_L, length),
+        (table.COL_W, width),
+        (table.COL_H, height),
+        (table.COL_WEIGHT, weight),
+    ):
+        assert model.setData(model.index(row, col), str(value))
 
 
 def test_mainwindow_starts(qtbot):
@@ -105,6 +109,8 @@ def test_pdf_export_opens_dialog(qtbot, monkeypatch, tmp_path):
 
     monkeypatch.setattr(QFileDialog, "getSaveFileName", staticmethod(fake_get_save))
     monkeypatch.setattr("container_tool.gui.window.export_pdf", lambda *a, **k: None)
+    # Erfolgsmeldung ist modal – im Test nicht blockieren
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *a, **k: None))
 
     # Thread-Erzeugung umgehen (sofortige Ausführung)
     import container_tool.gui.window as win_mod
@@ -121,3 +127,87 @@ def test_pdf_export_opens_dialog(qtbot, monkeypatch, tmp_path):
     win._act_export.trigger()
     qtbot.wait_until(lambda: dialog_called["flag"], timeout=1000)
     assert dialog_called["flag"]
+
+
+def test_save_project_writes_clp(qtbot, monkeypatch, tmp_path):
+    """Speichern über die GUI schreibt eine ladbare .clp (Kopien statt Live‑Modelle)."""
+    from container_tool.core import io_clp
+    from container_tool.core.models import Box
+
+    win = MainWindow()
+    qtbot.addWidget(win)
+    if win._combo_container.currentText() not in win._containers_by_name:
+        pytest.skip("Keine Container-Typen definiert.")
+
+    box = Box(name="Solo", length_mm=1000, width_mm=800, height_mm=600, pos_x_mm=0)
+    win._container_canvas.add_box(box)
+
+    target = tmp_path / "gui.clp"
+    monkeypatch.setattr(
+        QFileDialog, "getSaveFileName", staticmethod(lambda *a, **k: (str(target), ""))
+    )
+    errors = []
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *a, **k: None))
+    monkeypatch.setattr(QMessageBox, "critical", staticmethod(lambda *a: errors.append(a[-1])))
+
+    win._on_save_project()
+    box.pos_x_mm = 999  # Änderung nach dem Auslösen landet nicht in der Datei
+    win._pool.waitForDone()
+    qtbot.wait_until(lambda: target.exists() or bool(errors), timeout=2000)
+
+    assert errors == []
+    loaded = io_clp.load_clp(target)
+    assert [b.pos_x_mm for b in loaded.boxes] == [0]
+
+
+def test_waiting_canvas_adopts_current_zoom(qtbot):
+    """Die erst später erzeugte Warte‑Zone übernimmt die aktuelle Zoom‑Stufe."""
+    win = MainWindow()
+    qtbot.addWidget(win)
+    assert win._waiting_canvas_obj is None
+
+    container = win._container_canvas
+    container._set_zoom_index(container._zoom_level_index + 1)
+
+    assert win._waiting_canvas._zoom_level_index == container._zoom_level_index
+
+
+def test_save_and_export_serialize_in_worker(qtbot, monkeypatch, tmp_path):
+    """GUI‑Thread kopiert nur; to_dict() und export_pdf laufen im Thread‑Pool."""
+    import threading
+
+    from container_tool.core.models import Box
+
+    win = MainWindow()
+    qtbot.addWidget(win)
+    if win._combo_container.currentText() not in win._containers_by_name:
+        pytest.skip("Keine Container-Typen definiert.")
+
+    box = Box(name="Solo", length_mm=1000, width_mm=800, height_mm=600, pos_x_mm=0)
+    win._container_canvas.add_box(box)
+
+    threads = []
+    real_to_dict = Box.to_dict
+
+    def _spy_to_dict(self):
+        threads.append(threading.current_thread())
+        return real_to_dict(self)
+
+    def _spy_export(project, _filename):
+        threads.append(threading.current_thread())
+        assert project.boxes[0] is not box
+
+    monkeypatch.setattr(Box, "to_dict", _spy_to_dict)
+    monkeypatch.setattr("container_tool.gui.window.export_pdf", _spy_export)
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *a, **k: None))
+
+    for target, action in ((tmp_path / "p.clp", win._on_save_project),
+                           (tmp_path / "p.pdf", win._on_export_project)):
+        monkeypatch.setattr(
+            QFileDialog, "getSaveFileName", staticmethod(lambda *a, t=target, **k: (str(t), ""))
+        )
+        action()
+        win._pool.waitForDone()
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
@@ -1,10 +1,17 @@
+import numpy as np
 import pytest
 
 from container_tool.core.collision import (
     is_within_container,
     check_collisions,
+    make_collider,
+    overlaps,
+    register,
+    SpatialGrid,
+    SweepAndPrune,
     DOOR_HEIGHT_COLLISION,
 )
+from container_tool.core._collision_kernels import collide_indices, collide_indices_numpy
 from container_tool.core.models import Container, Box, Stack
 
 
@@ -50,6 +57,24 @@ def test_is_within_container(container, pos_x, pos_y, len_mm, wid_mm, expected_i
     assert is_within_container(box, container) is expected_inside
 
 
+# --------------------------------------------------------------------------- #
+# overlaps
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        ((0, 0, 10, 10), (5, 5, 15, 15), True),     # echte Überdeckung
+        ((0, 0, 10, 10), (10, 0, 20, 10), False),   # Kante an Kante (X)
+        ((0, 0, 10, 10), (0, 10, 10, 20), False),   # Kante an Kante (Y)
+        ((0, 0, 10, 10), (2, 2, 8, 8), True),       # vollständig enthalten
+        ((0, 0, 10, 10), (20, 20, 30, 30), False),  # disjunkt
+    ],
+)
+def test_overlaps(a, b, expected):
+    assert overlaps(a, b) is expected
+    assert overlaps(b, a) is expected
+
+
 # --------------------------------------------------------------------------- #
 # check_collisions – Überlappungen
 # --------------------------------------------------------------------------- #
@@ -96,6 +121,44 @@ def test_check_collisions_overlap_vs_free(container):
     assert collisions == []
 
 
+def test_check_collisions_short_circuit_skips_overlaps(container):
+    fixed = Box(name="fixed", length_mm=400, width_mm=400, height_mm=200,
+                color_hex="#ff0000", pos_x_mm=700, pos_y_mm=0)
+    # ragt über die Container-Länge hinaus und überlappt zugleich `fixed`
+    outside = Box(name="outside", length_mm=400, width_mm=400, height_mm=200,
+                  color_hex="#00ff00", pos_x_mm=800, pos_y_mm=0)
+
+    ok, collisions = check_collisions(outside, [fixed], container)
+    assert not ok and collisions == [outside, fixed]
+
+    ok, collisions = check_collisions(outside, [fixed], container, short_circuit=True)
+    assert not ok and collisions == [outside]
+
+
+def test_check_collisions_is_pure(container):
+    # Keine versteckten Zustände: gleiche Eingaben ⇒ gleiches Ergebnis, und
+    # weder Kandidat noch platzierte Objekte/Container werden verändert.
+    fixed = Box(name="fixed", length_mm=400, width_mm=400, height_mm=200,
+                color_hex="#ff0000", pos_x_mm=700, pos_y_mm=0)
+    stack = Stack(name="stack", _boxes=[
+        Box(name=f"s{i}", length_mm=300, width_mm=300, height_mm=500,
+            pos_x_mm=0, pos_y_mm=600)
+        for i in range(2)
+    ])
+    cand = Box(name="cand", length_mm=400, width_mm=400, height_mm=200,
+               color_hex="#00ff00", pos_x_mm=800, pos_y_mm=0)
+    placed = [fixed, stack]
+
+    before = ([o.to_dict() for o in placed], cand.to_dict(), container.to_dict())
+    first = check_collisions(cand, placed, container)
+    second = check_collisions(cand, placed, container)
+
+    assert first[0] == second[0] is False
+    assert [id(o) for o in first[1]] == [id(o) for o in second[1]] == [id(cand), id(fixed)]
+    assert placed == [fixed, stack]
+    assert ([o.to_dict() for o in placed], cand.to_dict(), container.to_dict()) == before
+
+
 # --------------------------------------------------------------------------- #
 # check_collisions – Türhöhen-Prüfung (Stacks)
 # --------------------------------------------------------------------------- #
@@ -130,3 +193,174 @@ def test_check_collisions_door_height(container):
     ok, collisions = check_collisions(valid_stack, [], container)
     assert ok
     assert collisions == []
+
+
+# --------------------------------------------------------------------------- #
+# register / BBoxArray
+# --------------------------------------------------------------------------- #
+def test_register_reuses_cached_array_and_matches_list_path(container):
+    placed = [
+        Box(name=f"p{i}", length_mm=100, width_mm=100, height_mm=100,
+            color_hex="#111111", pos_x_mm=i * 150, pos_y_mm=0)
+        for i in range(5)
+    ]
+    candidate = Box(name="cand", length_mm=200, width_mm=100, height_mm=100,
+                    color_hex="#222222", pos_x_mm=120, pos_y_mm=50)
+
+    bbox_array = register(placed)
+    assert register(placed, bbox_array) is bbox_array
+
+    ok_list, hits_list = check_collisions(candidate, placed, container)
+    ok_arr, hits_arr = check_collisions(candidate, bbox_array, container)
+    assert not ok_list and not ok_arr
+    assert hits_list == hits_arr == [placed[1], placed[2]]
+
+    placed.append(candidate)
+    assert register(placed, bbox_array) is not bbox_array
+
+
+def test_register_rebuilds_after_move_swap_or_new_list():
+    placed = [
+        Box(name=f"p{i}", length_mm=100, width_mm=100, height_mm=100,
+            color_hex="#111111", pos_x_mm=i * 150, pos_y_mm=0)
+        for i in range(3)
+    ]
+    bbox_array = register(placed)
+
+    # gleiche Länge, aber verschobene Box
+    placed[0].pos_x_mm = 500
+    moved = register(placed, bbox_array)
+    assert moved is not bbox_array
+    assert moved.arr[0, 0] == 500
+
+    # gleiche Länge, vertauschte Boxen
+    placed[0], placed[1] = placed[1], placed[0]
+    swapped = register(placed, moved)
+    assert swapped is not moved
+    assert swapped.objs == placed
+
+    # inhaltsgleiche, aber andere Liste
+    assert register(list(placed), swapped) is not swapped
+
+
+def test_collide_indices_kernel_matches_numpy():
+    # Kanten‑Kontakt (x_max == c[0]) darf nicht als Treffer zählen
+    rng = np.random.default_rng(7)
+    xy = rng.integers(0, 900, size=(200, 2)).astype(np.float64)
+    arr = np.hstack([xy, xy + rng.integers(1, 200, size=(200, 2))])
+    arr[0] = (0.0, 0.0, 300.0, 300.0)
+    c = np.array([300.0, 100.0, 500.0, 400.0])
+
+    expected = collide_indices_numpy(c, arr)
+    assert 0 not in expected
+    np.testing.assert_array_equal(collide_indices(c, arr), expected)
+    assert collide_indices(c, arr[:0]).size == 0
+
+
+# --------------------------------------------------------------------------- #
+# SpatialGrid
+# --------------------------------------------------------------------------- #
+def test_spatial_grid_tracks_moves(container):
+    # gleiche Grundfläche (same_shape) → Grid muss per Identität arbeiten
+    a = Box(name="a", length_mm=300, width_mm=300, height_mm=100,
+            color_hex="#111111", pos_x_mm=0, pos_y_mm=0)
+    b = Box(name="b", length_mm=300, width_mm=300, height_mm=100,
+            color_hex="#222222", pos_x_mm=600, pos_y_mm=600)
+    grid = SpatialGrid([a, b])
+    candidate = Box(name="cand", length_mm=200, width_mm=200, height_mm=100,
+                    color_hex="#333333", pos_x_mm=100, pos_y_mm=100)
+
+    ok, collisions = check_collisions(candidate, grid, container)
+    assert not ok
+    assert len(collisions) == 1 and collisions[0] is a
+
+    a.pos_x_mm = 650
+    grid.move(a)
+    ok, collisions = check_collisions(candidate, grid, container)
+    assert ok and collisions == []
+
+    grid.remove(b)
+    assert len(grid) == 1 and b not in grid
+
+
+def test_spatial_grid_cell_boundaries_and_negative_coords(container):
+    # Box über vier Zellen und Box im negativen Bereich (Wartebereich-Drag)
+    wide = Box(name="wide", length_mm=1_500, width_mm=1_500, height_mm=100,
+               color_hex="#111111", pos_x_mm=500, pos_y_mm=500)
+    negative = Box(name="neg", length_mm=400, width_mm=400, height_mm=100,
+                   color_hex="#222222", pos_x_mm=-1_300, pos_y_mm=-200)
+    grid = SpatialGrid([wide, negative])
+
+    probe = (1_800.0, 1_800.0, 1_900.0, 1_900.0)
+    assert grid.query(probe) == [wide]
+    assert grid.query((-1_000.0, 0.0, -950.0, 50.0)) == [negative]
+    assert grid.query((2_000.0, 0.0, 2_100.0, 100.0)) == []
+
+
+# --------------------------------------------------------------------------- #
+# SweepAndPrune
+# --------------------------------------------------------------------------- #
+def test_sweep_and_prune_matches_brute_force(container):
+    # eine lange Box weit links muss trotz Sortierung nach x_min gefunden werden
+    long_box = Box(name="long", length_mm=900, width_mm=100, height_mm=100,
+                   color_hex="#111111", pos_x_mm=0, pos_y_mm=0)
+    small = [
+        Box(name=f"s{i}", length_mm=50, width_mm=50, height_mm=100,
+            color_hex="#222222", pos_x_mm=100 + i * 60, pos_y_mm=(i % 3) * 60)
+        for i in range(12)
+    ]
+    placed = [long_box] + small
+    index = SweepAndPrune(placed)
+    candidate = Box(name="cand", length_mm=200, width_mm=80, height_mm=100,
+                    color_hex="#333333", pos_x_mm=400, pos_y_mm=20)
+
+    expected = [o for o in placed if overlaps(candidate.bbox(), o.bbox())]
+    ok, collisions = check_collisions(candidate, index, container)
+    assert not ok
+    assert {id(o) for o in collisions} == {id(o) for o in expected}
+    assert any(o is long_box for o in collisions)
+
+    long_box.pos_y_mm = 500
+    index.move(long_box)
+    _, collisions = check_collisions(candidate, index, container)
+    assert all(o is not long_box for o in collisions)
+
+
+# --------------------------------------------------------------------------- #
+# make_collider
+# --------------------------------------------------------------------------- #
+def test_make_collider_matches_check_collisions(container):
+    placed = [
+        Box(name=f"p{i}", length_mm=200, width_mm=200, height_mm=100,
+            color_hex="#111111", pos_x_mm=i * 250, pos_y_mm=100)
+        for i in range(4)
+    ]
+    collide = make_collider(placed, container)
+    probes = [
+        Box(name="inside", length_mm=100, width_mm=100, height_mm=100,
+            color_hex="#222222", pos_x_mm=150, pos_y_mm=150),
+        Box(name="free", length_mm=100, width_mm=100, height_mm=100,
+            color_hex="#222222", pos_x_mm=0, pos_y_mm=600),
+        Box(name="out", length_mm=300, width_mm=100, height_mm=100,
+            color_hex="#222222", pos_x_mm=800, pos_y_mm=150),
+        _make_stack(800, 3),
+    ]
+    for probe in probes:
+        ok, hits = collide(probe)
+        ok_ref, hits_ref = check_collisions(probe, placed, container)
+        assert ok == ok_ref
+        assert [id(h) for h in hits] == [id(h) for h in hits_ref]
+
+
+def test_make_collider_keeps_placed_order(container):
+    # *placed* absichtlich nicht nach x_min sortiert
+    placed = [
+        Box(name=f"p{i}", length_mm=200, width_mm=200, height_mm=100,
+            color_hex="#111111", pos_x_mm=x, pos_y_mm=100)
+        for i, x in enumerate((500, 250, 0))
+    ]
+    probe = Box(name="wide", length_mm=600, width_mm=100, height_mm=100,
+                color_hex="#222222", pos_x_mm=100, pos_y_mm=150)
+    _, hits = make_collider(placed, container)(probe)
+    _, hits_ref = check_collisions(probe, placed, container)
+    assert [h.name for h in hits] == [h.name for h in hits_ref] == ["p0", "p1", "p2"]
@@ -1,4 +1,5 @@
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List
@@ -9,10 +10,11 @@ from container_tool.core import io_clp
 from container_tool.core.io_clp import (
     ClpFormatError,
     ContainerNotFoundError,
+    FileLockedError,
     load_clp,
     save_clp,
 )
-from container_tool.core.models import Box, Container, Project, Stack
+from container_tool.core.models import Box, Container, Project, ProjectMeta, Stack
 
 
 # ---------------------------------------------------------------------------
@@ -71,14 +73,9 @@ def sample_project(sample_container: Container) -> Project:
     )
     stack = Stack(name="Stack1", _boxes=[sb1, sb2])
 
-    # ProjectMeta ist im Original ein Dataclass – für save_clp genügt ein Dict
-    meta: Dict[str, str] = {
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "version": "1.0.0",
-        "user": "pytest",
-    }
+    meta = ProjectMeta(created_at=datetime.now(timezone.utc), version="1.0.0", user="pytest")
 
-    return Project(container=sample_container, boxes=[loose_box, stack], meta=meta)  # type: ignore[arg-type]
+    return Project(container=sample_container, boxes=[loose_box, stack], meta=meta)
 
 
 # ---------------------------------------------------------------------------
@@ -106,13 +103,14 @@ def test_round_trip_clp(tmp_path, monkeypatch, sample_project, sample_container)
     # Container-Daten
     assert loaded.container.to_dict() == sample_container.to_dict()
 
-    # Box-/Stack-Listen (Reihenfolge egal)
-    orig_boxes: List[Dict] = sorted(
-        (b.to_dict() for b in sample_project.boxes), key=lambda d: d["name"]
-    )
-    loaded_boxes: List[Dict] = sorted(
-        (b.to_dict() for b in loaded.boxes), key=lambda d: d["name"]
-    )
+    # Box-/Stack-Listen (Reihenfolge egal; Namen sind eindeutig)
+    orig_boxes: Dict[str, Dict] = {
+        d["name"]: d for d in (b.to_dict() for b in sample_project.boxes)
+    }
+    loaded_boxes: Dict[str, Dict] = {
+        d["name"]: d for d in (b.to_dict() for b in loaded.boxes)
+    }
+    assert len(loaded_boxes) == len(loaded.boxes)
     assert loaded_boxes == orig_boxes
 
     # Meta-Infos
@@ -120,6 +118,73 @@ def test_round_trip_clp(tmp_path, monkeypatch, sample_project, sample_container)
     assert loaded.meta.user == "pytest"
 
 
+def test_save_default_project(tmp_path, monkeypatch, sample_container):
+    """Projekt ohne explizite Meta (wie aus der GUI) lässt sich speichern und laden."""
+    monkeypatch.setattr(
+        io_clp,
+        "load_containers_definitions",
+        lambda path=None: {sample_container.id: sample_container},
+    )
+    box = Box(name="Solo", length_mm=100, width_mm=50, height_mm=30, pos_x_mm=0)
+    project = Project(container=sample_container, boxes=[box])
+
+    target = tmp_path / "default.clp"
+    save_clp(project, target, user="gui", version="1.2.3")
+    loaded = load_clp(target)
+
+    assert loaded.meta.user == "gui"
+    assert loaded.meta.version == "1.2.3"
+    assert loaded.meta.created_at.tzinfo is not None
+    assert [b.to_dict() for b in loaded.boxes] == [box.to_dict()]
+
+
+class _WriteCounter:
+    """Datei‑Proxy, der die write()-Aufrufe auf die Temp‑Datei zählt."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self.calls = 0
+
+    def write(self, data):
+        self.calls += 1
+        return self._fp.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fp, name)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_clp_single_write(tmp_path, monkeypatch, sample_project, use_orjson):
+    """save_clp schreibt das JSON mit genau einem write() (kein Token‑Streaming)."""
+    if not use_orjson:
+        monkeypatch.setattr(io_clp, "orjson", None)
+    elif io_clp.orjson is None:
+        pytest.skip("orjson nicht installiert")
+
+    counters: List[_WriteCounter] = []
+    real_atomic_write = io_clp._atomic_write
+
+    def _counting_atomic_write(writer, target):
+        def _wrapped(fp):
+            counters.append(_WriteCounter(fp))
+            writer(counters[-1])
+
+        real_atomic_write(_wrapped, target)
+
+    monkeypatch.setattr(io_clp, "_atomic_write", _counting_atomic_write)
+
+    # deutlich größer als ein Schreibpuffer (8 KiB), sonst fiele Chunking nicht auf
+    sample_project.boxes.extend(
+        Box(name=f"Fill{i}", length_mm=10, width_mm=10, height_mm=10, pos_x_mm=i)
+        for i in range(200)
+    )
+    target = tmp_path / "x.clp"
+    save_clp(sample_project, target, user="pytest", version="1.0.0")
+
+    assert [c.calls for c in counters] == [1]
+    assert json.loads(target.read_bytes())["meta"]["user"] == "pytest"
+
+
 def test_load_unknown_container_type(tmp_path, monkeypatch):
     """Ein unbekannter Container-Typ muss ContainerNotFoundError auslösen."""
     bad_data = {
@@ -141,7 +206,7 @@ def test_load_unknown_container_type(tmp_path, monkeypatch):
         },
     }
     bad_file = tmp_path / "bad.clp"
-    bad_file.write_text(json.dumps(bad_data), encoding="utf-8")
+    bad_file.write_bytes(json.dumps(bad_data).encode("utf-8"))
 
     # Leere Definitions-Liste ⇒ Container definitiv unbekannt
     monkeypatch.setattr(io_clp, "load_containers_definitions", lambda path=None: {})
@@ -153,12 +218,14 @@ def test_load_unknown_container_type(tmp_path, monkeypatch):
 def test_load_permission_error(tmp_path, monkeypatch):
     """Wenn die Datei nicht lesbar ist, muss PermissionError durchgereicht werden."""
     blocked = tmp_path / "blocked.clp"
-    blocked.write_text("{}", encoding="utf-8")
+    blocked.write_bytes(b"{}")
 
-    def _raise_perm(self, encoding="utf-8"):  # noqa: D401
+    def _raise_perm(self, *_args, **_kwargs):  # noqa: D401
         raise PermissionError("no access")
 
-    monkeypatch.setattr(Path, "read_text", _raise_perm)
+    # read_bytes: Pfad ohne orjson; open: Memory‑Map‑Pfad mit orjson
+    monkeypatch.setattr(Path, "read_bytes", _raise_perm)
+    monkeypatch.setattr(Path, "open", _raise_perm)
 
     with pytest.raises(PermissionError):
         load_clp(blocked)
@@ -167,7 +234,128 @@ def test_load_permission_error(tmp_path, monkeypatch):
 def test_load_invalid_json(tmp_path):
     """Ungültiges JSON → ClpFormatError."""
     invalid = tmp_path / "invalid.clp"
-    invalid.write_text("{ not valid json ", encoding="utf-8")
+    invalid.write_bytes(b"{ not valid json ")
 
     with pytest.raises(ClpFormatError):
         load_clp(invalid)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_clp_reads_bytes(tmp_path, monkeypatch, use_orjson):
+    """load_clp parst UTF‑8‑Bytes direkt – ohne Text‑Dekodierung per read_text."""
+    if not use_orjson:
+        monkeypatch.setattr(io_clp, "orjson", None)
+    elif io_clp.orjson is None:
+        pytest.skip("orjson nicht installiert")
+
+    calls: List[str] = []
+    real_read_bytes = Path.read_bytes
+
+    def _spy_read_bytes(self):
+        calls.append("read_bytes")
+        return real_read_bytes(self)
+
+    def _no_read_text(self, *_args, **_kwargs):
+        raise AssertionError("load_clp darf nicht read_text() verwenden")
+
+    monkeypatch.setattr(Path, "read_bytes", _spy_read_bytes)
+    monkeypatch.setattr(Path, "read_text", _no_read_text)
+
+    invalid = tmp_path / "invalid.clp"
+    invalid.write_bytes("{ \"name\": \"Kiste ä\" ".encode("utf-8"))
+    with pytest.raises(ClpFormatError):
+        load_clp(invalid)
+
+    # mit orjson liest load_clp über das offene Datei‑Handle, sonst per read_bytes()
+    assert calls == ([] if use_orjson else ["read_bytes"])
+
+
+def test_load_clp_mmap_for_large_files(tmp_path, monkeypatch):
+    """Große .clp‑Dateien liest load_clp per Memory‑Map, kleine per read()."""
+    if io_clp.orjson is None:
+        pytest.skip("orjson nicht installiert")
+
+    mapped: List[int] = []
+    real_mmap = io_clp.mmap.mmap
+
+    def _spy_mmap(fileno, length, *args, **kwargs):
+        mapped.append(fileno)
+        return real_mmap(fileno, length, *args, **kwargs)
+
+    monkeypatch.setattr(io_clp.mmap, "mmap", _spy_mmap)
+
+    # gültiges JSON, aber ungültige Meta ⇒ ClpFormatError erst *nach* dem Parsen
+    payload = b'{"meta": {}, "boxes": []}'
+    small = tmp_path / "small.clp"
+    small.write_bytes(payload)
+    large = tmp_path / "large.clp"
+    large.write_bytes(payload + b" " * io_clp._MMAP_MIN_BYTES)
+
+    with pytest.raises(ClpFormatError, match="SemVer"):
+        load_clp(small)
+    assert mapped == []
+
+    with pytest.raises(ClpFormatError, match="SemVer"):
+        load_clp(large)
+    assert len(mapped) == 1
+
+
+@pytest.mark.parametrize(
+    "version, valid",
+    [
+        ("1.0.0", True),
+        ("0.10.3", True),
+        ("1.0.0-rc.1", True),     # Prä-Release → Regex-Pfad
+        ("1.0.0+build.7", True),  # Build-Meta → Regex-Pfad
+        ("01.0.0", False),        # führende Null
+        ("1.0", False),
+        ("1.0.0.0", False),
+        ("1.².0", False),         # Unicode-Ziffer, aber keine Dezimalstelle
+        ("", False),
+    ],
+)
+def test_validate_semver(version, valid):
+    """Schneller X.Y.Z-Pfad und Regex liefern dasselbe Ergebnis."""
+    if valid:
+        io_clp._validate_semver(version)
+    else:
+        with pytest.raises(ClpFormatError):
+            io_clp._validate_semver(version)
+
+
+def test_container_definitions_reloaded_after_file_change(tmp_path):
+    """Cache hängt an der Änderungszeit – geänderte Datei wird neu gelesen."""
+    entry = {
+        "id": "c1",
+        "name": "C1",
+        "inner_length_mm": 1_000,
+        "inner_width_mm": 500,
+        "inner_height_mm": 400,
+        "door_height_mm": 350,
+    }
+    defs_file = tmp_path / "containers.json"
+    defs_file.write_text(json.dumps([entry]), encoding="utf-8")
+
+    first = io_clp.load_containers_definitions(defs_file)
+    assert io_clp.load_containers_definitions(defs_file) is first
+    # geteiltes Cache-Ergebnis ist schreibgeschützt
+    with pytest.raises(TypeError):
+        first["c9"] = first["c1"]  # type: ignore[index]
+
+    entry2 = dict(entry, id="c2", name="C2")
+    defs_file.write_text(json.dumps([entry, entry2]), encoding="utf-8")
+    st = defs_file.stat()
+    os.utime(defs_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert set(io_clp.load_containers_definitions(defs_file)) == {"c1", "c2"}
+
+
+def test_save_into_missing_or_non_directory_parent(tmp_path, sample_project):
+    """Fehlendes Zielverzeichnis → FileNotFoundError, Datei als 'Verzeichnis' → FileLockedError."""
+    with pytest.raises(FileNotFoundError):
+        save_clp(sample_project, tmp_path / "missing" / "p.clp", user="pytest", version="1.0.0")
+
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("x", encoding="utf-8")
+    with pytest.raises(FileLockedError):
+        save_clp(sample_project, not_a_dir / "p.clp", user="pytest", version="1.0.0")
@@ -4,30 +4,19 @@ Unit-Tests für die Datenmodelle in src/container_tool/core/models.py
 -------------------------------------------------------------------
 Läuft mit `pytest` innerhalb weniger Millisekunden.
 
-Hinweis: Die frühere Abhängigkeit von `pytest-lazy-fixture` wurde entfernt.
-Fixture-Namen werden jetzt als Strings parametrisiert und erst zur
-Laufzeit via `request.getfixturevalue()` aufgelöst.
+Hinweis: Die frühere Abhängigkeit von `pytest-lazy-fixture` wurde entfernt;
+Tests fordern ihre Fixtures direkt als Argument an.
 """
 from __future__ import annotations
 
-import pathlib
-import sys
+import math
+from dataclasses import replace
 from typing import List
 
 import pytest
 
-# --------------------------------------------------------------------------- #
-#  Quell-Pfad (src/) zu sys.path hinzufügen, falls nicht installiert
-# --------------------------------------------------------------------------- #
-PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
-SRC_PATH = PROJECT_ROOT / "src"
-if SRC_PATH.exists() and str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-# --------------------------------------------------------------------------- #
-#  Modelle importieren
-# --------------------------------------------------------------------------- #
-from container_tool.core.models import Box, Container, Project, Stack
+# src/ liegt per tests/conftest.py auf sys.path
+from container_tool.core.models import Box, Container, Project, Stack, ValidationError
 
 # --------------------------------------------------------------------------- #
 #  Fixtures
@@ -80,20 +69,18 @@ def box_90deg() -> Box:
 @pytest.fixture()
 def sample_stack() -> Stack:
     """Stapel aus drei identischen Boxen (je 5 kg)."""
-    boxes: List[Box] = [
-        Box(
-            name=f"StackBox_{i}",
-            length_mm=600,
-            width_mm=400,
-            height_mm=300,
-            weight_kg=5.0,
-            color_hex="#0000FF",
-            pos_x_mm=0,
-            pos_y_mm=0,
-            rot_deg=0,
-        )
-        for i in range(3)
-    ]
+    proto = Box(
+        name="StackBox_0",
+        length_mm=600,
+        width_mm=400,
+        height_mm=300,
+        weight_kg=5.0,
+        color_hex="#0000FF",
+        pos_x_mm=0,
+        pos_y_mm=0,
+        rot_deg=0,
+    )
+    boxes: List[Box] = [proto, *(replace(proto, name=f"StackBox_{i}") for i in range(1, 3))]
     return Stack(name="Stack_Test", _boxes=boxes)
 
 
@@ -133,22 +120,40 @@ def test_box_from_dict_missing_weight():
     assert box.weight_kg == 0.0
 
 
-@pytest.mark.parametrize(
-    "box_fixture_name, expected_bbox",
-    [
-        ("box_0deg", (100, 200, 1100, 1000)),  # x, y, x+L, y+B
-        ("box_90deg", (50, 75, 850, 1075)),    # x, y, x+B, y+L (Rot. 90°)
-    ],
-)
-def test_box_bbox(request: pytest.FixtureRequest, box_fixture_name: str, expected_bbox):
-    """
-    bbox() muss Länge/Breite abhängig von rot_deg korrekt berechnen.
+def test_box_bbox_0deg(box_0deg):
+    """bbox() ohne Rotation: x, y, x+L, y+B."""
+    assert box_0deg.bbox() == (100, 200, 1100, 1000)
+
+
+def test_box_bbox_90deg(box_90deg):
+    """bbox() bei 90°: Länge und Breite getauscht – x, y, x+B, y+L."""
+    assert box_90deg.bbox() == (50, 75, 850, 1075)
+
+
+def test_box_bbox_cache_invalidated_on_move_and_rotate(box_0deg):
+    """Gecachte bbox() folgt Positions- und Rotationsänderungen."""
+    assert box_0deg.bbox() == (100, 200, 1100, 1000)
+    box_0deg.pos_x_mm = 0
+    assert box_0deg.bbox() == (0, 200, 1000, 1000)
+    box_0deg.rotate()
+    assert box_0deg.bbox() == (0, 200, 800, 1200)
+
+
+def test_container_bounds_follow_inner_dimensions(sample_container):
+    """Vorberechnete (Länge, Breite) folgt Änderungen der Innenmaße."""
+    assert sample_container.bounds == (12_000, 2_300)
+    sample_container.inner_width_mm = 2_350
+    assert sample_container.bounds == (12_000, 2_350)
+    assert Container.from_dict(sample_container.to_dict()) == sample_container
 
-    Wir übergeben nur den Namen der Fixture als String und lösen sie
-    innerhalb der Testfunktion auf (kein externes Plug‑in nötig).
-    """
-    box: Box = request.getfixturevalue(box_fixture_name)
-    assert box.bbox() == expected_bbox
+
+def test_box_center_cache_invalidated_on_move(box_0deg):
+    """Gecachter center() folgt Positions- und Rotationsänderungen."""
+    assert box_0deg.center() == (600.0, 600.0)
+    box_0deg.pos_y_mm = 0
+    assert box_0deg.center() == (600.0, 400.0)
+    box_0deg.rotate()
+    assert box_0deg.center() == (500.0, 500.0)
 
 
 def test_stack_total_height(sample_stack):
@@ -167,8 +172,60 @@ def test_project_metrics(sample_project):
     )
     total_boxes = 1 + 1 + sample_project.boxes[2].box_count()
 
-    assert pytest.approx(sample_project.total_weight_kg(), rel=1e-9) == total_weight
+    assert math.isclose(sample_project.total_weight_kg(), total_weight, rel_tol=1e-9)
     assert (
         sum(item.box_count() if isinstance(item, Stack) else 1 for item in sample_project.boxes)
         == total_boxes
     )
+
+
+def test_models_are_slotted(box_0deg, sample_stack, sample_container):
+    """Box/Stack/Container ohne Instanz‑__dict__ (slots=True)."""
+    for obj in (box_0deg, sample_stack, sample_container):
+        assert hasattr(type(obj), "__slots__")
+        assert not hasattr(obj, "__dict__")
+
+
+def test_box_identity_semantics(sample_container):
+    """Boxen gleicher Grundfläche bleiben in Sets/Listen unterscheidbar."""
+    a = Box(name="a", length_mm=500, width_mm=400, height_mm=300, pos_x_mm=0)
+    b = Box(name="b", length_mm=500, width_mm=400, height_mm=300, pos_x_mm=900)
+    assert a.same_shape(b)
+    assert a != b
+    assert len({a, b}) == 2
+
+    project = Project(container=sample_container, boxes=[a, b])
+    project.remove(b)
+    assert project.boxes == [a]
+
+
+def test_box_bulk_from_raw_matches_from_dict(box_0deg, box_90deg):
+    """Massen-Konstruktion liefert dieselben Boxen und validiert weiterhin."""
+    raws = [box_0deg.to_dict(), box_90deg.to_dict(), {"name": "min", "length_mm": 1,
+                                                     "width_mm": 2, "height_mm": 3}]
+    bulk = Box._bulk_from_raw(raws)
+    assert [b.to_dict() for b in bulk] == [Box.from_dict(r).to_dict() for r in raws]
+    assert bulk[1].bbox() == box_90deg.bbox()
+
+    with pytest.raises(ValidationError):
+        Box._bulk_from_raw([dict(raws[0], rot_deg=45)])
+
+    # fehlendes Pflichtfeld: beide Wege melden ValidationError statt KeyError
+    incomplete = {k: v for k, v in raws[0].items() if k != "height_mm"}
+    with pytest.raises(ValidationError, match="height_mm"):
+        Box._bulk_from_raw([incomplete])
+    with pytest.raises(ValidationError, match="height_mm"):
+        Box.from_dict(incomplete)
+
+
+def test_stack_from_dict_builds_independent_boxes(sample_stack):
+    """Stack → dict → Stack; die kopierten Boxen sind eigenständige Objekte."""
+    data = sample_stack.to_dict()
+    restored = Stack.from_dict(data)
+    assert restored.to_dict() == data
+    boxes = list(restored)
+    assert [b.name for b in boxes] == [f"{data['name']}_{i + 1}" for i in range(data["count"])]
+    assert len({id(b) for b in boxes}) == len(boxes)
+    boxes[-1].rotate()
+    assert boxes[0].rot_deg == data["rot_deg"]
+    assert boxes[-1].bbox() != boxes[0].bbox()
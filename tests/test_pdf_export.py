@@ -0,0 +1,29 @@
+# tests/test_pdf_export.py
+"""
+Unit-Tests für die Hilfsfunktionen in src/container_tool/export/pdf_export.py
+-----------------------------------------------------------------------------
+ReportLab/Pillow werden erst beim Export importiert; die Tests kommen ohne aus.
+"""
+from __future__ import annotations
+
+# src/ liegt per tests/conftest.py auf sys.path
+from container_tool.core.models import Box, Stack
+from container_tool.export.pdf_export import _aggregate_boxes
+
+
+def _box(name: str, weight_kg: float = 5.0) -> Box:
+    return Box(name=name, length_mm=600, width_mm=400, height_mm=300, weight_kg=weight_kg)
+
+
+def test_aggregate_boxes_expands_stacks():
+    """Stacks zählen als ihre einzelnen Boxen (kein AttributeError auf weight_kg)."""
+    single = _box("Single")
+    stack = Stack(name="S", _boxes=[_box("Crate"), _box("Crate"), _box("Top", 2.5)])
+
+    rows = _aggregate_boxes([single, stack])
+
+    assert rows == [
+        ["Crate", 2, 600, 400, 300, 5.0],
+        ["Single", 1, 600, 400, 300, 5.0],
+        ["Top", 1, 600, 400, 300, 2.5],
+    ]
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from container_tool.core.models import Box, Container, Stack, GeometryError
@@ -24,18 +26,16 @@ def container() -> Container:
 @pytest.fixture()
 def base_boxes() -> list[Box]:
     """Drei identische Boxen (1 000 × 1 000 × 500 mm) auf gleicher Position."""
-    return [
-        Box(
-            name=f"Box{i}",
-            length_mm=1_000,
-            width_mm=1_000,
-            height_mm=500,
-            pos_x_mm=100,
-            pos_y_mm=200,
-            rot_deg=0,
-        )
-        for i in range(3)
-    ]
+    proto = Box(
+        name="Box0",
+        length_mm=1_000,
+        width_mm=1_000,
+        height_mm=500,
+        pos_x_mm=100,
+        pos_y_mm=200,
+        rot_deg=0,
+    )
+    return [proto, *(replace(proto, name=f"Box{i}") for i in range(1, 3))]
 
 
 # ---------------------------------------------------------------------------
@@ -106,3 +106,80 @@ def test_add_to_stack_extends_stack_and_counts(container, base_boxes):
     assert updated_stack is initial_stack                # gleicher Stapel-Ref
     assert updated_stack.box_count() == before_count + 1
     assert updated_stack.total_height_mm() == before_height + base_boxes[2].height_mm
+
+
+def test_stack_weight_tracks_appended_boxes(container, base_boxes):
+    for i, b in enumerate(base_boxes):
+        b.weight_kg = 10.0 + i
+    stack = create_stack(base_boxes[:2], container)
+    assert stack.total_weight_kg() == pytest.approx(21.0)
+    add_to_stack(stack, base_boxes[2], container)
+    assert stack.total_weight_kg() == pytest.approx(33.0)
+
+
+def test_create_stack_reports_first_incompatible_box(container, base_boxes):
+    base_boxes[2].pos_y_mm += 50           # dritte Box außerhalb der Snap-Toleranz
+    with pytest.raises(GeometryError, match="Box 3"):
+        create_stack(base_boxes, container)
+
+
+def test_batched_stack_check_matches_can_stack(container):
+    from container_tool.core.stack import _boxes_to_array, _can_stack_many
+
+    ref = Box(name="ref", length_mm=800, width_mm=600, height_mm=700, pos_x_mm=1_000, pos_y_mm=500)
+    cands = [
+        Box(name=f"c{i}", length_mm=l, width_mm=600, height_mm=h,
+            pos_x_mm=1_000 + dx, pos_y_mm=500 - dx, rot_deg=r)
+        for i, (l, h, dx, r) in enumerate(
+            (l, h, dx, r)
+            for l in (800, 700)
+            for h in (700, 1_600)
+            for dx in (0, 10, 11, -10, -11)
+            for r in (0, 90)
+        )
+    ]
+    geom = _boxes_to_array([ref, *cands])
+    mask = _can_stack_many(geom[0], geom[1:], container.door_height_mm, 10)
+    assert mask.tolist() == [can_stack(ref, c, container) for c in cands]
+
+
+# ---------------------------------------------------------------------------
+# find_stackable_groups
+# ---------------------------------------------------------------------------
+
+def _scattered_boxes(n: int) -> list[Box]:
+    return [
+        Box(
+            name=f"B{i}",
+            length_mm=600 + (i % 3) * 100,
+            width_mm=400,
+            height_mm=500 + (i % 4) * 400,
+            pos_x_mm=(i // 7) * 650 + (i % 5) * 4,
+            pos_y_mm=(i % 2) * 9,
+            rot_deg=90 if i % 11 == 0 else 0,
+        )
+        for i in range(n)
+    ]
+
+
+def test_find_stackable_groups_matches_pairwise_can_stack(container):
+    from container_tool.core.stack import find_stackable_groups
+
+    boxes = _scattered_boxes(60)
+    groups = find_stackable_groups(boxes, container)
+    grouped = {i for g in groups for i in g}
+    for g in groups:
+        # jede Box hängt an mindestens einer anderen ihrer Gruppe
+        for i in g:
+            assert any(can_stack(boxes[i], boxes[j], container) for j in g if j != i)
+    for i in set(range(len(boxes))) - grouped:
+        assert not any(can_stack(boxes[i], b, container) for b in boxes if b is not boxes[i])
+
+
+def test_find_stackable_groups_sweep_matches_dense(container, monkeypatch):
+    from container_tool.core import stack as stack_mod
+
+    boxes = _scattered_boxes(200)
+    dense = stack_mod.find_stackable_groups(boxes, container)
+    monkeypatch.setattr(stack_mod, "_DENSE_GROUP_LIMIT", 0)
+    assert stack_mod.find_stackable_groups(boxes, container) == dense